@@ -4,6 +4,7 @@ Dr. Manhattan: CCXT-style unified API for prediction markets
 
 from .base.errors import (
     AuthenticationError,
+    CircuitOpenError,
     DrManhattanError,
     ExchangeError,
     InsufficientFunds,
@@ -45,6 +46,7 @@ __all__ = [
     "DrManhattanError",
     "ExchangeError",
     "NetworkError",
+    "CircuitOpenError",
     "RateLimitError",
     "AuthenticationError",
     "InsufficientFunds",
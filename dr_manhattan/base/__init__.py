@@ -1,5 +1,6 @@
 from .errors import (
     AuthenticationError,
+    CircuitOpenError,
     DrManhattanError,
     ExchangeError,
     InsufficientFunds,
@@ -33,6 +34,7 @@ __all__ = [
     "DrManhattanError",
     "ExchangeError",
     "NetworkError",
+    "CircuitOpenError",
     "RateLimitError",
     "AuthenticationError",
     "InsufficientFunds",
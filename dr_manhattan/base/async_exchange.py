@@ -0,0 +1,276 @@
+"""Async counterparts of the Exchange API."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Iterable, Optional, TypeVar
+
+import aiohttp
+
+from ..base.errors import (
+    AuthenticationError,
+    CircuitOpenError,
+    ExchangeError,
+    NetworkError,
+    RateLimitError,
+)
+from ..models.market import Market
+from ..models.order import Order, OrderSide, OrderTimeInForce
+from ..models.position import Position
+from ..runtime.rate_limit import MARKET_DATA
+from ..runtime.retry import parse_retry_after
+
+if TYPE_CHECKING:
+    from ..runtime.rate_limit import RateLimiter
+
+T = TypeVar("T")
+
+ASYNC_POOL_SIZE = 100  # Concurrent keep-alive connections per host
+
+
+class AsyncExchange:
+    """
+    Async methods mixed into every Exchange.
+
+    Each async_* method defaults to running its synchronous counterpart in a
+    worker thread, so every exchange supports the async API. Exchanges
+    override them with native implementations on the pooled aiohttp session
+    from `_get_async_session()`, which lets one event loop fan out hundreds of
+    concurrent requests without threads.
+
+    Example:
+        async with Polymarket() as exchange:
+            books = await exchange.async_get_orderbooks(token_ids)
+    """
+
+    _async_session: Optional[aiohttp.ClientSession] = None
+    _async_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    if TYPE_CHECKING:
+        # Provided by Exchange, the only class this is mixed into
+        config: Dict[str, Any]
+        timeout: float
+        verbose: bool
+        rate_limiter: RateLimiter
+
+        def _before_attempt(self, endpoint: str) -> None: ...
+
+        def _after_success(self, endpoint: str) -> None: ...
+
+        def _after_failure(
+            self, endpoint: str, attempt: int, error: Exception
+        ) -> Optional[float]: ...
+
+        def fetch_markets(self, params: Optional[Dict[str, Any]] = None) -> list[Market]: ...
+
+        def fetch_market(self, market_id: str) -> Market: ...
+
+        def fetch_markets_by_slug(self, slug_or_url: str) -> list[Market]: ...
+
+        # Not part of the abstract Exchange API; signatures vary per exchange
+        get_orderbook: Callable[..., Dict[str, Any]]
+
+        def create_order(
+            self,
+            market_id: str,
+            outcome: str,
+            side: OrderSide,
+            price: float,
+            size: float,
+            params: Optional[Dict[str, Any]] = None,
+            time_in_force: OrderTimeInForce = OrderTimeInForce.GTC,
+        ) -> Order: ...
+
+        def cancel_order(self, order_id: str, market_id: Optional[str] = None) -> Order: ...
+
+        def fetch_order(self, order_id: str, market_id: Optional[str] = None) -> Order: ...
+
+        def fetch_open_orders(
+            self, market_id: Optional[str] = None, params: Optional[Dict[str, Any]] = None
+        ) -> list[Order]: ...
+
+        def fetch_positions(
+            self, market_id: Optional[str] = None, params: Optional[Dict[str, Any]] = None
+        ) -> list[Position]: ...
+
+        def fetch_balance(self) -> Dict[str, float]: ...
+
+    async def _get_async_session(self) -> aiohttp.ClientSession:
+        """Pooled aiohttp session for the running event loop (created on first use)."""
+        session = self._async_session
+        loop = asyncio.get_running_loop()
+        if session is None or session.closed or self._async_session_loop is not loop:
+            if session is not None and not session.closed:
+                await self._close_stale_session(session, self._async_session_loop)
+            connector = aiohttp.TCPConnector(
+                limit=0,
+                limit_per_host=self.config.get("async_pool_size", ASYNC_POOL_SIZE),
+                keepalive_timeout=60,
+            )
+            session = aiohttp.ClientSession(
+                connector=connector, timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+            self._async_session = session
+            self._async_session_loop = loop
+        return session
+
+    @staticmethod
+    async def _close_stale_session(
+        session: aiohttp.ClientSession, loop: Optional[asyncio.AbstractEventLoop]
+    ) -> None:
+        """Close a session created on another event loop so its connector is released."""
+        if loop is not None and loop.is_running():
+            # Still running in another thread: close it there
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+            return
+        with contextlib.suppress(Exception):
+            await session.close()
+
+    async def aclose(self) -> None:
+        """Close the async HTTP session"""
+        session = self._async_session
+        self._async_session = None
+        if session is not None and not session.closed:
+            await session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def _async_check_rate_limit(self, endpoint: str = MARKET_DATA) -> None:
+        """Async version of _check_rate_limit; spends from the same budgets"""
+        delay = self.rate_limiter.reserve(endpoint)
+        if delay > 0:
+            if self.verbose:
+                print(f"Rate limit reached ({endpoint}), sleeping for {delay:.2f}s")
+            await asyncio.sleep(delay)
+
+    async def _async_retry_on_failure(
+        self, func: Callable[[], Awaitable[T]], endpoint: str = MARKET_DATA
+    ) -> T:
+        """Async _retry_on_failure: same rate limiting, backoff and circuit breaker"""
+        attempt = 0
+        while True:
+            self._before_attempt(endpoint)
+            try:
+                await self._async_check_rate_limit(endpoint)
+                result = await func()
+            except CircuitOpenError:
+                raise
+            except (NetworkError, RateLimitError) as e:
+                delay = self._after_failure(endpoint, attempt, e)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+            except Exception:
+                self._after_success(endpoint)
+                raise
+            else:
+                self._after_success(endpoint)
+                return result
+
+    async def _async_request_json(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """
+        One HTTP request on the async session, decoded as JSON.
+
+        Raises the same errors as the synchronous _request helpers:
+        RateLimitError (429, with retry_after), AuthenticationError (401/403),
+        ExchangeError (404 and other 4xx) and NetworkError (5xx, timeouts,
+        connection failures). No retries; wrap in _async_retry_on_failure for those.
+        """
+        session = await self._get_async_session()
+        if params:
+            # aiohttp only accepts str/int/float query values
+            params = {
+                key: str(value).lower() if isinstance(value, bool) else value
+                for key, value in params.items()
+                if value is not None
+            }
+        try:
+            async with session.request(
+                method, url, params=params, json=json, headers=headers
+            ) as response:
+                if response.status == 429:
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                    raise RateLimitError(
+                        f"Rate limited. Retry after {retry_after}s", retry_after=retry_after
+                    )
+                if response.status in (401, 403):
+                    raise AuthenticationError(f"Authentication failed: HTTP {response.status}")
+                if response.status == 404:
+                    raise ExchangeError(f"Resource not found: {url}")
+                if response.status >= 500:
+                    raise NetworkError(f"Server error: {response.status} for {url}")
+                if response.status >= 400:
+                    raise ExchangeError(f"HTTP error: {response.status} for {url}")
+                return await response.json(content_type=None)
+        except asyncio.TimeoutError as e:
+            raise NetworkError(f"Request timeout: {e}") from e
+        except aiohttp.ClientConnectionError as e:
+            raise NetworkError(f"Connection error: {e}") from e
+        except aiohttp.ClientError as e:
+            raise ExchangeError(f"Request failed: {e}") from e
+
+    # Async API. Defaults run the synchronous method in a worker thread.
+
+    async def async_fetch_markets(self, params: Optional[Dict[str, Any]] = None) -> list[Market]:
+        return await asyncio.to_thread(self.fetch_markets, params)
+
+    async def async_fetch_market(self, market_id: str) -> Market:
+        return await asyncio.to_thread(self.fetch_market, market_id)
+
+    async def async_fetch_markets_by_slug(self, slug_or_url: str) -> list[Market]:
+        return await asyncio.to_thread(self.fetch_markets_by_slug, slug_or_url)
+
+    async def async_get_orderbook(self, token_id: str) -> Dict[str, Any]:
+        return await asyncio.to_thread(self.get_orderbook, token_id)
+
+    async def async_get_orderbooks(self, token_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch many orderbooks concurrently, keyed by token ID"""
+        token_ids = list(dict.fromkeys(token_ids))
+        books = await asyncio.gather(*(self.async_get_orderbook(t) for t in token_ids))
+        return dict(zip(token_ids, books))
+
+    async def async_create_order(
+        self,
+        market_id: str,
+        outcome: str,
+        side: OrderSide,
+        price: float,
+        size: float,
+        params: Optional[Dict[str, Any]] = None,
+        time_in_force: OrderTimeInForce = OrderTimeInForce.GTC,
+    ) -> Order:
+        return await asyncio.to_thread(
+            self.create_order, market_id, outcome, side, price, size, params, time_in_force
+        )
+
+    async def async_cancel_order(self, order_id: str, market_id: Optional[str] = None) -> Order:
+        return await asyncio.to_thread(self.cancel_order, order_id, market_id)
+
+    async def async_fetch_order(self, order_id: str, market_id: Optional[str] = None) -> Order:
+        return await asyncio.to_thread(self.fetch_order, order_id, market_id)
+
+    async def async_fetch_open_orders(
+        self, market_id: Optional[str] = None, params: Optional[Dict[str, Any]] = None
+    ) -> list[Order]:
+        return await asyncio.to_thread(self.fetch_open_orders, market_id, params)
+
+    async def async_fetch_positions(
+        self, market_id: Optional[str] = None, params: Optional[Dict[str, Any]] = None
+    ) -> list[Position]:
+        return await asyncio.to_thread(self.fetch_positions, market_id, params)
+
+    async def async_fetch_balance(self) -> Dict[str, float]:
+        return await asyncio.to_thread(self.fetch_balance)
@@ -1,3 +1,6 @@
+from typing import Optional
+
+
 class DrManhattanError(Exception):
     """Base exception for all dr-manhattan errors"""
 
@@ -16,10 +19,18 @@ class NetworkError(DrManhattanError):
     pass
 
 
+class CircuitOpenError(NetworkError):
+    """Request rejected without being sent: the endpoint's circuit breaker is open"""
+
+    pass
+
+
 class RateLimitError(DrManhattanError):
     """Rate limit exceeded"""
 
-    pass
+    def __init__(self, message: str = "", retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after  # Server-requested delay in seconds, if any
 
 
 class AuthenticationError(DrManhattanError):
@@ -1,3 +1,5 @@
+import hashlib
+import inspect
 import random
 import re
 import time
@@ -6,19 +8,114 @@ from datetime import datetime, timedelta
 from functools import wraps
 from typing import Any, Dict, Optional
 
-from ..base.errors import NetworkError, RateLimitError
+import requests
+from requests.adapters import HTTPAdapter
+
+from ..base.errors import CircuitOpenError, MarketNotFound, NetworkError, RateLimitError
 from ..models.crypto_hourly import CryptoHourlyMarket
 from ..models.market import Market
 from ..models.order import Order, OrderSide, OrderTimeInForce
 from ..models.position import Position
+from ..runtime.market_cache import MarketMetadataCache
+from ..runtime.rate_limit import (
+    ACCOUNT,
+    ENDPOINT_CLASSES,
+    MARKET_DATA,
+    ORDERS,
+    RateLimiter,
+    shared_rate_limiter,
+)
+from ..runtime.retry import CircuitBreaker, RetryPolicy
+from ..runtime.single_flight import SingleFlight, shared_single_flight
+from .async_exchange import AsyncExchange
+
+HTTP_POOL_CONNECTIONS = 10  # Hosts with a cached connection pool
+HTTP_POOL_MAXSIZE = 32  # Keep-alive connections kept per host
+
+# Config keys that identify an account; instances sharing them share a rate limiter
+CREDENTIAL_CONFIG_KEYS = (
+    "api_key",
+    "api_key_id",
+    "private_key",
+    "private_key_pem",
+    "private_key_path",
+    "funder",
+)
+
+# Reads coalesced by SingleFlight: concurrent identical calls share one request
+COALESCED_METHODS = (
+    "fetch_market",
+    "get_orderbook",
+    "fetch_balance",
+    "async_fetch_market",
+    "async_get_orderbook",
+    "async_fetch_balance",
+)
+
+
+def _flight_key(name: str, args: tuple, kwargs: dict) -> Optional[tuple]:
+    """Key for a coalesced call, or None if the arguments are not hashable"""
+    args = tuple(("market", arg.id) if isinstance(arg, Market) else arg for arg in args)
+    key = (name, args, tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _coalesced(method):
+    """Wrap an exchange read so identical in-flight calls share one execution"""
+    # Keyed by implementation, so an override calling super() is its own flight
+    name = method.__qualname__
+    if inspect.iscoroutinefunction(method):
+
+        @wraps(method)
+        async def async_wrapper(self, *args, **kwargs):
+            flight = getattr(self, "single_flight", None)
+            key = _flight_key(name, args, kwargs) if flight is not None else None
+            if key is None:
+                return await method(self, *args, **kwargs)
+            return await flight.do_async(key, method, self, *args, **kwargs)
 
+        async_wrapper.__single_flight__ = True
+        return async_wrapper
 
-class Exchange(ABC):
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        flight = getattr(self, "single_flight", None)
+        key = _flight_key(name, args, kwargs) if flight is not None else None
+        if key is None:
+            return method(self, *args, **kwargs)
+        return flight.do(key, method, self, *args, **kwargs)
+
+    wrapper.__single_flight__ = True
+    return wrapper
+
+
+class Exchange(AsyncExchange, ABC):
     """
     Base class for all prediction market exchanges.
     Follows CCXT-style unified API pattern.
+
+    Every method also has an async_* counterpart (see AsyncExchange).
+
+    Subclass implementations of COALESCED_METHODS are wrapped so that
+    concurrent identical calls share one in-flight request.
     """
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name in COALESCED_METHODS:
+            method = getattr(cls, name, None)
+            if (
+                method is None
+                or getattr(method, "__single_flight__", False)
+                or getattr(method, "__isabstractmethod__", False)
+            ):
+                continue
+            setattr(cls, name, _coalesced(method))
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize exchange with optional configuration.
@@ -32,10 +129,18 @@ class Exchange(ABC):
         self.timeout = self.config.get("timeout", 30)
         self.verbose = self.config.get("verbose", False)
 
-        # Rate limiting
+        # Rate limiting: token buckets per endpoint class (market_data, orders,
+        # account), each defaulting to rate_limit requests per second
         self.rate_limit = self.config.get("rate_limit", 10)  # requests per second
         self.last_request_time = 0
-        self.request_times: list[float] = []  # For sliding window rate limiting
+        self.rate_limiter = self._create_rate_limiter()
+
+        # Request coalescing: concurrent identical reads (COALESCED_METHODS)
+        # share one request; shared like the rate limiter
+        self.single_flight: Optional[SingleFlight] = None
+        if self.config.get("coalesce_requests", True):
+            key = self._credential_key()
+            self.single_flight = shared_single_flight(key) if key else SingleFlight()
 
         # Retry configuration
         self.max_retries = self.config.get("max_retries", 3)
@@ -43,6 +148,112 @@ class Exchange(ABC):
         self.retry_backoff = self.config.get(
             "retry_backoff", 2.0
         )  # Multiplier for exponential backoff
+        self.retry_policy = RetryPolicy(
+            max_retries=self.max_retries,
+            base_delay=self.retry_delay,
+            backoff=self.retry_backoff,
+            max_delay=self.config.get("retry_max_delay", 30.0),  # Longest sleep before giving up
+        )
+
+        # Circuit breakers per endpoint class: fail fast after repeated network errors
+        self.circuit_failure_threshold = self.config.get("circuit_failure_threshold", 5)
+        self.circuit_reset_timeout = self.config.get("circuit_reset_timeout", 30.0)
+        self._circuit_breakers: Dict[str, CircuitBreaker] = {}
+
+        # Market metadata cache: identifier -> token IDs / outcomes / tick size,
+        # so ID resolution on the order path skips REST after the first lookup
+        self.market_cache = MarketMetadataCache(
+            maxsize=self.config.get("market_cache_size", 4096),
+            ttl=self.config.get("market_cache_ttl", 3600.0),  # seconds
+            path=self.config.get("market_cache_path"),  # SQLite file, persisted on close()
+        )
+
+        # Connection pooling: one keep-alive session per exchange, so REST calls
+        # reuse TCP+TLS connections instead of handshaking on every request
+        self.http_pool_connections = self.config.get("http_pool_connections", HTTP_POOL_CONNECTIONS)
+        self.http_pool_maxsize = self.config.get("http_pool_maxsize", HTTP_POOL_MAXSIZE)
+        self._session = self._create_session()
+
+    def _create_session(self) -> requests.Session:
+        """
+        Create the pooled HTTP session used for this exchange's REST calls.
+
+        Retries stay in _retry_on_failure, so the adapter itself never retries.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.http_pool_connections,
+            pool_maxsize=self.http_pool_maxsize,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def _create_rate_limiter(self) -> RateLimiter:
+        """
+        Build the per-endpoint-class limiter from rate_limit and rate_limits.
+
+        Instances configured with the same credentials on the same exchange
+        share one limiter; instances without credentials get their own.
+        """
+        budgets = {endpoint: self.rate_limit for endpoint in ENDPOINT_CLASSES}
+        budgets.update(self.config.get("rate_limits") or {})
+        key = self._credential_key()
+        if key is None:
+            return RateLimiter(budgets)
+        return shared_rate_limiter(key, budgets)
+
+    def _credential_key(self) -> Optional[tuple]:
+        """(exchange class, credential hash) for sharing per-account state, or None"""
+        credentials = sorted(
+            (key, str(self.config[key])) for key in CREDENTIAL_CONFIG_KEYS if self.config.get(key)
+        )
+        if not credentials:
+            return None
+        fingerprint = hashlib.sha256(repr(credentials).encode()).hexdigest()
+        return (type(self).__name__, fingerprint)
+
+    @staticmethod
+    def _endpoint_class(method: str, path: str) -> str:
+        """Classify a REST call into a rate limit budget (market_data/orders/account)"""
+        path = path.lower()
+        if "orderbook" in path or "/book" in path:
+            return MARKET_DATA
+        if "order" in path or (method.upper() in ("POST", "DELETE") and "auth" not in path):
+            return ORDERS
+        if any(part in path for part in ("portfolio", "balance", "position", "fills", "account")):
+            return ACCOUNT
+        return MARKET_DATA
+
+    @property
+    def session(self) -> requests.Session:
+        """Pooled keep-alive HTTP session shared by this exchange's REST calls"""
+        return self._session
+
+    def close(self) -> None:
+        """Close pooled HTTP connections and persist the market metadata cache"""
+        self._session.close()
+        self.market_cache.save()
+
+    def _ensure_market(self, market: Market | str) -> Market:
+        """Return a Market, fetching it (through the metadata cache) for an identifier"""
+        if isinstance(market, Market):
+            return market
+        cached = self.market_cache.market(market)
+        if cached is not None:
+            return cached
+        fetched = self.fetch_market(market)
+        if not fetched:
+            raise MarketNotFound(f"Market {market} not found")
+        self.market_cache.put_market(fetched, aliases=(market,))
+        return fetched
+
+    def _cached_token_ids(self, identifier: str) -> Optional[list[str]]:
+        """Token IDs for a market ID or alias from the metadata cache, if known"""
+        metadata = self.market_cache.get(identifier)
+        if metadata is None or not metadata.token_ids:
+            return None
+        return list(metadata.token_ids)
 
     @property
     @abstractmethod
@@ -391,51 +602,93 @@ class Exchange(ABC):
             },
         }
 
-    def _check_rate_limit(self):
-        """Check and enforce rate limiting"""
-        current_time = time.time()
+    def _check_rate_limit(self, endpoint: str = MARKET_DATA):
+        """Take one token from the endpoint class budget, sleeping if it is empty"""
+        delay = self.rate_limiter.reserve(endpoint)
+        if delay > 0:
+            if self.verbose:
+                print(f"Rate limit reached ({endpoint}), sleeping for {delay:.2f}s")
+            time.sleep(delay)
+
+    def _circuit_breaker(self, endpoint: str) -> CircuitBreaker:
+        breaker = self._circuit_breakers.get(endpoint)
+        if breaker is None:
+            breaker = self._circuit_breakers.setdefault(
+                endpoint,
+                CircuitBreaker(self.circuit_failure_threshold, self.circuit_reset_timeout),
+            )
+        return breaker
+
+    def _before_attempt(self, endpoint: str) -> None:
+        """Fail fast if the endpoint's circuit is open"""
+        breaker = self._circuit_breaker(endpoint)
+        if not breaker.allow():
+            raise CircuitOpenError(
+                f"{self.id} {endpoint} requests suspended after repeated failures; "
+                f"retry in {breaker.retry_in():.1f}s"
+            )
 
-        # Clean old requests (older than 1 second)
-        self.request_times = [t for t in self.request_times if current_time - t < 1.0]
+    def _after_success(self, endpoint: str) -> None:
+        self._circuit_breaker(endpoint).record_success()
+        self.rate_limiter.recover(endpoint)
+
+    def _after_failure(self, endpoint: str, attempt: int, error: Exception) -> Optional[float]:
+        """
+        Record a failed attempt; return the sleep before retrying, or None to give up.
 
-        # Check if we've exceeded the rate limit
-        if len(self.request_times) >= self.rate_limit:
-            sleep_time = 1.0 - (current_time - self.request_times[0])
-            if sleep_time > 0:
-                if self.verbose:
-                    print(f"Rate limit reached, sleeping for {sleep_time:.2f}s")
-                time.sleep(sleep_time)
+        A 429 slows the endpoint's rate limit budget and, with Retry-After,
+        holds it for that long, so the next attempt (and every other caller
+        on the budget) waits in _check_rate_limit rather than here. Network
+        errors count toward the circuit breaker.
+        """
+        if isinstance(error, RateLimitError):
+            retry_after = error.retry_after
+            if retry_after is not None:
+                retry_after = min(retry_after, self.retry_policy.max_delay)
+            self.rate_limiter.penalize(endpoint, retry_after)
+        else:
+            self._circuit_breaker(endpoint).record_failure()
+
+        delay = self.retry_policy.delay(attempt, error)
+        if delay is not None and self.verbose:
+            print(f"Attempt {attempt + 1} failed, retrying in {delay:.2f}s: {error}")
+        if delay is not None and isinstance(error, RateLimitError) and error.retry_after:
+            return 0.0
+        return delay
 
-        # Record this request
-        self.request_times.append(current_time)
+    def _retry_on_failure(self, func=None, *, endpoint: str = MARKET_DATA):
+        """
+        Decorator for retry logic with backoff, rate limiting and a circuit breaker.
 
-    def _retry_on_failure(self, func):
-        """Decorator for retry logic with exponential backoff"""
+        Each attempt spends from the `endpoint` rate limit budget:
+            @self._retry_on_failure(endpoint=ORDERS)
+        """
+        if func is None:
+            return lambda f: self._retry_on_failure(f, endpoint=endpoint)
 
         @wraps(func)
         def wrapper(*args, **kwargs):
-            last_exception = None
-
-            for attempt in range(self.max_retries + 1):
+            attempt = 0
+            while True:
+                self._before_attempt(endpoint)
                 try:
-                    self._check_rate_limit()
-                    return func(*args, **kwargs)
+                    self._check_rate_limit(endpoint)
+                    result = func(*args, **kwargs)
+                except CircuitOpenError:
+                    raise
                 except (NetworkError, RateLimitError) as e:
-                    last_exception = e
-                    if attempt < self.max_retries:
-                        delay = self.retry_delay * (self.retry_backoff**attempt) + random.uniform(
-                            0, 1
-                        )
-                        if self.verbose:
-                            print(f"Attempt {attempt + 1} failed, retrying in {delay:.2f}s: {e}")
-                        time.sleep(delay)
-                    else:
-                        raise last_exception
-                except Exception as e:
-                    # Don't retry on non-network errors
-                    raise e
-
-            raise last_exception
+                    delay = self._after_failure(endpoint, attempt, e)
+                    if delay is None:
+                        raise
+                    time.sleep(delay)
+                    attempt += 1
+                except Exception:
+                    # Don't retry on non-network errors; the endpoint did answer
+                    self._after_success(endpoint)
+                    raise
+                else:
+                    self._after_success(endpoint)
+                    return result
 
         return wrapper
 
@@ -8,17 +8,19 @@ Exchange is regarded as stateless; ExchangeClient maintains client-specific stat
 import asyncio
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from ..models.market import Market
 from ..models.nav import NAV, PositionBreakdown
 from ..models.order import Order, OrderSide
-from ..models.orderbook import Orderbook, OrderbookManager
+from ..models.orderbook import Orderbook, OrderbookManager, TopOfBook
 from ..models.position import Position
+from ..runtime.event_loop import get_runtime
 from ..utils import setup_logger
 from .order_tracker import OrderCallback, OrderTracker, create_fill_logger
+from .websocket import top_of_book_callback
 
 logger = setup_logger(__name__)
 
@@ -154,7 +156,7 @@ class ExchangeClient:
         # Market data WebSocket for orderbook
         self._market_ws: Optional[Any] = None
         self._orderbook_manager: Optional[OrderbookManager] = None
-        self._ws_thread: Optional[threading.Thread] = None
+        self._ws_future: Optional[Future] = None
 
         # Polling fallback for exchanges without WebSocket
         self._polling_thread: Optional[threading.Thread] = None
@@ -377,16 +379,16 @@ class ExchangeClient:
                     f"Initial orderbook fetch took {fetch_duration:.2f}s for {len(token_ids)} tokens"
                 )
 
-            # Create event loop for WebSocket
-            if self._market_ws.loop is None:
-                self._market_ws.loop = asyncio.new_event_loop()
+            # Host the connection on the process-wide event loop
+            runtime = get_runtime()
+            self._market_ws.loop = runtime.loop
 
-            # Callback to update mid price cache on orderbook updates
-            def on_orderbook_update(market_id: str, orderbook: dict):
-                # Extract token_id from orderbook if available
-                token_id = orderbook.get("asset_id", "")
-                if token_id:
-                    self.update_mid_price_from_orderbook(token_id, orderbook)
+            # Callback to update mid price cache when the best bid/ask changes
+            def on_top_of_book(market_id: str, event: TopOfBook):
+                if event.asset_id and event.mid_price is not None and event.mid_price > 0:
+                    self.update_mid_price(event.asset_id, event.mid_price)
+
+            on_orderbook_update = top_of_book_callback(on_top_of_book)
 
             # Define coroutine that connects, subscribes, and runs receive loop
             async def run_websocket():
@@ -407,14 +409,7 @@ class ExchangeClient:
                         except Exception:
                             pass
 
-            # Run in background thread with proper event loop management
-            def run_loop():
-                asyncio.set_event_loop(self._market_ws.loop)
-                self._market_ws.loop.create_task(run_websocket())
-                self._market_ws.loop.run_forever()
-
-            self._ws_thread = threading.Thread(target=run_loop, daemon=False)
-            self._ws_thread.start()
+            self._ws_future = runtime.submit(run_websocket())
 
             logger.info("WebSocket orderbook connected")
             return True
@@ -448,6 +443,15 @@ class ExchangeClient:
             return None
         return None
 
+    def get_orderbook_manager(self) -> Optional[OrderbookManager]:
+        """
+        Get the live orderbook manager (WebSocket or polling), if set up.
+
+        Use it for depth queries such as get_vwap, get_price_impact and
+        get_imbalance without re-walking raw level lists.
+        """
+        return self._orderbook_manager
+
     def get_best_bid_ask(self, token_id: str) -> Tuple[Optional[float], Optional[float]]:
         """
         Get best bid and ask prices.
@@ -482,7 +486,8 @@ class ExchangeClient:
         if self._user_ws:
             self._user_ws.stop()
         if self._market_ws:
-            # Stop WebSocket and wait for disconnect to complete
+            # Stop WebSocket and wait for disconnect to complete. The loop is
+            # shared with other clients, so only this connection is torn down.
             if self._market_ws.loop:
                 try:
                     if self._market_ws.loop.is_running():
@@ -490,15 +495,18 @@ class ExchangeClient:
                             self._market_ws.disconnect(), self._market_ws.loop
                         )
                         future.result(timeout=3.0)
-                        self._market_ws.loop.call_soon_threadsafe(self._market_ws.loop.stop)
                 except (RuntimeError, TimeoutError) as e:
                     logger.debug(f"WebSocket disconnect: {e}")
         # Stop polling thread
         if self._polling_thread:
             self._polling_stop = True
             self._polling_thread.join(timeout=2.0)
-        if self._ws_thread:
-            self._ws_thread.join(timeout=3.0)
+        if self._ws_future:
+            try:
+                self._ws_future.result(timeout=3.0)
+            except Exception:
+                self._ws_future.cancel()
+            self._ws_future = None
 
     def get_balance(self) -> Dict[str, float]:
         """
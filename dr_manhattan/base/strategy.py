@@ -410,6 +410,23 @@ class Strategy(ABC):
         """
         return self.client.get_best_bid_ask(token_id)
 
+    def get_vwap(self, token_id: str, side: str, size: float) -> Optional[float]:
+        """
+        Get the average fill price for taking `size` from the live orderbook.
+
+        Args:
+            token_id: Token ID
+            side: "asks" to price a buy, "bids" to price a sell
+            size: Size to fill
+
+        Returns:
+            VWAP, or None if no live orderbook or not enough depth
+        """
+        manager = self.client.get_orderbook_manager()
+        if manager is None:
+            return None
+        return manager.get_vwap(token_id, side, size)
+
     def round_price(self, price: float) -> float:
         """Round price to tick size"""
         return round_to_tick_size(price, self.tick_size)
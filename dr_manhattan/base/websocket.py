@@ -10,6 +10,13 @@ from typing import Any, Callable, Dict, Optional
 import websockets
 import websockets.exceptions
 
+from ..models.orderbook import TopOfBook
+from ..runtime.async_worker import OverflowPolicy
+from ..runtime.dispatch import CoalescingDispatcher, DispatchStats
+from ..runtime.event_loop import EventLoopRuntime, get_runtime
+from ..runtime.latency import FeedLatency, FeedLatencyTracker
+from ..utils import json_codec
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,12 +28,68 @@ class WebSocketState(Enum):
     CLOSED = "closed"
 
 
+def top_of_book_callback(
+    callback: Callable, depth: int = 1, include_sizes: bool = False
+) -> Callable:
+    """
+    Wrap an orderbook callback so it fires only when the top levels change.
+
+    The wrapped callback receives (market_id, TopOfBook) instead of the full
+    orderbook dict, and is skipped while the best `depth` prices on both sides
+    are unchanged. Coroutine callbacks are supported.
+
+    Args:
+        callback: Function(market_id, TopOfBook)
+        depth: Number of levels per side that count as "top of book"
+        include_sizes: Also fire when only the size at a top level changes
+    """
+    last: Dict[str, TopOfBook] = {}
+
+    def _changed(market_id: str, orderbook: Dict[str, Any]) -> Optional[TopOfBook]:
+        event = TopOfBook.from_orderbook(orderbook, asset_id=market_id, depth=depth)
+        key = event.asset_id or market_id
+        previous = last.get(key)
+        if event.same_levels(previous) if include_sizes else event.same_prices(previous):
+            return None
+        last[key] = event
+        return event
+
+    if asyncio.iscoroutinefunction(callback):
+
+        async def async_wrapper(market_id: str, orderbook: Dict[str, Any]):
+            event = _changed(market_id, orderbook)
+            if event is not None:
+                await callback(market_id, event)
+
+        return async_wrapper
+
+    def wrapper(market_id: str, orderbook: Dict[str, Any]):
+        event = _changed(market_id, orderbook)
+        if event is not None:
+            callback(market_id, event)
+
+    return wrapper
+
+
 class OrderBookWebSocket(ABC):
     """
     Base WebSocket class for real-time orderbook updates.
     Interrupt-driven approach using asyncio and websockets.
+
+    Callbacks run inline on the receive loop by default. Set
+    config["dispatch_queue"] to run them from a CoalescingDispatcher instead, so
+    a slow callback sees only the latest config["dispatch_depth"] updates per
+    market rather than stalling the socket; config["dispatch_overflow"] selects
+    the OverflowPolicy. Metrics are exposed via dispatch_stats.
+
+    Per-asset latency (exchange timestamp to receive, parse, callback) is
+    recorded into histograms exposed via latency_stats; set
+    config["latency_stats"] to False to turn it off.
     """
 
+    # Frame decoder; subclasses can install a json_codec.typed_decoder for their schema
+    decode_message = staticmethod(json_codec.loads)
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.config = config or {}
         self.verbose = self.config.get("verbose", False)
@@ -52,12 +115,34 @@ class OrderBookWebSocket(ABC):
         self.subscriptions: Dict[str, Callable] = {}
 
         # Event loop
-        self.loop = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
         self.tasks: list[asyncio.Task] = []
 
         # Last activity tracking
         self.last_message_time: float = 0
 
+        # Feed latency histograms; _message_received_ns is the wall-clock
+        # receive time of the message currently being processed
+        self.latency: Optional[FeedLatencyTracker] = None
+        if self.config.get("latency_stats", True):
+            self.latency = FeedLatencyTracker()
+        self._message_received_ns = 0
+
+        # Optional dispatch stage: callbacks run off the receive loop from
+        # bounded per-market queues that keep only the latest updates
+        self.dispatcher = self._create_dispatcher()
+
+    def _create_dispatcher(self) -> Optional[CoalescingDispatcher]:
+        if not self.config.get("dispatch_queue", False):
+            return None
+        return CoalescingDispatcher(
+            depth=self.config.get("dispatch_depth", 1),
+            overflow_policy=OverflowPolicy(
+                self.config.get("dispatch_overflow", OverflowPolicy.DROP_OLDEST)
+            ),
+            verbose=self.verbose,
+        )
+
     @property
     @abstractmethod
     def ws_url(self) -> str:
@@ -120,6 +205,10 @@ class OrderBookWebSocket(ABC):
 
         self.state = WebSocketState.CONNECTING
 
+        if self.dispatcher is not None and self.dispatcher.closed:
+            # disconnect() closed the dispatch stage; start a fresh one
+            self.dispatcher = self._create_dispatcher()
+
         try:
             # Connect with ping/pong heartbeat
             self.ws = await websockets.connect(
@@ -143,8 +232,7 @@ class OrderBookWebSocket(ABC):
             await self._authenticate()
 
             # Resubscribe to all markets
-            for market_id in list(self.subscriptions.keys()):
-                await self._subscribe_orderbook(market_id)
+            await self._resubscribe_all()
 
         except Exception as e:
             self.state = WebSocketState.DISCONNECTED
@@ -152,6 +240,16 @@ class OrderBookWebSocket(ABC):
                 logger.debug(f"WebSocket connection failed: {e}")
             raise
 
+    async def _resubscribe_all(self):
+        """
+        Restore all subscriptions on a fresh connection.
+
+        Sends one subscription per market by default. Override when the venue
+        accepts a single batched subscription message.
+        """
+        for market_id in list(self.subscriptions.keys()):
+            await self._subscribe_orderbook(market_id)
+
     async def disconnect(self):
         """Close WebSocket connection"""
         self.state = WebSocketState.CLOSED
@@ -166,6 +264,9 @@ class OrderBookWebSocket(ABC):
             task.cancel()
         self.tasks.clear()
 
+        if self.dispatcher is not None:
+            await self.dispatcher.close()
+
         if self.verbose:
             logger.debug("WebSocket disconnected")
 
@@ -178,7 +279,8 @@ class OrderBookWebSocket(ABC):
         """
         try:
             # Update last message time
-            self.last_message_time = time.time()
+            self._message_received_ns = time.time_ns()
+            self.last_message_time = self._message_received_ns / 1_000_000_000
 
             # Skip non-JSON messages (like PONG heartbeats)
             if message in ("PONG", "PING", ""):
@@ -189,7 +291,7 @@ class OrderBookWebSocket(ABC):
                 msg_preview = message[:200] + "..." if len(message) > 200 else message
                 logger.debug(f"[WS] Received: {msg_preview}")
 
-            data = json.loads(message)
+            data = self.decode_message(message)
 
             # Handle messages that come as arrays
             if isinstance(data, list):
@@ -210,23 +312,56 @@ class OrderBookWebSocket(ABC):
         """Process a single message item"""
         try:
             # Parse orderbook data
+            parse_start = time.perf_counter_ns()
             orderbook = self._parse_orderbook_message(data)
             if not orderbook:
                 return
+            parse_ns = time.perf_counter_ns() - parse_start
 
             market_id = orderbook.get("market_id")
             if market_id in self.subscriptions:
-                callback = self.subscriptions[market_id]
-
-                # Call callback in a non-blocking way
-                if asyncio.iscoroutinefunction(callback):
-                    await callback(market_id, orderbook)
-                else:
-                    callback(market_id, orderbook)
+                await self._invoke_callback(
+                    self.subscriptions[market_id], market_id, orderbook, parse_ns
+                )
         except Exception as e:
             if self.verbose:
                 logger.debug(f"Error processing message item: {e}")
 
+    async def _invoke_callback(
+        self, callback: Callable, key: str, orderbook: Dict[str, Any], parse_ns: int = 0
+    ):
+        """Run a subscription callback inline, or hand it to the dispatch stage."""
+        latency = self.latency
+        if latency is not None:
+            latency.record_update(
+                key, orderbook.get("timestamp"), self._message_received_ns, parse_ns
+            )
+            callback_start = time.perf_counter_ns()
+
+        if self.dispatcher is not None:
+            await self.dispatcher.submit(key, callback, key, orderbook)
+        elif asyncio.iscoroutinefunction(callback):
+            await callback(key, orderbook)
+        else:
+            callback(key, orderbook)
+
+        if latency is not None:
+            latency.record_callback(key, time.perf_counter_ns() - callback_start)
+
+    @property
+    def latency_stats(self) -> Dict[str, FeedLatency]:
+        """Per-asset latency summaries (empty when latency_stats is disabled)."""
+        if self.latency is None:
+            return {}
+        return self.latency.snapshot()
+
+    @property
+    def dispatch_stats(self) -> DispatchStats:
+        """Queueing metrics for the dispatch stage (all zero when it is disabled)."""
+        if self.dispatcher is None:
+            return DispatchStats()
+        return self.dispatcher.stats
+
     async def _receive_loop(self):
         """Main loop for receiving WebSocket messages with improved error handling"""
         while self.state != WebSocketState.CLOSED:
@@ -336,6 +471,21 @@ class OrderBookWebSocket(ABC):
         if self.verbose:
             logger.debug(f"Subscribed to orderbook for market: {market_id}")
 
+    async def watch_top_of_book(self, market_id: str, callback: Callable, depth: int = 1):
+        """
+        Subscribe to top-of-book changes for a market.
+
+        Unlike watch_orderbook, the callback fires only when the best `depth`
+        levels change, and receives a compact TopOfBook event.
+
+        Args:
+            market_id: Market identifier
+            callback: Function to call with top-of-book changes
+                      Signature: callback(market_id: str, event: TopOfBook)
+            depth: Number of levels per side to watch (default: best bid/ask)
+        """
+        await self.watch_orderbook(market_id, top_of_book_callback(callback, depth))
+
     async def unwatch_orderbook(self, market_id: str):
         """
         Unsubscribe from orderbook updates.
@@ -356,25 +506,26 @@ class OrderBookWebSocket(ABC):
         if self.verbose:
             logger.debug(f"Unsubscribed from orderbook for market: {market_id}")
 
-    def start(self):
+    def start(self, runtime: Optional[EventLoopRuntime] = None) -> threading.Thread:
         """
         Start WebSocket connection and message loop.
-        Non-blocking - runs in background.
+        Non-blocking - runs on a shared background event loop.
+
+        Args:
+            runtime: Runtime hosting the connection (default: process-wide runtime)
+
+        Returns:
+            The runtime's loop thread
         """
-        if self.loop is None:
-            self.loop = asyncio.new_event_loop()
+        runtime = runtime or get_runtime()
+        self.loop = runtime.loop
 
         async def _start():
             await self.connect()
             await self._receive_loop()
 
-        def _run_loop():
-            asyncio.set_event_loop(self.loop)
-            self.loop.run_until_complete(_start())
-
-        thread = threading.Thread(target=_run_loop, daemon=True)
-        thread.start()
-        return thread
+        runtime.submit(_start())
+        return runtime.thread
 
     def stop(self):
         """Stop WebSocket connection"""
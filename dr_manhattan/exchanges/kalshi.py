@@ -24,6 +24,7 @@ from ..models.market import Market
 from ..models.order import Order, OrderSide, OrderStatus, OrderTimeInForce
 from ..models.orderbook import Orderbook
 from ..models.position import Position
+from ..runtime.retry import parse_retry_after
 
 BASE_URL = "https://api.elections.kalshi.com/trade-api/v2"
 DEMO_URL = "https://demo-api.kalshi.co/trade-api/v2"
@@ -143,6 +144,8 @@ class Kalshi(Exchange):
         body: Optional[Dict[str, Any]] = None,
         retry: bool = True,
     ) -> Any:
+        endpoint = self._endpoint_class(method, path)
+
         def _make_request():
             url = f"{self._api_url}{path}"
             headers = {
@@ -153,17 +156,19 @@ class Kalshi(Exchange):
 
             try:
                 if method.upper() in ("GET", "DELETE"):
-                    response = requests.request(
+                    response = self._session.request(
                         method, url, params=params, headers=headers, timeout=self.timeout
                     )
                 else:
-                    response = requests.request(
+                    response = self._session.request(
                         method, url, json=body, headers=headers, timeout=self.timeout
                     )
 
                 if response.status_code == 429:
-                    retry_after = int(response.headers.get("Retry-After", 1))
-                    raise RateLimitError(f"Rate limited. Retry after {retry_after}s")
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                    raise RateLimitError(
+                        f"Rate limited. Retry after {retry_after}s", retry_after=retry_after
+                    )
 
                 if response.status_code == 401 or response.status_code == 403:
                     msg = response.text or "Authentication failed"
@@ -185,13 +190,13 @@ class Kalshi(Exchange):
                 raise ExchangeError(f"Request failed: {e}") from e
 
         if retry:
-            return self._retry_on_failure(_make_request)()
+            return self._retry_on_failure(_make_request, endpoint=endpoint)()
 
         # Non-idempotent requests (order placement) must not auto-retry: a lost
         # response after the order has rested would resubmit and double the
         # position. Rate limiting normally runs inside the retry wrapper, so
         # enforce it explicitly on this path.
-        self._check_rate_limit()
+        self._check_rate_limit(endpoint)
         return _make_request()
 
     def _parse_market(self, data: Dict[str, Any]) -> Optional[Market]:
@@ -27,6 +27,7 @@ from ..base.exchange import Exchange
 from ..models.market import Market, parse_market_datetime
 from ..models.order import Order, OrderSide, OrderStatus, OrderTimeInForce
 from ..models.position import Position
+from ..runtime.retry import parse_retry_after
 from .limitless_ws import (
     LimitlessUserWebSocket,
     LimitlessWebSocket,
@@ -175,7 +176,6 @@ class Limitless(Exchange):
         self.host = self.config.get("host", self.BASE_URL)
         self.chain_id = self.config.get("chain_id", self.CHAIN_ID)
 
-        self._session = requests.Session()
         self._account = None
         self._address = None
         self._authenticated = False
@@ -282,7 +282,7 @@ class Limitless(Exchange):
         if require_auth:
             self._ensure_authenticated()
 
-        @self._retry_on_failure
+        @self._retry_on_failure(endpoint=self._endpoint_class(method, endpoint))
         def _make_request():
             url = f"{self.host}{endpoint}"
 
@@ -292,8 +292,10 @@ class Limitless(Exchange):
                 )
 
                 if response.status_code == 429:
-                    retry_after = int(response.headers.get("Retry-After", 1))
-                    raise RateLimitError(f"Rate limited. Retry after {retry_after}s")
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                    raise RateLimitError(
+                        f"Rate limited. Retry after {retry_after}s", retry_after=retry_after
+                    )
 
                 if response.status_code == 401 or response.status_code == 403:
                     # Try to re-authenticate
@@ -685,7 +687,10 @@ class Limitless(Exchange):
         Returns:
             List of token IDs [yes_token_id, no_token_id]
         """
-        market = self.fetch_market(market_id)
+        cached = self._cached_token_ids(market_id)
+        if cached:
+            return cached
+        market = self._ensure_market(market_id)
         token_ids = market.metadata.get("clobTokenIds", [])
         if token_ids:
             return token_ids
@@ -1581,15 +1586,6 @@ class Limitless(Exchange):
 
         return sorted(parsed, key=lambda item: item.timestamp)
 
-    def _ensure_market(self, market: Market | str) -> Market:
-        """Ensure we have a Market object."""
-        if isinstance(market, Market):
-            return market
-        fetched = self.fetch_market(market)
-        if not fetched:
-            raise MarketNotFound(f"Market {market} not found")
-        return fetched
-
     @staticmethod
     def _extract_token_ids(market: Market) -> List[str]:
         """Extract token IDs from market metadata."""
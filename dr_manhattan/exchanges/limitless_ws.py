@@ -6,6 +6,7 @@ Documentation: https://api.limitless.exchange/api-v1
 """
 
 import asyncio
+import concurrent.futures
 import logging
 import threading
 from dataclasses import dataclass
@@ -16,6 +17,7 @@ from typing import Any, Callable, Dict, List, Optional
 import socketio
 
 from ..models.orderbook import OrderbookManager
+from ..runtime.event_loop import EventLoopRuntime, get_runtime
 
 logger = logging.getLogger(__name__)
 
@@ -131,6 +133,7 @@ class LimitlessWebSocket:
         # Event loop (public for compatibility with exchange_client)
         self.loop: Optional[asyncio.AbstractEventLoop] = None
         self._thread: Optional[threading.Thread] = None
+        self._run_future: Optional[concurrent.futures.Future] = None
         self._ready = threading.Event()  # Signals when connection is ready
 
         # Orderbook manager for compatibility with exchange_client
@@ -467,40 +470,38 @@ class LimitlessWebSocket:
         self._error_callbacks.append(callback)
         return self
 
-    def start(self, timeout: float = 5.0) -> threading.Thread:
+    def start(
+        self, timeout: float = 5.0, runtime: Optional[EventLoopRuntime] = None
+    ) -> threading.Thread:
         """
-        Start WebSocket connection in background thread.
+        Start WebSocket connection on the shared background event loop.
 
         Args:
             timeout: Seconds to wait for connection to establish
+            runtime: Runtime hosting the connection (default: process-wide runtime)
 
         Returns:
-            Background thread running the WebSocket
+            The runtime's loop thread
 
         Raises:
             ConnectionError: If connection is not established within timeout
         """
-        self.loop = asyncio.new_event_loop()
+        runtime = runtime or get_runtime()
+        self.loop = runtime.loop
         self._ready.clear()
 
         async def _run():
-            await self.connect()
-            # Keep running until disconnected
-            while self.state != WebSocketState.CLOSED:
-                await asyncio.sleep(1)
-
-        def _thread_target():
-            asyncio.set_event_loop(self.loop)
             try:
-                self.loop.run_until_complete(_run())
+                await self.connect()
+                # Keep running until disconnected
+                while self.state != WebSocketState.CLOSED:
+                    await asyncio.sleep(1)
             except Exception as e:
                 if self.verbose:
-                    logger.error(f"WebSocket thread error: {e}")
-            finally:
-                self.loop.close()
+                    logger.error(f"WebSocket task error: {e}")
 
-        self._thread = threading.Thread(target=_thread_target, daemon=True)
-        self._thread.start()
+        self._run_future = runtime.submit(_run())
+        self._thread = runtime.thread
 
         # Wait for connection to be ready
         if not self._ready.wait(timeout=timeout):
@@ -588,8 +589,12 @@ class LimitlessWebSocket:
             except Exception:
                 pass  # Ignore timeout/errors during shutdown
 
-        if self._thread and self._thread.is_alive():
-            self._thread.join(timeout=timeout)
+        if self._run_future:
+            try:
+                self._run_future.result(timeout=timeout)
+            except Exception:
+                self._run_future.cancel()
+            self._run_future = None
 
     @property
     def connected(self) -> bool:
@@ -22,6 +22,7 @@ from ..base.exchange import Exchange
 from ..models.market import Market
 from ..models.order import Order, OrderSide, OrderStatus, OrderTimeInForce
 from ..models.position import Position
+from ..runtime.retry import parse_retry_after
 
 
 @dataclass
@@ -139,7 +140,7 @@ class Opinion(Exchange):
     def _request(self, method: str, endpoint: str, params: Optional[Dict] = None) -> Any:
         """Make HTTP request to Opinion API with retry logic"""
 
-        @self._retry_on_failure
+        @self._retry_on_failure(endpoint=self._endpoint_class(method, endpoint))
         def _make_request():
             url = f"{self.host}{endpoint}"
             headers = {}
@@ -149,13 +150,15 @@ class Opinion(Exchange):
                 headers["X-API-Key"] = self.api_key
 
             try:
-                response = requests.request(
+                response = self._session.request(
                     method, url, params=params, headers=headers, timeout=self.timeout
                 )
 
                 if response.status_code == 429:
-                    retry_after = int(response.headers.get("Retry-After", 1))
-                    raise RateLimitError(f"Rate limited. Retry after {retry_after}s")
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                    raise RateLimitError(
+                        f"Rate limited. Retry after {retry_after}s", retry_after=retry_after
+                    )
 
                 response.raise_for_status()
                 return response.json()
@@ -549,8 +552,11 @@ class Opinion(Exchange):
         Raises:
             ExchangeError: If token IDs cannot be fetched
         """
+        cached = self._cached_token_ids(market_id)
+        if cached:
+            return cached
         try:
-            market = self.fetch_market(market_id)
+            market = self._ensure_market(market_id)
             token_ids = market.metadata.get("clobTokenIds", [])
             if token_ids:
                 return token_ids
@@ -1154,15 +1160,6 @@ class Opinion(Exchange):
             raise ExchangeError(f"Failed to cancel all orders: {e}")
 
     # Helper methods (matching Polymarket)
-    def _ensure_market(self, market: Market | str) -> Market:
-        """Ensure we have a Market object"""
-        if isinstance(market, Market):
-            return market
-        fetched = self.fetch_market(market)
-        if not fetched:
-            raise MarketNotFound(f"Market {market} not found")
-        return fetched
-
     @staticmethod
     def _extract_token_ids(market: Market) -> List[str]:
         """Extract token IDs from market metadata"""
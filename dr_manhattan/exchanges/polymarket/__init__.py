@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from ...base.exchange import Exchange
+from .polymarket_async import PolymarketAsync
 from .polymarket_bridge import PolymarketBridge
 from .polymarket_clob import PolymarketCLOB
 from .polymarket_core import PolymarketCore
@@ -21,6 +22,7 @@ class Polymarket(
     PolymarketData,
     PolymarketCTF,
     PolymarketBridge,
+    PolymarketAsync,
     Exchange,
 ):
     """Polymarket exchange implementation - all APIs unified via mixins"""
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, Optional
+
+from ...base.errors import ExchangeError, MarketNotFound
+from ...models.market import Market
+
+
+class PolymarketAsync:
+    """Async API mixin: native aiohttp versions of the hot read paths.
+
+    Order placement, cancels and account calls go through py_clob_client,
+    which is synchronous, so they keep the thread-backed AsyncExchange
+    defaults.
+    """
+
+    async def _async_request(
+        self, method: str, endpoint: str, params: Optional[Dict] = None
+    ) -> Any:
+        """Async counterpart of _request (Gamma API, with retry logic)"""
+        headers = {"Authorization": f"Bearer {self.api_key}"} if self.api_key else None
+        return await self._async_retry_on_failure(
+            lambda: self._async_request_json(
+                method, f"{self.BASE_URL}{endpoint}", params=params, headers=headers
+            )
+        )
+
+    async def async_get_orderbook(
+        self, market: Market | str, outcome: int | str = 0
+    ) -> Dict[str, Any]:
+        """Async get_orderbook; same arguments and empty-book fallback"""
+        if isinstance(market, str) and market.startswith("0x") and len(market) == 66:
+            # Condition IDs need a token lookup first
+            token_id = await asyncio.to_thread(self._resolve_token_id, market, outcome)
+        else:
+            token_id = self._resolve_token_id(market, outcome)
+        try:
+            return await self._async_request_json(
+                "GET", f"{self.CLOB_URL}/book", params={"token_id": token_id}
+            )
+        except Exception as e:
+            if self.verbose:
+                print(f"Failed to fetch orderbook: {e}")
+            return {"bids": [], "asks": []}
+
+    async def async_fetch_markets(self, params: Optional[Dict[str, Any]] = None) -> list[Market]:
+        """Async fetch_markets: CLOB sampling-markets, falling back to Gamma"""
+        query_params = params or {}
+        try:
+            result = await self._async_retry_on_failure(
+                lambda: self._async_request_json("GET", f"{self.CLOB_URL}/sampling-markets")
+            )
+            markets_data = result.get("data", []) if isinstance(result, dict) else result
+            markets = [m for m in map(self._parse_sampling_market, markets_data or []) if m]
+            if query_params.get("active") or (not query_params.get("closed", True)):
+                markets = [m for m in markets if m.is_open]
+            limit = query_params.get("limit")
+            if limit:
+                markets = markets[:limit]
+            return markets
+        except Exception as e:
+            if self.verbose:
+                print(f"CLOB API fetch failed: {e}, falling back to Gamma API")
+
+        if "active" not in query_params and "closed" not in query_params:
+            query_params = {"active": True, "closed": False, **query_params}
+        data = await self._async_request("GET", "/markets", query_params)
+        return [self._parse_market(item) for item in data]
+
+    async def async_fetch_market(self, market: Market | str) -> Market:
+        """Async fetch_market for Gamma IDs, token IDs and slugs"""
+        if isinstance(market, Market):
+            market_id = market.metadata.get("id", market.id)
+        else:
+            market_id = market
+        identifier = str(market_id)
+
+        if identifier.startswith("0x"):
+            # Condition IDs resolve through the CLOB token lookup
+            return await asyncio.to_thread(self.fetch_market, identifier)
+
+        if identifier.isdigit() and len(identifier) < 20:
+            try:
+                return self._parse_market(
+                    await self._async_request("GET", f"/markets/{identifier}")
+                )
+            except ExchangeError:
+                raise MarketNotFound(f"Market {identifier} not found")
+
+        query = {"clob_token_ids": identifier} if identifier.isdigit() else {"slug": identifier}
+        try:
+            results = await self._async_request("GET", "/markets", query)
+        except ExchangeError:
+            results = None
+        if not results:
+            raise MarketNotFound(f"Market {identifier} not found")
+        return self._parse_market(results[0])
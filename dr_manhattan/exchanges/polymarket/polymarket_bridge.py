@@ -2,8 +2,6 @@ from __future__ import annotations
 
 from typing import Dict, List
 
-import requests
-
 
 class PolymarketBridge:
     """Bridge API mixin: cross-chain asset transfers (read-only)."""
@@ -20,7 +18,7 @@ class PolymarketBridge:
 
         @self._retry_on_failure
         def _fetch():
-            resp = requests.get(f"{self.BRIDGE_URL}/supported-assets", timeout=self.timeout)
+            resp = self._session.get(f"{self.BRIDGE_URL}/supported-assets", timeout=self.timeout)
             resp.raise_for_status()
             data = resp.json()
             if isinstance(data, list):
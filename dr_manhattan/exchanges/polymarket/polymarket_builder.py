@@ -18,6 +18,7 @@ from py_clob_client.clob_types import AssetType, BalanceAllowanceParams, OrderAr
 
 from ...base.errors import AuthenticationError, InvalidOrder
 from ...models.order import Order, OrderSide, OrderStatus, OrderTimeInForce
+from ...runtime.rate_limit import ACCOUNT, ORDERS
 from . import Polymarket
 
 
@@ -139,6 +140,7 @@ class PolymarketBuilder(Polymarket):
                 side=side.value.upper(),
             )
 
+            self._check_rate_limit(ORDERS)
             signed_order = self._clob_client.create_order(order_args)
             result = self._clob_client.post_order(signed_order, clob_order_type)
 
@@ -178,6 +180,7 @@ class PolymarketBuilder(Polymarket):
             raise AuthenticationError("Builder authentication not available.")
 
         try:
+            self._check_rate_limit(ORDERS)
             result = self._clob_client.cancel(order_id)
             if isinstance(result, dict):
                 return self._parse_order(result)
@@ -207,6 +210,7 @@ class PolymarketBuilder(Polymarket):
         try:
             # Fetch USDC (collateral) balance
             params = BalanceAllowanceParams(asset_type=AssetType.COLLATERAL)
+            self._check_rate_limit(ACCOUNT)
             balance_data = self._clob_client.get_balance_allowance(params=params)
 
             # Extract balance from response
@@ -234,6 +238,7 @@ class PolymarketBuilder(Polymarket):
             raise AuthenticationError("Builder authentication not available.")
 
         try:
+            self._check_rate_limit(ORDERS)
             response = self._clob_client.get_orders()
 
             if isinstance(response, list):
@@ -18,9 +18,11 @@ from ...base.errors import (
 from ...models.market import Market
 from ...models.order import Order, OrderSide, OrderStatus, OrderTimeInForce
 from ...models.position import Position
+from ...runtime.rate_limit import ACCOUNT, ORDERS
 from .polymarket_core import PricePoint
 from .polymarket_ws import PolymarketUserWebSocket, PolymarketWebSocket
 from .polymarket_ws_ext import PolymarketRTDSWebSocket, PolymarketSportsWebSocket
+from .polymarket_ws_pool import PolymarketWebSocketPool
 
 
 class PolymarketCLOB:
@@ -45,11 +47,22 @@ class PolymarketCLOB:
             ExchangeError: If token IDs cannot be fetched
         """
         condition_id = self._resolve_condition_id(market)
+        cached = self._cached_token_ids(condition_id)
+        if cached:
+            return cached
+        token_ids = self._fetch_clob_token_ids(condition_id)
+        self.market_cache.put_token_ids(condition_id, token_ids)
+        return token_ids
+
+    def _fetch_clob_token_ids(self, condition_id: str) -> list[str]:
+        """Scan the CLOB market listings for a condition ID's token IDs"""
         try:
             # Try simplified-markets endpoint
             # Response structure: {"data": [{"condition_id": ..., "tokens": [{"token_id": ..., "outcome": ...}]}]}
             try:
-                response = requests.get(f"{self.CLOB_URL}/simplified-markets", timeout=self.timeout)
+                response = self._session.get(
+                    f"{self.CLOB_URL}/simplified-markets", timeout=self.timeout
+                )
 
                 if response.status_code == 200:
                     result = response.json()
@@ -101,7 +114,7 @@ class PolymarketCLOB:
 
             # Try sampling-simplified-markets endpoint
             try:
-                response = requests.get(
+                response = self._session.get(
                     f"{self.CLOB_URL}/sampling-simplified-markets", timeout=self.timeout
                 )
 
@@ -135,7 +148,7 @@ class PolymarketCLOB:
 
             # Try markets endpoint
             try:
-                response = requests.get(f"{self.CLOB_URL}/markets", timeout=self.timeout)
+                response = self._session.get(f"{self.CLOB_URL}/markets", timeout=self.timeout)
 
                 if response.status_code == 200:
                     markets_list = response.json()
@@ -189,7 +202,7 @@ class PolymarketCLOB:
         """
         token_id = self._resolve_token_id(market, outcome)
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.CLOB_URL}/price",
                 params={"token_id": token_id, "side": side},
                 timeout=self.timeout,
@@ -215,7 +228,7 @@ class PolymarketCLOB:
         """
         token_id = self._resolve_token_id(market, outcome)
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.CLOB_URL}/midpoint",
                 params={"token_id": token_id},
                 timeout=self.timeout,
@@ -247,7 +260,7 @@ class PolymarketCLOB:
         """
         token_id = self._resolve_token_id(market, outcome)
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.CLOB_URL}/book", params={"token_id": token_id}, timeout=self.timeout
             )
 
@@ -296,6 +309,7 @@ class PolymarketCLOB:
                 side=side.value.upper(),
             )
 
+            self._check_rate_limit(ORDERS)
             signed_order = self._clob_client.create_order(order_args)
             result = self._clob_client.post_order(signed_order, clob_order_type)
 
@@ -332,6 +346,7 @@ class PolymarketCLOB:
             raise AuthenticationError("CLOB client not initialized. Private key required.")
 
         try:
+            self._check_rate_limit(ORDERS)
             result = self._clob_client.cancel(order_id)
             if isinstance(result, dict):
                 return self._parse_order(result)
@@ -370,6 +385,7 @@ class PolymarketCLOB:
 
         try:
             # Use CLOB client's get_orders method
+            self._check_rate_limit(ORDERS)
             response = self._clob_client.get_orders()
 
             # Response is a list directly
@@ -463,6 +479,7 @@ class PolymarketCLOB:
                     params_obj = BalanceAllowanceParams(
                         asset_type=AssetType.CONDITIONAL, token_id=token_id
                     )
+                    self._check_rate_limit(ACCOUNT)
                     balance_data = self._clob_client.get_balance_allowance(params=params_obj)
 
                     if isinstance(balance_data, dict) and "balance" in balance_data:
@@ -512,6 +529,7 @@ class PolymarketCLOB:
         try:
             # Fetch USDC (collateral) balance
             params = BalanceAllowanceParams(asset_type=AssetType.COLLATERAL)
+            self._check_rate_limit(ACCOUNT)
             balance_data = self._clob_client.get_balance_allowance(params=params)
 
             # Extract balance from response
@@ -553,7 +571,7 @@ class PolymarketCLOB:
 
         @self._retry_on_failure
         def _fetch() -> List[Dict[str, Any]]:
-            resp = requests.get(self.PRICES_HISTORY_URL, params=params, timeout=self.timeout)
+            resp = self._session.get(self.PRICES_HISTORY_URL, params=params, timeout=self.timeout)
             resp.raise_for_status()
             payload = resp.json()
             history = payload.get("history", [])
@@ -675,6 +693,32 @@ class PolymarketCLOB:
             )
         return self._ws
 
+    def get_websocket_pool(
+        self, max_assets_per_connection: Optional[int] = None
+    ) -> PolymarketWebSocketPool:
+        """
+        Get a sharded WebSocket pool for subscribing to large asset sets.
+
+        Assets are spread across several market-channel connections, capped at
+        max_assets_per_connection each. All connections update the exchange's
+        mid-price cache and one shared OrderbookManager.
+
+        Args:
+            max_assets_per_connection: Per-connection asset cap (default 500)
+
+        Returns:
+            New PolymarketWebSocketPool instance
+
+        Example:
+            pool = exchange.get_websocket_pool(max_assets_per_connection=200)
+            await pool.watch_orderbooks_by_assets({asset_id: callback for asset_id in ids})
+        """
+        return PolymarketWebSocketPool(
+            config={"verbose": self.verbose, "auto_reconnect": True},
+            exchange=self,
+            max_assets_per_connection=max_assets_per_connection,
+        )
+
     def get_user_websocket(self) -> PolymarketUserWebSocket:
         """
         Get User WebSocket instance for real-time trade/fill notifications.
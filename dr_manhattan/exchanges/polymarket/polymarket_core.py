@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Sequence
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
 
 import requests
 from py_clob_client.client import ClobClient
@@ -10,11 +12,11 @@ from py_clob_client.client import ClobClient
 from ...base.errors import (
     AuthenticationError,
     ExchangeError,
-    MarketNotFound,
     NetworkError,
     RateLimitError,
 )
 from ...models.market import Market
+from ...runtime.retry import parse_retry_after
 
 
 @dataclass
@@ -165,6 +167,9 @@ class PolymarketCore:
         self._address = None
         self._w3 = None
 
+        # Pages fetched concurrently by search_markets/fetch_public_trades
+        self.pagination_workers = self.config.get("pagination_workers", 4)
+
         # Builder API credentials for CTF operations (split/merge/redeem)
         self.builder_api_key = self.config.get("builder_api_key")
         self.builder_secret = self.config.get("builder_secret")
@@ -216,7 +221,7 @@ class PolymarketCore:
     def _request(self, method: str, endpoint: str, params: Optional[Dict] = None) -> Any:
         """Make HTTP request to Polymarket API with retry logic"""
 
-        @self._retry_on_failure
+        @self._retry_on_failure(endpoint=self._endpoint_class(method, endpoint))
         def _make_request():
             url = f"{self.BASE_URL}{endpoint}"
             headers = {}
@@ -225,14 +230,16 @@ class PolymarketCore:
                 headers["Authorization"] = f"Bearer {self.api_key}"
 
             try:
-                response = requests.request(
+                response = self._session.request(
                     method, url, params=params, headers=headers, timeout=self.timeout
                 )
 
                 # Handle rate limiting
                 if response.status_code == 429:
-                    retry_after = int(response.headers.get("Retry-After", 1))
-                    raise RateLimitError(f"Rate limited. Retry after {retry_after}s")
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                    raise RateLimitError(
+                        f"Rate limited. Retry after {retry_after}s", retry_after=retry_after
+                    )
 
                 response.raise_for_status()
                 return response.json()
@@ -247,6 +254,8 @@ class PolymarketCore:
                     raise AuthenticationError(f"Authentication failed: {e}")
                 elif response.status_code == 403:
                     raise AuthenticationError(f"Access forbidden: {e}")
+                elif response.status_code >= 500:
+                    raise NetworkError(f"Server error: {e}")
                 else:
                     raise ExchangeError(f"HTTP error: {e}")
             except requests.RequestException as e:
@@ -263,31 +272,36 @@ class PolymarketCore:
         page_size: int = 500,
         dedup_key: Callable[[Any], Any] | None = None,
         log: bool | None = False,
+        max_workers: int | None = None,
     ) -> List[Any]:
+        """
+        Collect up to total_limit items from an offset/limit paginated endpoint.
+
+        Up to max_workers pages (default: the `pagination_workers` config) are
+        fetched concurrently at consecutive offsets, then consumed in offset
+        order, so results keep the order a sequential walk would produce.
+        Collection stops at the first empty or short page, or a page holding
+        only duplicates; pages still in flight at that point are discarded.
+        """
         if total_limit <= 0:
             return []
 
         results: List[Any] = []
-        current_offset = int(initial_offset)
+        next_offset = int(initial_offset)
         total_limit = int(total_limit)
         page_size = max(1, int(page_size))
+        if max_workers is None:
+            max_workers = self.pagination_workers
+        max_workers = max(1, int(max_workers))
 
-        seen: set[Any] = set() if dedup_key else set()
-
-        while len(results) < total_limit:
-            remaining = total_limit - len(results)
-            page_limit = min(page_size, remaining)
-
-            if log:
-                print("current-offset:", current_offset)
-                print("page_limit:", page_limit)
-                print("----------")
-
-            page = fetch_page(current_offset, page_limit)
+        seen: set[Any] = set()
+        pending: Deque[Tuple[int, Future]] = deque()  # (page_limit, page), in offset order
+        requested = 0  # Items asked for by pages still pending
 
+        def consume(page: List[Any], page_limit: int) -> bool:
+            """Add a page to results; False once pagination should stop."""
             if not page:
-                break
-
+                return False
             if dedup_key:
                 new_items: List[Any] = []
                 for item in page:
@@ -296,18 +310,48 @@ class PolymarketCore:
                         continue
                     seen.add(key)
                     new_items.append(item)
-
                 if not new_items:
-                    break
-
+                    return False
                 results.extend(new_items)
             else:
                 results.extend(page)
+            return len(page) >= page_limit
 
-            current_offset += len(page)
-
-            if len(page) < page_limit:
-                break
+        pool = ThreadPoolExecutor(max_workers=max_workers) if max_workers > 1 else None
+        try:
+            while len(results) < total_limit:
+                # Keep the window full while more items may still be needed
+                while len(pending) < max_workers and len(results) + requested < total_limit:
+                    page_limit = min(page_size, total_limit - len(results) - requested)
+
+                    if log:
+                        print("current-offset:", next_offset)
+                        print("page_limit:", page_limit)
+                        print("----------")
+
+                    if pool is None:
+                        page_future: Future = Future()
+                        try:
+                            page_future.set_result(fetch_page(next_offset, page_limit))
+                        except Exception as e:
+                            page_future.set_exception(e)
+                    else:
+                        page_future = pool.submit(fetch_page, next_offset, page_limit)
+                    pending.append((page_limit, page_future))
+                    requested += page_limit
+                    next_offset += page_limit
+
+                if not pending:
+                    break
+                page_limit, page_future = pending.popleft()
+                requested -= page_limit
+                if not consume(page_future.result(), page_limit):
+                    break
+        finally:
+            for _, page_future in pending:
+                page_future.cancel()
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
 
         if len(results) > total_limit:
             results = results[:total_limit]
@@ -329,14 +373,6 @@ class PolymarketCore:
         except (ValueError, TypeError):
             return None
 
-    def _ensure_market(self, market: Market | str) -> Market:
-        if isinstance(market, Market):
-            return market
-        fetched = self.fetch_market(market)
-        if not fetched:
-            raise MarketNotFound(f"Market {market} not found")
-        return fetched
-
     # ------------------------------------------------------------------
     # ID resolvers: Market | str → specific ID type
     # ------------------------------------------------------------------
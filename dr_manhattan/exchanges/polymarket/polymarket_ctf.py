@@ -6,7 +6,6 @@ import hmac
 import time
 from typing import Any, Dict, List, Optional
 
-import requests
 from eth_abi import encode as abi_encode
 from eth_account import Account
 from eth_account.messages import encode_defunct
@@ -213,7 +212,7 @@ class PolymarketCTF:
 
         headers = self._get_builder_headers("POST", path, payload)
 
-        response = requests.post(
+        response = self._session.post(
             f"{self.RELAYER_URL}{path}",
             json=payload,
             headers=headers,
@@ -233,7 +232,7 @@ class PolymarketCTF:
 
         for _ in range(max_polls):
             try:
-                response = requests.get(f"{self.RELAYER_URL}{path}", timeout=10)
+                response = self._session.get(f"{self.RELAYER_URL}{path}", timeout=10)
                 if response.status_code == 200:
                     txns = response.json()
                     if txns and len(txns) > 0:
@@ -550,7 +549,7 @@ class PolymarketCTF:
         params = {"user": self.funder.lower(), "redeemable": "true"}
 
         try:
-            response = requests.get(url, params=params, timeout=30)
+            response = self._session.get(url, params=params, timeout=30)
             response.raise_for_status()
             data = response.json()
             return data if isinstance(data, list) else []
@@ -4,7 +4,6 @@ from datetime import datetime, timezone
 from typing import Any, Dict, List, Literal, Optional
 
 import pandas as pd
-import requests
 
 from ...base.errors import ExchangeError
 from ...models.market import Market
@@ -75,7 +74,7 @@ class PolymarketData:
                 "offset": offset_,
             }
 
-            resp = requests.get(
+            resp = self._session.get(
                 f"{self.DATA_API_URL}/trades",
                 params=params,
                 timeout=self.timeout,
@@ -219,7 +218,7 @@ class PolymarketData:
             }
             if user:
                 params["user"] = user
-            resp = requests.get(
+            resp = self._session.get(
                 f"{self.DATA_API_URL}/v1/leaderboard",
                 params=params,
                 timeout=self.timeout,
@@ -246,7 +245,7 @@ class PolymarketData:
         @self._retry_on_failure
         def _fetch():
             params = {"user": address, "limit": limit, "offset": offset}
-            resp = requests.get(
+            resp = self._session.get(
                 f"{self.DATA_API_URL}/activity",
                 params=params,
                 timeout=self.timeout,
@@ -276,7 +275,7 @@ class PolymarketData:
         @self._retry_on_failure
         def _fetch():
             params = {"market": condition_id, "limit": limit, "offset": offset}
-            resp = requests.get(
+            resp = self._session.get(
                 f"{self.DATA_API_URL}/holders",
                 params=params,
                 timeout=self.timeout,
@@ -302,7 +301,7 @@ class PolymarketData:
         @self._retry_on_failure
         def _fetch():
             params = {"market": condition_id}
-            resp = requests.get(
+            resp = self._session.get(
                 f"{self.DATA_API_URL}/oi",
                 params=params,
                 timeout=self.timeout,
@@ -328,7 +327,7 @@ class PolymarketData:
         @self._retry_on_failure
         def _fetch():
             params = {"user": address, "limit": limit, "offset": offset}
-            resp = requests.get(
+            resp = self._session.get(
                 f"{self.DATA_API_URL}/closed-positions",
                 params=params,
                 timeout=self.timeout,
@@ -355,7 +354,7 @@ class PolymarketData:
         @self._retry_on_failure
         def _fetch():
             params = {"user": address, "limit": limit, "offset": offset}
-            resp = requests.get(
+            resp = self._session.get(
                 f"{self.DATA_API_URL}/positions",
                 params=params,
                 timeout=self.timeout,
@@ -380,7 +379,7 @@ class PolymarketData:
         @self._retry_on_failure
         def _fetch():
             params = {"user": address}
-            resp = requests.get(
+            resp = self._session.get(
                 f"{self.DATA_API_URL}/value",
                 params=params,
                 timeout=self.timeout,
@@ -404,7 +403,7 @@ class PolymarketData:
         @self._retry_on_failure
         def _fetch():
             params = {"id": event_id}
-            resp = requests.get(
+            resp = self._session.get(
                 f"{self.DATA_API_URL}/live-volume",
                 params=params,
                 timeout=self.timeout,
@@ -428,7 +427,7 @@ class PolymarketData:
         @self._retry_on_failure
         def _fetch():
             params = {"user": address}
-            resp = requests.get(
+            resp = self._session.get(
                 f"{self.DATA_API_URL}/traded",
                 params=params,
                 timeout=self.timeout,
@@ -456,7 +455,7 @@ class PolymarketData:
         @self._retry_on_failure
         def _fetch():
             params = {"limit": limit, "offset": offset, "period": period}
-            resp = requests.get(
+            resp = self._session.get(
                 f"{self.DATA_API_URL}/v1/builders/leaderboard",
                 params=params,
                 timeout=self.timeout,
@@ -482,7 +481,7 @@ class PolymarketData:
         @self._retry_on_failure
         def _fetch():
             params = {"builderId": builder_id, "period": period}
-            resp = requests.get(
+            resp = self._session.get(
                 f"{self.DATA_API_URL}/v1/builders/volume",
                 params=params,
                 timeout=self.timeout,
@@ -84,7 +84,9 @@ class PolymarketGamma:
         def _fetch():
             # Fetch from CLOB API /sampling-markets (includes token IDs and live markets)
             try:
-                response = requests.get(f"{self.CLOB_URL}/sampling-markets", timeout=self.timeout)
+                response = self._session.get(
+                    f"{self.CLOB_URL}/sampling-markets", timeout=self.timeout
+                )
 
                 if response.status_code == 200:
                     result = response.json()
@@ -168,7 +170,7 @@ class PolymarketGamma:
                 try:
                     token_ids = self.fetch_token_ids(identifier)
                     if token_ids:
-                        gamma_resp = requests.get(
+                        gamma_resp = self._session.get(
                             f"{self.BASE_URL}/markets",
                             params={"clob_token_ids": str(token_ids[0])},
                             timeout=self.timeout,
@@ -185,7 +187,7 @@ class PolymarketGamma:
             # Long numeric string → token_id → query Gamma by clob_token_ids
             if identifier.isdigit() and len(identifier) >= 20:
                 try:
-                    resp = requests.get(
+                    resp = self._session.get(
                         f"{self.BASE_URL}/markets",
                         params={"clob_token_ids": identifier},
                         timeout=self.timeout,
@@ -201,7 +203,7 @@ class PolymarketGamma:
 
             # Slug → query by slug
             try:
-                resp = requests.get(
+                resp = self._session.get(
                     f"{self.BASE_URL}/markets",
                     params={"slug": identifier},
                     timeout=self.timeout,
@@ -236,7 +238,9 @@ class PolymarketGamma:
             raise ValueError("Empty slug provided")
 
         try:
-            response = requests.get(f"{self.BASE_URL}/events?slug={slug}", timeout=self.timeout)
+            response = self._session.get(
+                f"{self.BASE_URL}/events?slug={slug}", timeout=self.timeout
+            )
         except requests.Timeout as e:
             raise NetworkError(f"Request timeout: {e}")
         except requests.ConnectionError as e:
@@ -415,7 +419,7 @@ class PolymarketGamma:
                 "limit": limit_,
                 "offset": offset_,
             }
-            resp = requests.get(
+            resp = self._session.get(
                 f"{self.BASE_URL}/markets",
                 params=params,
                 timeout=self.timeout,
@@ -474,7 +478,7 @@ class PolymarketGamma:
 
         @self._retry_on_failure
         def _fetch() -> dict:
-            resp = requests.get(url, timeout=self.timeout)
+            resp = self._session.get(url, timeout=self.timeout)
             resp.raise_for_status()
             data = resp.json()
             if not isinstance(data, dict):
@@ -550,7 +554,7 @@ class PolymarketGamma:
                 query_params["tag_id"] = tag_id
 
             try:
-                response = requests.get(url, params=query_params, timeout=10)
+                response = self._session.get(url, params=query_params, timeout=10)
                 response.raise_for_status()
                 data = response.json()
 
@@ -1006,7 +1010,7 @@ class PolymarketGamma:
                 params["slug"] = slug
             if id:
                 params["id"] = id
-            resp = requests.get(f"{self.BASE_URL}/events", params=params, timeout=self.timeout)
+            resp = self._session.get(f"{self.BASE_URL}/events", params=params, timeout=self.timeout)
             resp.raise_for_status()
             data = resp.json()
             return data if isinstance(data, list) else []
@@ -1026,7 +1030,7 @@ class PolymarketGamma:
 
         @self._retry_on_failure
         def _fetch():
-            resp = requests.get(f"{self.BASE_URL}/events/{event_id}", timeout=self.timeout)
+            resp = self._session.get(f"{self.BASE_URL}/events/{event_id}", timeout=self.timeout)
             resp.raise_for_status()
             return resp.json()
 
@@ -1045,7 +1049,7 @@ class PolymarketGamma:
 
         @self._retry_on_failure
         def _fetch():
-            resp = requests.get(
+            resp = self._session.get(
                 f"{self.BASE_URL}/events",
                 params={"slug": slug},
                 timeout=self.timeout,
@@ -1072,7 +1076,7 @@ class PolymarketGamma:
 
         @self._retry_on_failure
         def _fetch():
-            resp = requests.get(
+            resp = self._session.get(
                 f"{self.BASE_URL}/series",
                 params={"limit": limit, "offset": offset},
                 timeout=self.timeout,
@@ -1096,7 +1100,7 @@ class PolymarketGamma:
 
         @self._retry_on_failure
         def _fetch():
-            resp = requests.get(f"{self.BASE_URL}/series/{series_id}", timeout=self.timeout)
+            resp = self._session.get(f"{self.BASE_URL}/series/{series_id}", timeout=self.timeout)
             resp.raise_for_status()
             return resp.json()
 
@@ -1113,7 +1117,7 @@ class PolymarketGamma:
 
         @self._retry_on_failure
         def _fetch():
-            resp = requests.get(f"{self.BASE_URL}/status", timeout=self.timeout)
+            resp = self._session.get(f"{self.BASE_URL}/status", timeout=self.timeout)
             resp.raise_for_status()
             result: Dict[str, Any] = {"status_code": resp.status_code, "ok": resp.ok}
             try:
@@ -1140,7 +1144,7 @@ class PolymarketGamma:
 
         @self._retry_on_failure
         def _fetch():
-            resp = requests.get(
+            resp = self._session.get(
                 f"{self.BASE_URL}/tags",
                 params={"limit": limit, "offset": offset},
                 timeout=self.timeout,
@@ -1164,7 +1168,7 @@ class PolymarketGamma:
 
         @self._retry_on_failure
         def _fetch():
-            resp = requests.get(f"{self.BASE_URL}/tags/{tag_id}", timeout=self.timeout)
+            resp = self._session.get(f"{self.BASE_URL}/tags/{tag_id}", timeout=self.timeout)
             resp.raise_for_status()
             return resp.json()
 
@@ -1184,7 +1188,9 @@ class PolymarketGamma:
 
         @self._retry_on_failure
         def _fetch():
-            resp = requests.get(f"{self.BASE_URL}/markets/{market_id}/tags", timeout=self.timeout)
+            resp = self._session.get(
+                f"{self.BASE_URL}/markets/{market_id}/tags", timeout=self.timeout
+            )
             resp.raise_for_status()
             data = resp.json()
             return data if isinstance(data, list) else []
@@ -1204,7 +1210,9 @@ class PolymarketGamma:
 
         @self._retry_on_failure
         def _fetch():
-            resp = requests.get(f"{self.BASE_URL}/events/{event_id}/tags", timeout=self.timeout)
+            resp = self._session.get(
+                f"{self.BASE_URL}/events/{event_id}/tags", timeout=self.timeout
+            )
             resp.raise_for_status()
             data = resp.json()
             return data if isinstance(data, list) else []
@@ -1221,7 +1229,7 @@ class PolymarketGamma:
 
         @self._retry_on_failure
         def _fetch():
-            resp = requests.get(f"{self.BASE_URL}/sports/market-types", timeout=self.timeout)
+            resp = self._session.get(f"{self.BASE_URL}/sports/market-types", timeout=self.timeout)
             resp.raise_for_status()
             data = resp.json()
             return data if isinstance(data, list) else []
@@ -1238,7 +1246,7 @@ class PolymarketGamma:
 
         @self._retry_on_failure
         def _fetch():
-            resp = requests.get(f"{self.BASE_URL}/sports", timeout=self.timeout)
+            resp = self._session.get(f"{self.BASE_URL}/sports", timeout=self.timeout)
             resp.raise_for_status()
             return resp.json()
 
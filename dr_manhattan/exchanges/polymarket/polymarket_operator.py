@@ -20,6 +20,7 @@ from py_clob_client.clob_types import AssetType, BalanceAllowanceParams, OrderAr
 from ...base.errors import AuthenticationError, ExchangeError, InvalidOrder
 from ...models.order import Order, OrderSide, OrderStatus, OrderTimeInForce
 from ...models.position import Position
+from ...runtime.rate_limit import ACCOUNT, ORDERS
 from . import Polymarket
 
 
@@ -173,6 +174,7 @@ class PolymarketOperator(Polymarket):
                 side=side.value.upper(),
             )
 
+            self._check_rate_limit(ORDERS)
             signed_order = self._clob_client.create_order(order_args)
             result = self._clob_client.post_order(signed_order, clob_order_type)
 
@@ -214,6 +216,7 @@ class PolymarketOperator(Polymarket):
             raise AuthenticationError("CLOB client not initialized.")
 
         try:
+            self._check_rate_limit(ORDERS)
             result = self._clob_client.cancel(order_id)
             if isinstance(result, dict):
                 return self._parse_order(result)
@@ -239,6 +242,7 @@ class PolymarketOperator(Polymarket):
 
         try:
             params = BalanceAllowanceParams(asset_type=AssetType.COLLATERAL)
+            self._check_rate_limit(ACCOUNT)
             balance_data = self._clob_client.get_balance_allowance(params=params)
 
             usdc_balance = 0.0
@@ -261,6 +265,7 @@ class PolymarketOperator(Polymarket):
             raise AuthenticationError("CLOB client not initialized.")
 
         try:
+            self._check_rate_limit(ORDERS)
             response = self._clob_client.get_orders()
 
             if isinstance(response, list):
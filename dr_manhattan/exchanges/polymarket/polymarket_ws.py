@@ -1,4 +1,5 @@
 import asyncio
+import concurrent.futures
 import json
 import logging
 import threading
@@ -6,13 +7,15 @@ import time
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypedDict, Union
 
 import websockets
 import websockets.exceptions
 
-from ...base.websocket import OrderBookWebSocket, WebSocketState
-from ...models.orderbook import OrderbookManager
+from ...base.websocket import OrderBookWebSocket, WebSocketState, top_of_book_callback
+from ...models.orderbook import DepthBook, OrderbookManager, parse_price_levels, price_to_tick
+from ...runtime.event_loop import EventLoopRuntime, get_runtime
+from ...utils import json_codec
 
 logger = logging.getLogger(__name__)
 
@@ -43,16 +46,125 @@ class Trade:
     transaction_hash: str = ""
 
 
+# Wire schemas for the market and user channels. Prices and sizes arrive as
+# decimal strings; parsing to floats happens once, at the DepthBook boundary.
+# With msgspec installed, frames are decoded against MarketMessage/TradeMessage
+# (see json_codec.typed_decoder); otherwise they are plain json dicts.
+
+
+class WireLevel(TypedDict):
+    price: str
+    size: str
+
+
+class BookMessage(TypedDict, total=False):
+    event_type: str
+    asset_id: str
+    market: str
+    timestamp: int | str
+    hash: str
+    bids: List[WireLevel]
+    asks: List[WireLevel]
+
+
+class PriceChange(TypedDict, total=False):
+    asset_id: str
+    price: str
+    size: str
+    side: str
+    hash: str
+    best_bid: str
+    best_ask: str
+
+
+class PriceChangeMessage(TypedDict, total=False):
+    event_type: str
+    market: str
+    timestamp: int | str
+    price_changes: List[PriceChange]
+
+
+class BestBidAskMessage(TypedDict, total=False):
+    event_type: str
+    market: str
+    asset_id: str
+    timestamp: int | str
+    best_bid: str
+    best_ask: str
+    price_changes: List[PriceChange]
+    changes: List[PriceChange]
+
+
+class MarketMessage(TypedDict, total=False):
+    """Any market-channel event: the union of the fields of the schemas above."""
+
+    event_type: str
+    asset_id: str
+    market: str
+    timestamp: int | str
+    hash: str
+    bids: List[WireLevel]
+    asks: List[WireLevel]
+    best_bid: str
+    best_ask: str
+    price_changes: List[PriceChange]
+    changes: List[PriceChange]
+
+
+class TradeMessage(TypedDict, total=False):
+    type: str
+    id: str
+    market: str
+    asset_id: str
+    side: str
+    price: str
+    size: str
+    fee_rate_bps: str
+    match_time: str
+    outcome: str
+    taker_order_id: str
+    maker_order_id: str
+    transaction_hash: str
+
+
+@dataclass(frozen=True)
+class BookResyncStats:
+    """Counters for PolymarketWebSocket book validation."""
+
+    mismatches: int = 0
+    gaps: int = 0
+    resyncs: int = 0
+    failures: int = 0
+    pending: int = 0
+
+
+def _timestamp_value(timestamp: Any) -> float:
+    """Order wire timestamps, which arrive as ints or numeric strings; 0 if unknown."""
+    try:
+        return float(timestamp or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
 class PolymarketWebSocket(OrderBookWebSocket):
     """
     Polymarket WebSocket implementation for real-time orderbook updates.
 
     Uses CLOB WebSocket API for market channel subscriptions.
     Documentation: https://docs.polymarket.com/developers/CLOB/websocket/
+
+    Set config["validate_books"] to check each price_change against the best
+    bid/ask the server reports and, on a mismatch or a delta with no snapshot,
+    refetch just that asset's book via exchange.get_orderbook (at most once per
+    config["resync_cooldown"] seconds). Counters are exposed via resync_stats.
     """
 
     WS_URL = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
 
+    decode_message = staticmethod(
+        json_codec.typed_decoder(Union[List[MarketMessage], MarketMessage])
+    )
+
     def __init__(self, config: Optional[Dict[str, Any]] = None, exchange=None):
         super().__init__(config)
 
@@ -64,10 +176,26 @@ class PolymarketWebSocket(OrderBookWebSocket):
 
         # Track subscribed asset IDs
         self.subscribed_assets = set()
+        # Assets subscribed on the current connection; None until the initial
+        # full subscription has been sent, after which changes go out as deltas
+        self._connection_assets: Optional[set[str]] = None
 
         # Orderbook manager
         self.orderbook_manager = OrderbookManager()
-        self._book_state: Dict[str, Dict[str, Any]] = {}
+        self._book_state: Dict[str, DepthBook] = {}
+
+        # Book validation: resync an asset from REST when its deltas look inconsistent
+        self.validate_books = self.config.get("validate_books", False)
+        self.resync_cooldown = self.config.get("resync_cooldown", 5.0)
+        self._resync_pending: set[str] = set()
+        # price_changes received while an asset's REST snapshot is in flight
+        self._resync_buffer: Dict[str, List[Tuple[Any, PriceChange]]] = {}
+        self._last_resync: Dict[str, float] = {}
+        self.resyncs_by_asset: Dict[str, int] = {}
+        self.book_mismatches = 0
+        self.book_gaps = 0
+        self.book_resyncs = 0
+        self.book_resync_failures = 0
 
     @property
     def ws_url(self) -> str:
@@ -94,14 +222,18 @@ class PolymarketWebSocket(OrderBookWebSocket):
         # Store the market_id as asset_id for subscription
         asset_id = market_id
 
-        # Mark as subscribed
-        self.subscribed_assets.add(asset_id)
-
-        await self._send_subscription()
+        await self.subscribe_assets([asset_id])
 
         if self.verbose:
             logger.debug(f"Subscribed to market/asset: {asset_id}")
 
+    async def _resubscribe_all(self):
+        """Restore every subscription on a fresh connection with one message."""
+        self._connection_assets = None
+        self.subscribed_assets.update(self.subscriptions)
+        if self.subscribed_assets:
+            await self._send_subscription()
+
     async def _send_subscription(self):
         """Send the full current asset subscription set."""
         subscribe_message = {
@@ -113,6 +245,61 @@ class PolymarketWebSocket(OrderBookWebSocket):
         }
 
         await self.ws.send(json.dumps(subscribe_message))
+        self._connection_assets = set(self.subscribed_assets)
+
+    async def _send_subscription_delta(self, asset_ids: List[str], operation: str):
+        """Subscribe or unsubscribe assets on an already subscribed connection."""
+        delta_message = {
+            "assets_ids": asset_ids,
+            "operation": operation,
+            "custom_feature_enabled": True,
+        }
+
+        await self.ws.send(json.dumps(delta_message))
+
+    async def subscribe_assets(self, asset_ids: List[str]):
+        """
+        Add assets to the subscription set.
+
+        The first subscription on a connection carries the full set; after that
+        only assets not yet subscribed on the connection are sent, in one message.
+
+        Args:
+            asset_ids: Token IDs to subscribe to
+        """
+        self.subscribed_assets.update(asset_ids)
+        if self.ws is None:
+            # Sent by _resubscribe_all once connected
+            return
+        if self._connection_assets is None:
+            await self._send_subscription()
+            return
+
+        new_assets = [a for a in dict.fromkeys(asset_ids) if a not in self._connection_assets]
+        if new_assets:
+            self._connection_assets.update(new_assets)
+            await self._send_subscription_delta(new_assets, "subscribe")
+
+    async def unsubscribe_assets(self, asset_ids: List[str]):
+        """
+        Remove assets from the subscription set with a single delta message.
+
+        Local depth for removed assets is dropped; a later subscribe starts from
+        a fresh snapshot.
+
+        Args:
+            asset_ids: Token IDs to unsubscribe from
+        """
+        removed = []
+        for asset_id in dict.fromkeys(asset_ids):
+            self.subscribed_assets.discard(asset_id)
+            self._book_state.pop(asset_id, None)
+            if self._connection_assets and asset_id in self._connection_assets:
+                self._connection_assets.discard(asset_id)
+                removed.append(asset_id)
+
+        if removed and self.ws is not None:
+            await self._send_subscription_delta(removed, "unsubscribe")
 
     async def _unsubscribe_orderbook(self, market_id: str):
         """
@@ -123,11 +310,7 @@ class PolymarketWebSocket(OrderBookWebSocket):
         """
         asset_id = market_id
 
-        # Remove from subscribed set
-        self.subscribed_assets.discard(asset_id)
-
-        # Send unsubscription (resubscribe with remaining assets)
-        await self._send_subscription()
+        await self.unsubscribe_assets([asset_id])
 
         if self.verbose:
             logger.debug(f"Unsubscribed from market/asset: {asset_id}")
@@ -164,7 +347,7 @@ class PolymarketWebSocket(OrderBookWebSocket):
 
         return None
 
-    def _parse_book_message(self, message: Dict[str, Any]) -> Dict[str, Any]:
+    def _parse_book_message(self, message: BookMessage) -> Dict[str, Any]:
         """
         Parse book message (full orderbook snapshot).
 
@@ -182,51 +365,31 @@ class PolymarketWebSocket(OrderBookWebSocket):
         asset_id = message.get("asset_id", "")
         market_id = message.get("market", asset_id)
 
-        # Parse bids and asks
-        bids = []
-        for bid in message.get("bids", []):
-            try:
-                price = float(bid.get("price", 0))
-                size = float(bid.get("size", 0))
-                if price > 0 and size > 0:
-                    bids.append((price, size))
-            except (ValueError, TypeError):
-                continue
-
-        asks = []
-        for ask in message.get("asks", []):
-            try:
-                price = float(ask.get("price", 0))
-                size = float(ask.get("size", 0))
-                if price > 0 and size > 0:
-                    asks.append((price, size))
-            except (ValueError, TypeError):
-                continue
+        bids = parse_price_levels(message.get("bids") or ())
+        asks = parse_price_levels(message.get("asks") or ())
 
         # Sort bids descending, asks ascending
         bids.sort(reverse=True)
         asks.sort()
-        self._book_state[asset_id] = {
-            "market_id": market_id,
-            "bids": dict(bids),
-            "asks": dict(asks),
-            "timestamp": message.get("timestamp", 0),
-            "hash": message.get("hash", ""),
-        }
+        book = self._book_state[asset_id] = DepthBook(
+            market_id=market_id,
+            timestamp=message.get("timestamp", 0),
+            hash=message.get("hash", ""),
+            bids=bids,
+            asks=asks,
+        )
 
-        return {
-            "market_id": market_id,
-            "asset_id": asset_id,
-            "bids": bids,
-            "asks": asks,
-            "timestamp": message.get("timestamp", 0),
-            "hash": message.get("hash", ""),
-        }
+        return book.to_dict(asset_id)
 
-    def _parse_price_change_message(self, message: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _parse_price_change_message(
+        self, message: PriceChangeMessage
+    ) -> Optional[List[Dict[str, Any]]]:
         """
         Parse price_change message (incremental updates).
 
+        Changes are applied to the per-asset DepthBook in order; one orderbook is
+        emitted per touched asset, reflecting the book after the whole message.
+
         Message format:
         {
             "event_type": "price_change",
@@ -250,30 +413,38 @@ class PolymarketWebSocket(OrderBookWebSocket):
         if not price_changes:
             return None
 
-        updates = []
+        touched: Dict[str, DepthBook] = {}
+        last_change: Dict[str, PriceChange] = {}
         for change in price_changes:
             asset_id = change.get("asset_id", "")
             if not asset_id:
                 continue
-            state = self._book_state.setdefault(
-                asset_id,
-                {
-                    "market_id": market_id,
-                    "bids": {},
-                    "asks": {},
-                    "timestamp": timestamp,
-                    "hash": change.get("hash", ""),
-                },
-            )
-            state["market_id"] = market_id or state.get("market_id", asset_id)
-            state["timestamp"] = timestamp
-            state["hash"] = change.get("hash", state.get("hash", ""))
-            self._apply_price_change(state, change)
-            updates.append(self._state_orderbook(asset_id, state))
-
-        return updates
-
-    def _parse_best_bid_ask_message(self, message: Dict[str, Any]) -> List[Dict[str, Any]]:
+            book = self._book_state.get(asset_id)
+            if book is None:
+                book = DepthBook(market_id=market_id, timestamp=timestamp)
+                self._book_state[asset_id] = book
+                if self.validate_books:
+                    # Delta without a snapshot: depth beyond this change is unknown
+                    self.book_gaps += 1
+                    self._schedule_resync(asset_id)
+            if asset_id in self._resync_pending:
+                self._resync_buffer.setdefault(asset_id, []).append((timestamp, change))
+            book.market_id = market_id or book.market_id or asset_id
+            book.timestamp = timestamp
+            book.hash = change.get("hash", book.hash)
+            self._apply_price_change(book, change)
+            touched[asset_id] = book
+            last_change[asset_id] = change
+
+        if self.validate_books:
+            for asset_id, book in touched.items():
+                if not self._top_of_book_matches(book, last_change[asset_id]):
+                    self.book_mismatches += 1
+                    self._schedule_resync(asset_id)
+
+        return [book.to_dict(asset_id) for asset_id, book in touched.items()]
+
+    def _parse_best_bid_ask_message(self, message: BestBidAskMessage) -> List[Dict[str, Any]]:
         market_id = message.get("market", "")
         timestamp = message.get("timestamp", 0)
         updates = []
@@ -282,19 +453,19 @@ class PolymarketWebSocket(OrderBookWebSocket):
             items = [message]
         for item in items:
             asset_id = item.get("asset_id", "")
-            if not asset_id or asset_id not in self._book_state:
+            book = self._book_state.get(asset_id) if asset_id else None
+            if book is None:
                 continue
-            state = self._book_state[asset_id]
-            state["market_id"] = market_id or state.get("market_id", asset_id)
-            state["timestamp"] = timestamp
-            state["hash"] = item.get("hash", state.get("hash", ""))
-            self._apply_top_of_book_hint(state, item)
-            updates.append(self._state_orderbook(asset_id, state))
+            book.market_id = market_id or book.market_id or asset_id
+            book.timestamp = timestamp
+            book.hash = item.get("hash", book.hash)
+            self._apply_top_of_book_hint(book, item)
+            updates.append(book.to_dict(asset_id))
         return updates
 
-    def _apply_top_of_book_hint(self, state: Dict[str, Any], item: Dict[str, Any]) -> None:
+    def _apply_top_of_book_hint(self, book: DepthBook, item: PriceChange) -> None:
         """Keep known depth aligned with Polymarket best_bid_ask when size is already known."""
-        for field, side in (("best_bid", "bids"), ("best_ask", "asks")):
+        for field, side in (("best_bid", book.bids), ("best_ask", book.asks)):
             value = item.get(field)
             if value is None:
                 continue
@@ -302,19 +473,11 @@ class PolymarketWebSocket(OrderBookWebSocket):
                 price = float(value)
             except (TypeError, ValueError):
                 continue
-            if price <= 0 or price in state[side]:
+            if price <= 0 or price in side or not side:
                 continue
-            levels = state[side]
-            if not levels:
-                continue
-            if side == "bids":
-                stale_prices = [existing for existing in levels if existing > price]
-            else:
-                stale_prices = [existing for existing in levels if existing < price]
-            for existing in stale_prices:
-                levels.pop(existing, None)
-
-    def _apply_price_change(self, state: Dict[str, Any], change: Dict[str, Any]) -> None:
+            side.remove_better_than(price)
+
+    def _apply_price_change(self, book: DepthBook, change: PriceChange) -> None:
         try:
             price = float(change.get("price", 0))
             size = float(change.get("size", 0))
@@ -324,27 +487,131 @@ class PolymarketWebSocket(OrderBookWebSocket):
             return
         side = str(change.get("side", "")).upper()
         if side == "BUY":
-            levels = state["bids"]
+            book.bids.set(price, size)
         elif side == "SELL":
-            levels = state["asks"]
-        else:
+            book.asks.set(price, size)
+
+    @staticmethod
+    def _top_of_book_matches(book: DepthBook, change: PriceChange) -> bool:
+        """
+        Check local best levels against the best_bid/best_ask Polymarket reports.
+
+        Each price_change carries the server's best prices after the change. The
+        book hash covers fields the market channel never sends (tick size, min
+        order size, ...), so these prices are the checkable part of the state.
+        """
+        for field, side in (("best_bid", book.bids), ("best_ask", book.asks)):
+            value = change.get(field)
+            if value is None or value == "":
+                continue
+            try:
+                expected = float(value)
+            except (TypeError, ValueError):
+                continue
+            best = side.best
+            if expected <= 0:
+                if best is not None:
+                    return False
+            elif best is None or price_to_tick(best[0]) != price_to_tick(expected):
+                return False
+        return True
+
+    @property
+    def resync_stats(self) -> BookResyncStats:
+        return BookResyncStats(
+            mismatches=self.book_mismatches,
+            gaps=self.book_gaps,
+            resyncs=self.book_resyncs,
+            failures=self.book_resync_failures,
+            pending=len(self._resync_pending),
+        )
+
+    def _schedule_resync(self, asset_id: str) -> None:
+        """Schedule a REST snapshot for one asset, at most once per cooldown."""
+        if asset_id in self._resync_pending:
             return
-        if size > 0:
-            levels[price] = size
-        else:
-            levels.pop(price, None)
+        last = self._last_resync.get(asset_id)
+        if last is not None and time.monotonic() - last < self.resync_cooldown:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._resync_pending.add(asset_id)
+        task = loop.create_task(self._resync_book(asset_id))
+        self.tasks.append(task)
+        task.add_done_callback(self._discard_task)
 
-    def _state_orderbook(self, asset_id: str, state: Dict[str, Any]) -> Dict[str, Any]:
-        bids = sorted(state.get("bids", {}).items(), reverse=True)
-        asks = sorted(state.get("asks", {}).items())
-        return {
-            "market_id": state.get("market_id", asset_id),
-            "asset_id": asset_id,
-            "bids": bids,
-            "asks": asks,
-            "timestamp": state.get("timestamp", 0),
-            "hash": state.get("hash", ""),
-        }
+    def _discard_task(self, task: asyncio.Task) -> None:
+        if task in self.tasks:
+            self.tasks.remove(task)
+
+    async def _resync_book(self, asset_id: str) -> None:
+        """
+        Replace one asset's book with a REST snapshot and re-emit it.
+
+        The receive loop keeps applying deltas while the snapshot is fetched.
+        Those are buffered and replayed on top of the snapshot when newer than
+        it, and a snapshot older than the book it would replace is discarded.
+        """
+        current = self._book_state.get(asset_id)
+        base_timestamp = _timestamp_value(current.timestamp) if current else 0.0
+        try:
+            get_orderbook = getattr(self.exchange, "get_orderbook", None)
+            if get_orderbook is None:
+                self.book_resync_failures += 1
+                return
+            loop = asyncio.get_running_loop()
+            data = await loop.run_in_executor(None, get_orderbook, asset_id)
+        except Exception as e:
+            self.book_resync_failures += 1
+            if self.verbose:
+                logger.debug(f"Orderbook resync failed for {asset_id}: {e}")
+            return
+        finally:
+            self._resync_pending.discard(asset_id)
+            buffered = self._resync_buffer.pop(asset_id, [])
+            self._last_resync[asset_id] = time.monotonic()
+
+        # get_orderbook returns empty sides on HTTP errors; keep the current book
+        if not data or not (data.get("bids") or data.get("asks")):
+            self.book_resync_failures += 1
+            return
+
+        snapshot_timestamp = _timestamp_value(data.get("timestamp"))
+        if snapshot_timestamp and snapshot_timestamp < base_timestamp:
+            # Older than what the socket already delivered: applying it would roll back
+            self.book_resync_failures += 1
+            if self.verbose:
+                logger.debug(f"Discarded stale orderbook snapshot for {asset_id}")
+            return
+
+        existing = self._book_state.get(asset_id)
+        orderbook = self._parse_book_message(
+            {
+                **data,
+                "event_type": "book",
+                "asset_id": asset_id,
+                "market": data.get("market") or (existing.market_id if existing else asset_id),
+            }
+        )
+        book = self._book_state[asset_id]
+        replayed = False
+        for timestamp, change in buffered:
+            if snapshot_timestamp and _timestamp_value(timestamp) <= snapshot_timestamp:
+                continue
+            self._apply_price_change(book, change)
+            book.timestamp = timestamp
+            book.hash = change.get("hash", book.hash)
+            replayed = True
+        if replayed:
+            orderbook = book.to_dict(asset_id)
+        self.book_resyncs += 1
+        self.resyncs_by_asset[asset_id] = self.resyncs_by_asset.get(asset_id, 0) + 1
+        if self.verbose:
+            logger.debug(f"Orderbook resynced from REST: {asset_id}")
+        self._message_received_ns = time.time_ns()
+        await self._dispatch_orderbook(orderbook)
 
     async def watch_orderbook_by_asset(self, asset_id: str, callback):
         """
@@ -356,7 +623,14 @@ class PolymarketWebSocket(OrderBookWebSocket):
         """
         await self.watch_orderbook(asset_id, callback)
 
-    async def watch_orderbook_by_market(self, market_id: str, asset_ids: list[str], callback=None):
+    async def watch_orderbook_by_market(
+        self,
+        market_id: str,
+        asset_ids: list[str],
+        callback=None,
+        top_of_book_depth: Optional[int] = None,
+        top_of_book_sizes: bool = False,
+    ):
         """
         Subscribe to orderbook updates for a market with multiple assets.
 
@@ -367,26 +641,46 @@ class PolymarketWebSocket(OrderBookWebSocket):
             asset_ids: List of asset (token) IDs for this market
             callback: Optional function to call with orderbook updates.
                      If None, data will be stored in orderbook_manager only.
+            top_of_book_depth: If set, the callback fires only when the best
+                     `top_of_book_depth` prices change and receives a TopOfBook
+                     event instead of the full orderbook.
+            top_of_book_sizes: With top_of_book_depth, also fire when only the
+                     size at one of those levels changes.
         """
+        if callback and top_of_book_depth:
+            callback = top_of_book_callback(
+                callback, top_of_book_depth, include_sizes=top_of_book_sizes
+            )
+
+        # Create callback that updates manager and exchange mid-price cache
+        def make_callback(tid):
+            last_best = [None]
+
+            def cb(market_id, orderbook):
+                # Update orderbook manager
+                self.orderbook_manager.update(tid, orderbook)
+                # Update exchange mid-price cache (mid only moves with the best prices)
+                update_mid = getattr(self.exchange, "update_mid_price_from_orderbook", None)
+                if update_mid:
+                    bids, asks = orderbook.get("bids"), orderbook.get("asks")
+                    best = (bids[0][0] if bids else None, asks[0][0] if asks else None)
+                    if best != last_best[0]:
+                        last_best[0] = best
+                        update_mid(tid, orderbook)
+                # Call user callback if provided
+                if callback:
+                    callback(market_id, orderbook)
+
+            return cb
+
         # Store mapping
         for asset_id in asset_ids:
             self.market_to_asset[market_id] = asset_id
 
-            # Create callback that updates manager and exchange mid-price cache
-            def make_callback(tid):
-                def cb(market_id, orderbook):
-                    # Update orderbook manager
-                    self.orderbook_manager.update(tid, orderbook)
-                    # Update exchange mid-price cache
-                    if self.exchange:
-                        self.exchange.update_mid_price_from_orderbook(tid, orderbook)
-                    # Call user callback if provided
-                    if callback:
-                        callback(market_id, orderbook)
-
-                return cb
-
-            await self.watch_orderbook(asset_id, make_callback(asset_id))
+        # One subscription message for all of the market's assets
+        await self.watch_orderbooks_by_assets(
+            {asset_id: make_callback(asset_id) for asset_id in asset_ids}
+        )
 
     async def watch_orderbooks_by_assets(self, asset_callbacks: dict[str, Callable]):
         """
@@ -396,12 +690,24 @@ class PolymarketWebSocket(OrderBookWebSocket):
         a single subscription message. The callback map is keyed by asset ID.
         """
         self.subscriptions.update(asset_callbacks)
-        self.subscribed_assets.update(asset_callbacks.keys())
 
         if self.state != WebSocketState.CONNECTED:
             await self.connect()
 
-        await self._send_subscription()
+        await self.subscribe_assets(list(asset_callbacks))
+
+    async def unwatch_orderbooks_by_assets(self, asset_ids: List[str]):
+        """
+        Unsubscribe from many assets in one websocket request.
+
+        Args:
+            asset_ids: Token IDs to stop watching
+        """
+        removed = [
+            a for a in dict.fromkeys(asset_ids) if self.subscriptions.pop(a, None) is not None
+        ]
+        if removed:
+            await self.unsubscribe_assets(removed)
 
     def get_orderbook_manager(self) -> OrderbookManager:
         """
@@ -427,37 +733,38 @@ class PolymarketWebSocket(OrderBookWebSocket):
         """
         try:
             # Parse orderbook data
+            parse_start = time.perf_counter_ns()
             parsed = self._parse_orderbook_message(data)
             if not parsed:
                 return
+            parse_ns = time.perf_counter_ns() - parse_start
             orderbooks = parsed if isinstance(parsed, list) else [parsed]
 
             for orderbook in orderbooks:
-                # Try both market_id and asset_id as subscription keys
-                market_id = orderbook.get("market_id")
-                asset_id = orderbook.get("asset_id")
-
-                # Check which key is in subscriptions
-                callback = None
-                callback_key = None
-
-                if asset_id and asset_id in self.subscriptions:
-                    callback = self.subscriptions[asset_id]
-                    callback_key = asset_id
-                elif market_id and market_id in self.subscriptions:
-                    callback = self.subscriptions[market_id]
-                    callback_key = market_id
-
-                if callback and callback_key:
-                    # Call callback in a non-blocking way
-                    if asyncio.iscoroutinefunction(callback):
-                        await callback(callback_key, orderbook)
-                    else:
-                        callback(callback_key, orderbook)
+                await self._dispatch_orderbook(orderbook, parse_ns)
         except Exception as e:
             if self.verbose:
                 logger.debug(f"Error processing message item: {e}")
 
+    async def _dispatch_orderbook(self, orderbook: Dict[str, Any], parse_ns: int = 0) -> None:
+        """Invoke the subscription callback for an orderbook (asset_id, then market_id)."""
+        market_id = orderbook.get("market_id")
+        asset_id = orderbook.get("asset_id")
+
+        # Check which key is in subscriptions
+        callback = None
+        callback_key = None
+
+        if asset_id and asset_id in self.subscriptions:
+            callback = self.subscriptions[asset_id]
+            callback_key = asset_id
+        elif market_id and market_id in self.subscriptions:
+            callback = self.subscriptions[market_id]
+            callback_key = market_id
+
+        if callback and callback_key:
+            await self._invoke_callback(callback, callback_key, orderbook, parse_ns)
+
 
 TradeCallback = Callable[[Trade], None]
 
@@ -475,6 +782,8 @@ class PolymarketUserWebSocket:
 
     WS_URL = "wss://ws-subscriptions-clob.polymarket.com/ws/user"
 
+    decode_message = staticmethod(json_codec.typed_decoder(Union[List[TradeMessage], TradeMessage]))
+
     def __init__(
         self,
         api_key: str,
@@ -491,6 +800,7 @@ class PolymarketUserWebSocket:
         self._running = False
         self._thread: Optional[threading.Thread] = None
         self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._receive_future: Optional[concurrent.futures.Future] = None
         self._callbacks: List[TradeCallback] = []
         self._connected = False
 
@@ -541,7 +851,7 @@ class PolymarketUserWebSocket:
                         continue
 
                     try:
-                        data = json.loads(message)
+                        data = self.decode_message(message)
                         await self._handle_message(data)
                     except json.JSONDecodeError:
                         pass
@@ -578,7 +888,7 @@ class PolymarketUserWebSocket:
             if trade and trade.size > 0:
                 self._emit_trade(trade)
 
-    def _parse_trade(self, data: dict) -> Optional[Trade]:
+    def _parse_trade(self, data: TradeMessage) -> Optional[Trade]:
         """Parse TRADE message from Polymarket user WebSocket"""
         try:
             # Parse match_time (unix timestamp in seconds)
@@ -619,20 +929,16 @@ class PolymarketUserWebSocket:
                 if self.verbose:
                     logger.warning(f"Trade callback error: {e}")
 
-    def start(self) -> threading.Thread:
-        """Start WebSocket in background thread"""
+    def start(self, runtime: Optional[EventLoopRuntime] = None) -> threading.Thread:
+        """Start WebSocket on the shared background event loop"""
         if self._running:
             return self._thread
 
         self._running = True
-        self._loop = asyncio.new_event_loop()
-
-        def run():
-            asyncio.set_event_loop(self._loop)
-            self._loop.run_until_complete(self._receive_loop())
-
-        self._thread = threading.Thread(target=run, daemon=True)
-        self._thread.start()
+        runtime = runtime or get_runtime()
+        self._loop = runtime.loop
+        self._thread = runtime.thread
+        self._receive_future = runtime.submit(self._receive_loop())
 
         if self.verbose:
             logger.info("User WebSocket started")
@@ -651,9 +957,13 @@ class PolymarketUserWebSocket:
 
             asyncio.run_coroutine_threadsafe(close(), self._loop)
 
-        if self._thread:
-            self._thread.join(timeout=5)
-            self._thread = None
+        if self._receive_future:
+            try:
+                self._receive_future.result(timeout=5)
+            except Exception:
+                self._receive_future.cancel()
+            self._receive_future = None
+        self._thread = None
 
         if self.verbose:
             logger.info("User WebSocket stopped")
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
 import json
 import logging
 import threading
@@ -9,6 +10,9 @@ from typing import Any, Callable, Dict, List, Optional
 import websockets
 import websockets.exceptions
 
+from ...runtime.event_loop import EventLoopRuntime, get_runtime
+from ...utils import json_codec
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,6 +32,7 @@ class PolymarketSportsWebSocket:
         self._thread: Optional[threading.Thread] = None
         self._running = False
         self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._listen_future: Optional[concurrent.futures.Future] = None
         self._callbacks: Dict[str, List[Callable]] = {}
         self._subscribed_markets: List[str] = []
 
@@ -77,7 +82,7 @@ class PolymarketSportsWebSocket:
 
                     async for message in ws:
                         try:
-                            data = json.loads(message)
+                            data = json_codec.loads(message)
                             for cb in self._callbacks.get("update", []):
                                 cb(data)
                         except json.JSONDecodeError:
@@ -95,26 +100,27 @@ class PolymarketSportsWebSocket:
                 if self._running:
                     await asyncio.sleep(5)
 
-    def start(self) -> None:
-        """Start the WebSocket in a background thread."""
+    def start(self, runtime: Optional[EventLoopRuntime] = None) -> None:
+        """Start the WebSocket on the shared background event loop."""
         if self._running:
             return
         self._running = True
-        self._loop = asyncio.new_event_loop()
-        self._thread = threading.Thread(target=self._run_loop, daemon=True, name="sports-ws")
-        self._thread.start()
-
-    def _run_loop(self) -> None:
-        asyncio.set_event_loop(self._loop)
-        self._loop.run_until_complete(self._listen())
+        runtime = runtime or get_runtime()
+        self._loop = runtime.loop
+        self._thread = runtime.thread
+        self._listen_future = runtime.submit(self._listen())
 
     def stop(self) -> None:
         """Stop the WebSocket."""
         self._running = False
         if self.ws:
             asyncio.run_coroutine_threadsafe(self.ws.close(), self._loop)
-        if self._thread:
-            self._thread.join(timeout=5)
+        if self._listen_future:
+            try:
+                self._listen_future.result(timeout=5)
+            except Exception:
+                self._listen_future.cancel()
+            self._listen_future = None
 
 
 class PolymarketRTDSWebSocket:
@@ -132,6 +138,7 @@ class PolymarketRTDSWebSocket:
         self._thread: Optional[threading.Thread] = None
         self._running = False
         self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._listen_future: Optional[concurrent.futures.Future] = None
         self._callbacks: Dict[str, List[Callable]] = {}
         self._subscribed_assets: List[str] = []
 
@@ -184,7 +191,7 @@ class PolymarketRTDSWebSocket:
 
                     async for message in ws:
                         try:
-                            data = json.loads(message)
+                            data = json_codec.loads(message)
                             # Route to appropriate callbacks based on message type
                             msg_type = data.get("type", "")
                             if msg_type == "comment":
@@ -209,23 +216,24 @@ class PolymarketRTDSWebSocket:
                 if self._running:
                     await asyncio.sleep(5)
 
-    def start(self) -> None:
-        """Start the WebSocket in a background thread."""
+    def start(self, runtime: Optional[EventLoopRuntime] = None) -> None:
+        """Start the WebSocket on the shared background event loop."""
         if self._running:
             return
         self._running = True
-        self._loop = asyncio.new_event_loop()
-        self._thread = threading.Thread(target=self._run_loop, daemon=True, name="rtds-ws")
-        self._thread.start()
-
-    def _run_loop(self) -> None:
-        asyncio.set_event_loop(self._loop)
-        self._loop.run_until_complete(self._listen())
+        runtime = runtime or get_runtime()
+        self._loop = runtime.loop
+        self._thread = runtime.thread
+        self._listen_future = runtime.submit(self._listen())
 
     def stop(self) -> None:
         """Stop the WebSocket."""
         self._running = False
         if self.ws:
             asyncio.run_coroutine_threadsafe(self.ws.close(), self._loop)
-        if self._thread:
-            self._thread.join(timeout=5)
+        if self._listen_future:
+            try:
+                self._listen_future.result(timeout=5)
+            except Exception:
+                self._listen_future.cancel()
+            self._listen_future = None
@@ -0,0 +1,250 @@
+import asyncio
+import contextlib
+import logging
+from typing import Any, Callable, Dict, List, Optional
+
+from ...models.orderbook import OrderbookManager
+from .polymarket_ws import PolymarketWebSocket
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ASSETS_PER_CONNECTION = 500
+
+
+class _PoolShard(PolymarketWebSocket):
+    """Market-channel connection owned by a PolymarketWebSocketPool."""
+
+    def __init__(self, pool: "PolymarketWebSocketPool"):
+        super().__init__(config=dict(pool.config), exchange=pool.exchange)
+        self.pool = pool
+        # Assets the pool has placed on this connection (including pending ones)
+        self.assigned: set[str] = set()
+        # All shards feed one manager so callers see a single book surface
+        self.orderbook_manager = pool.orderbook_manager
+
+    async def _resubscribe_all(self):
+        # The full subscription is resent anyway; top up from later shards first
+        await self.pool._rebalance_into(self, resubscribing=True)
+        await super()._resubscribe_all()
+
+
+class PolymarketWebSocketPool:
+    """
+    Shard Polymarket market-channel subscriptions across several connections.
+
+    Each connection carries at most `max_assets_per_connection` assets. New
+    assets fill the first connection with room; subscribe/unsubscribe changes
+    go out as incremental deltas on the owning connection. When a connection
+    reconnects it pulls assets from the last connections until full, and
+    connections left empty are closed, so the pool stays compact as the asset
+    set churns.
+
+    Every connection writes into one OrderbookManager and the same exchange
+    mid-price cache, so callers interact with the pool like a single
+    PolymarketWebSocket.
+
+    Example:
+        pool = exchange.get_websocket_pool(max_assets_per_connection=200)
+        await pool.watch_orderbooks_by_assets({asset_id: callback, ...})
+        bid, ask = pool.get_orderbook_manager().get_best_bid_ask(asset_id)
+    """
+
+    def __init__(
+        self,
+        config: Optional[Dict[str, Any]] = None,
+        exchange=None,
+        max_assets_per_connection: Optional[int] = None,
+    ):
+        self.config = config or {}
+        self.verbose = self.config.get("verbose", False)
+        self.exchange = exchange
+        self.max_assets_per_connection = max(
+            1,
+            int(
+                max_assets_per_connection
+                or self.config.get("max_assets_per_connection", DEFAULT_MAX_ASSETS_PER_CONNECTION)
+            ),
+        )
+
+        self.orderbook_manager = OrderbookManager()
+        self.shards: List[_PoolShard] = []
+        self.shard_by_asset: Dict[str, _PoolShard] = {}
+        self._receive_tasks: Dict[_PoolShard, asyncio.Task] = {}
+
+    @property
+    def subscriptions(self) -> Dict[str, Callable]:
+        """Callbacks for every subscribed asset across all connections."""
+        merged: Dict[str, Callable] = {}
+        for shard in self.shards:
+            merged.update(shard.subscriptions)
+        return merged
+
+    @property
+    def connection_count(self) -> int:
+        return len(self.shards)
+
+    def _assign(self, asset_ids: List[str]) -> Dict[_PoolShard, List[str]]:
+        """Place assets on shards with room, opening new shards as needed."""
+        placement: Dict[_PoolShard, List[str]] = {}
+        for asset_id in dict.fromkeys(asset_ids):
+            shard = self.shard_by_asset.get(asset_id)
+            if shard is None:
+                shard = next(
+                    (s for s in self.shards if len(s.assigned) < self.max_assets_per_connection),
+                    None,
+                )
+                if shard is None:
+                    shard = _PoolShard(self)
+                    self.shards.append(shard)
+                    if self.verbose:
+                        logger.debug(f"Opened pool connection #{len(self.shards)}")
+                shard.assigned.add(asset_id)
+                self.shard_by_asset[asset_id] = shard
+            placement.setdefault(shard, []).append(asset_id)
+        return placement
+
+    def _ensure_receiving(self, shard: _PoolShard) -> None:
+        task = self._receive_tasks.get(shard)
+        if task is None or task.done():
+            self._receive_tasks[shard] = asyncio.create_task(shard._receive_loop())
+
+    async def watch_orderbooks_by_assets(self, asset_callbacks: Dict[str, Callable]):
+        """
+        Subscribe to many assets, sending one message per affected connection.
+
+        Args:
+            asset_callbacks: Mapping of asset (token) ID to callback(asset_id, orderbook)
+        """
+        placement = self._assign(list(asset_callbacks))
+        for shard, asset_ids in placement.items():
+            await shard.watch_orderbooks_by_assets({a: asset_callbacks[a] for a in asset_ids})
+            self._ensure_receiving(shard)
+
+    async def watch_orderbook(self, asset_id: str, callback: Callable):
+        """
+        Subscribe to orderbook updates for a single asset.
+
+        Args:
+            asset_id: Token ID to watch
+            callback: Function(asset_id, orderbook)
+        """
+        await self.watch_orderbooks_by_assets({asset_id: callback})
+
+    async def watch_orderbook_by_market(
+        self,
+        market_id: str,
+        asset_ids: list[str],
+        callback=None,
+        top_of_book_depth: Optional[int] = None,
+        top_of_book_sizes: bool = False,
+    ):
+        """
+        Subscribe to a market's assets, keeping the shared OrderbookManager updated.
+
+        Args:
+            market_id: Market condition ID
+            asset_ids: List of asset (token) IDs for this market
+            callback: Optional function to call with orderbook updates
+            top_of_book_depth: See PolymarketWebSocket.watch_orderbook_by_market
+            top_of_book_sizes: See PolymarketWebSocket.watch_orderbook_by_market
+        """
+        placement = self._assign(asset_ids)
+        for shard, shard_assets in placement.items():
+            await shard.watch_orderbook_by_market(
+                market_id,
+                shard_assets,
+                callback,
+                top_of_book_depth=top_of_book_depth,
+                top_of_book_sizes=top_of_book_sizes,
+            )
+            self._ensure_receiving(shard)
+
+    async def unwatch_orderbook(self, asset_id: str):
+        """
+        Unsubscribe from an asset; connections left empty are closed.
+
+        Args:
+            asset_id: Token ID to stop watching
+        """
+        shard = self.shard_by_asset.pop(asset_id, None)
+        if shard is None:
+            return
+        shard.assigned.discard(asset_id)
+        await shard.unwatch_orderbook(asset_id)
+        if not shard.assigned:
+            await self._close_shard(shard)
+
+    async def rebalance(self):
+        """Compact assets onto as few connections as the per-connection cap allows."""
+        for shard in list(self.shards):
+            if shard in self.shards:
+                await self._rebalance_into(shard)
+
+    async def _rebalance_into(self, shard: _PoolShard, resubscribing: bool = False) -> None:
+        """
+        Move assets from the last shards into `shard` until it is full.
+
+        Moved assets are subscribed on `shard` before the donor drops them, unless
+        `resubscribing` is set because `shard` is about to resend its full set.
+        """
+        if shard not in self.shards:
+            return
+        position = self.shards.index(shard)
+        for donor in reversed(self.shards[position + 1 :]):
+            room = self.max_assets_per_connection - len(shard.assigned)
+            if room <= 0:
+                break
+            moving = list(donor.assigned)[:room]
+            for asset_id in moving:
+                donor.assigned.discard(asset_id)
+                callback = donor.subscriptions.pop(asset_id, None)
+                shard.assigned.add(asset_id)
+                self.shard_by_asset[asset_id] = shard
+                if callback is not None:
+                    shard.subscriptions[asset_id] = callback
+
+            if self.verbose:
+                logger.debug(f"Rebalanced {len(moving)} assets between pool connections")
+
+            if resubscribing:
+                shard.subscribed_assets.update(moving)
+            else:
+                await shard.subscribe_assets(moving)
+                self._ensure_receiving(shard)
+
+            if not donor.assigned:
+                await self._close_shard(donor)
+                continue
+            try:
+                await donor.unsubscribe_assets(moving)
+            except Exception as e:
+                # The donor resubscribes from its (already reduced) set on reconnect
+                if self.verbose:
+                    logger.debug(f"Pool unsubscribe during rebalance failed: {e}")
+
+    async def _close_shard(self, shard: _PoolShard) -> None:
+        if shard in self.shards:
+            self.shards.remove(shard)
+        task = self._receive_tasks.pop(shard, None)
+        await shard.disconnect()
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        if self.verbose:
+            logger.debug(f"Closed pool connection ({len(self.shards)} remaining)")
+
+    def get_orderbook_manager(self) -> OrderbookManager:
+        """
+        Get the OrderbookManager shared by all pool connections.
+
+        Returns:
+            OrderbookManager instance
+        """
+        return self.orderbook_manager
+
+    async def disconnect(self):
+        """Close every pool connection."""
+        for shard in list(self.shards):
+            await self._close_shard(shard)
+        self.shard_by_asset.clear()
@@ -37,6 +37,7 @@ from ..base.exchange import Exchange
 from ..models.market import Market, parse_market_datetime
 from ..models.order import Order, OrderSide, OrderStatus
 from ..models.position import Position
+from ..runtime.retry import parse_retry_after
 from .predictfun_ws import PredictFunUserWebSocket, PredictFunWebSocket
 
 __all__ = ["PredictFun"]
@@ -209,7 +210,6 @@ class PredictFun(Exchange):
             self._usdt_address = USDT_ADDRESS_MAINNET
             self._rpc_url = BNB_RPC_MAINNET
 
-        self._session = requests.Session()
         self._account = None
         self._address = None
         self._owner_account = None  # Smart wallet owner account for signing
@@ -413,7 +413,7 @@ class PredictFun(Exchange):
         if require_auth:
             self._ensure_authenticated()
 
-        @self._retry_on_failure
+        @self._retry_on_failure(endpoint=self._endpoint_class(method, endpoint))
         def _make_request():
             url = f"{self.host}{endpoint}"
             headers = self._get_headers(require_auth)
@@ -437,7 +437,8 @@ class PredictFun(Exchange):
                     )
 
                 if response.status_code == 429:
-                    raise RateLimitError("Rate limited")
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                    raise RateLimitError("Rate limited", retry_after=retry_after)
 
                 if response.status_code == 401:
                     # Try to get error message from response body
@@ -1338,7 +1339,10 @@ class PredictFun(Exchange):
         Returns:
             List of token IDs
         """
-        market = self.fetch_market(market_id)
+        cached = self._cached_token_ids(market_id)
+        if cached:
+            return cached
+        market = self._ensure_market(market_id)
         token_ids = market.metadata.get("clobTokenIds", [])
         if not token_ids:
             raise ExchangeError(f"No token IDs found for market {market_id}")
@@ -10,6 +10,7 @@ Documentation: https://dev.predict.fun/
 """
 
 import asyncio
+import concurrent.futures
 import json
 import logging
 import threading
@@ -24,6 +25,8 @@ import websockets.exceptions
 
 from ..base.websocket import OrderBookWebSocket, WebSocketState
 from ..models.orderbook import OrderbookManager
+from ..runtime.event_loop import EventLoopRuntime, get_runtime
+from ..utils import json_codec
 
 logger = logging.getLogger(__name__)
 
@@ -302,6 +305,7 @@ class PredictFunUserWebSocket:
         self._running = False
         self._thread: Optional[threading.Thread] = None
         self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._receive_future: Optional[concurrent.futures.Future] = None
         self._connected = False
         self._request_id = 0
         self._trade_callbacks: List[TradeCallback] = []
@@ -355,7 +359,7 @@ class PredictFunUserWebSocket:
                     if message in ("PONG", "PING", ""):
                         continue
                     try:
-                        await self._handle_message(json.loads(message))
+                        await self._handle_message(json_codec.loads(message))
                     except json.JSONDecodeError:
                         pass
             except websockets.exceptions.ConnectionClosed:
@@ -449,19 +453,15 @@ class PredictFunUserWebSocket:
                 logger.warning(f"Failed to parse trade: {e}")
             return None
 
-    def start(self) -> threading.Thread:
+    def start(self, runtime: Optional[EventLoopRuntime] = None) -> threading.Thread:
         with self._lock:
             if self._running:
                 return self._thread
             self._running = True
-            self._loop = asyncio.new_event_loop()
-
-            def run():
-                asyncio.set_event_loop(self._loop)
-                self._loop.run_until_complete(self._receive_loop())
-
-            self._thread = threading.Thread(target=run, daemon=True)
-            self._thread.start()
+            runtime = runtime or get_runtime()
+            self._loop = runtime.loop
+            self._thread = runtime.thread
+            self._receive_future = runtime.submit(self._receive_loop())
             return self._thread
 
     def stop(self):
@@ -472,10 +472,10 @@ class PredictFunUserWebSocket:
                 future.result(timeout=SHUTDOWN_TIMEOUT)
             except Exception:
                 pass
-        if self._thread:
-            self._thread.join(timeout=SHUTDOWN_TIMEOUT)
-        if self._loop:
+        if self._receive_future:
+            # The loop is shared with other clients; end only this client's task
             try:
-                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._receive_future.result(timeout=SHUTDOWN_TIMEOUT)
             except Exception:
-                pass
+                self._receive_future.cancel()
+            self._receive_future = None
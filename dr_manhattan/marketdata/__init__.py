@@ -1,5 +1,33 @@
 """Market data utilities."""
 
-from .polymarket_relay import PolymarketOrderbookRelay, RelayStats
+from .book_bus import SharedBookBus, SharedBookReader
+from .feeds import LimitlessFeed, OrderbookFeed, PollingFeed, WebSocketFeed, as_feed
+from .polymarket_relay import PolymarketOrderbookRelay
+from .relay import OrderbookRelay, RelayStats, asset_key, split_asset_key
+from .relay_client import RelayBookDecoder, stream_orderbooks, subscribe_message
+from .relay_codec import RelayMessage, decode_message, encode_binary
+from .relay_metrics import MetricsServer, RelayMetrics, format_prometheus
 
-__all__ = ["PolymarketOrderbookRelay", "RelayStats"]
+__all__ = [
+    "LimitlessFeed",
+    "MetricsServer",
+    "OrderbookFeed",
+    "OrderbookRelay",
+    "PollingFeed",
+    "PolymarketOrderbookRelay",
+    "RelayBookDecoder",
+    "RelayMessage",
+    "RelayMetrics",
+    "RelayStats",
+    "SharedBookBus",
+    "SharedBookReader",
+    "WebSocketFeed",
+    "as_feed",
+    "asset_key",
+    "decode_message",
+    "encode_binary",
+    "format_prometheus",
+    "split_asset_key",
+    "stream_orderbooks",
+    "subscribe_message",
+]
@@ -0,0 +1,303 @@
+"""Shared-memory orderbook bus for same-host consumers.
+
+A SharedBookBus owns one ``multiprocessing.shared_memory`` block holding the
+latest book per asset in a fixed slot; any number of SharedBookReader
+processes attach to it by name and read without sockets, parsing or locks.
+
+Layout (little-endian, numpy structured array after a 32-byte header):
+
+    header  magic u32, version u32, slot count u32, depth u32, slots used u32
+    slot    seq u64, timestamp i64, bid count u32, ask count u32,
+            asset_id length u32, asset_id bytes,
+            bids f64[depth, 2], asks f64[depth, 2]   # (price, size), best first
+
+Each slot is guarded by a seqlock: the writer makes ``seq`` odd, writes the
+levels, then makes it even again. Readers copy the levels and retry when
+``seq`` was odd or changed underneath them. There is one writer per bus.
+
+Example:
+    bus = SharedBookBus("dm_books", slots=4096, depth=20)
+    relay = OrderbookRelay(feeds=..., bus=bus)
+
+    # In another process
+    reader = SharedBookReader("dm_books")
+    orderbook = reader.read("polymarket:<token id>")
+"""
+
+from __future__ import annotations
+
+import struct
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from dr_manhattan.models.orderbook import Orderbook, TopOfBook
+
+_MAGIC = 0x4B424D44  # "DMBK"
+_VERSION = 1
+_HEADER = struct.Struct("<IIIII")
+_HEADER_BYTES = 32
+ASSET_ID_BYTES = 128
+READ_RETRIES = 64
+
+
+def _slot_dtype(depth: int) -> np.dtype:
+    return np.dtype(
+        [
+            ("seq", "<u8"),
+            ("timestamp", "<i8"),
+            ("n_bids", "<u4"),
+            ("n_asks", "<u4"),
+            ("asset_len", "<u4"),
+            ("_pad", "<u4"),
+            ("asset_id", f"S{ASSET_ID_BYTES}"),
+            ("bids", "<f8", (depth, 2)),
+            ("asks", "<f8", (depth, 2)),
+        ]
+    )
+
+
+def _timestamp(value: Any) -> int:
+    try:
+        return int(float(value or 0))
+    except (TypeError, ValueError):
+        return 0
+
+
+class _BusView:
+    """Field views over the shared slot array."""
+
+    def __init__(self, shm: shared_memory.SharedMemory, slots: int, depth: int) -> None:
+        self.shm = shm
+        self.slots = slots
+        self.depth = depth
+        records = np.ndarray(
+            (slots,), dtype=_slot_dtype(depth), buffer=shm.buf, offset=_HEADER_BYTES
+        )
+        self.seq = records["seq"]
+        self.timestamp = records["timestamp"]
+        self.n_bids = records["n_bids"]
+        self.n_asks = records["n_asks"]
+        self.asset_len = records["asset_len"]
+        self.asset_id = records["asset_id"]
+        self.bids = records["bids"]
+        self.asks = records["asks"]
+        # Slots used, at header offset 16
+        self.used = np.ndarray((1,), dtype="<u4", buffer=shm.buf, offset=16)
+
+    def release(self) -> None:
+        # Drop buffer exports before closing the mapping
+        for name in (
+            "seq",
+            "timestamp",
+            "n_bids",
+            "n_asks",
+            "asset_len",
+            "asset_id",
+            "bids",
+            "asks",
+            "used",
+        ):
+            setattr(self, name, None)
+
+
+class SharedBookBus:
+    """
+    Writer side: publish the latest book per asset into shared memory.
+
+    Args:
+        name: Shared memory block name readers attach to
+        slots: Maximum number of assets
+        depth: Levels kept per side; deeper levels are truncated
+    """
+
+    def __init__(self, name: str, slots: int = 1024, depth: int = 20) -> None:
+        self.name = name
+        self.depth = max(1, int(depth))
+        slots = max(1, int(slots))
+        size = _HEADER_BYTES + slots * _slot_dtype(self.depth).itemsize
+        self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        _HEADER.pack_into(self._shm.buf, 0, _MAGIC, _VERSION, slots, self.depth, 0)
+        self._view = _BusView(self._shm, slots, self.depth)
+        self._slot_by_asset: Dict[str, int] = {}
+        self.books_published = 0
+        self.books_rejected = 0
+
+    @property
+    def assets(self) -> int:
+        return len(self._slot_by_asset)
+
+    def _slot(self, asset_id: str) -> Optional[int]:
+        slot = self._slot_by_asset.get(asset_id)
+        if slot is not None:
+            return slot
+        view = self._view
+        used = int(view.used[0])
+        encoded = asset_id.encode()
+        if used >= view.slots or len(encoded) > ASSET_ID_BYTES:
+            return None
+        view.asset_id[used] = encoded
+        view.asset_len[used] = len(encoded)
+        # Publish the directory entry only after the asset ID is written
+        view.used[0] = used + 1
+        self._slot_by_asset[asset_id] = used
+        return used
+
+    def publish(self, asset_id: str, orderbook: Dict[str, Any]) -> bool:
+        """
+        Write a book into the asset's slot.
+
+        Args:
+            asset_id: Asset key readers look up
+            orderbook: Book dict with "bids"/"asks" (best first) and "timestamp"
+
+        Returns:
+            False when the bus is full or the asset ID is too long
+        """
+        slot = self._slot(asset_id)
+        if slot is None:
+            self.books_rejected += 1
+            return False
+        view = self._view
+        depth = self.depth
+        bids = orderbook.get("bids") or ()
+        asks = orderbook.get("asks") or ()
+        n_bids = min(len(bids), depth)
+        n_asks = min(len(asks), depth)
+
+        seq = int(view.seq[slot])
+        view.seq[slot] = seq + 1  # odd: write in progress
+        if n_bids:
+            view.bids[slot, :n_bids] = bids[:n_bids]
+        if n_asks:
+            view.asks[slot, :n_asks] = asks[:n_asks]
+        view.n_bids[slot] = n_bids
+        view.n_asks[slot] = n_asks
+        view.timestamp[slot] = _timestamp(orderbook.get("timestamp"))
+        view.seq[slot] = seq + 2
+        self.books_published += 1
+        return True
+
+    def callback(self, asset_id: str, orderbook: Dict[str, Any]) -> None:
+        """Drop-in watch_orderbook callback: callback(asset_id, orderbook)."""
+        self.publish(asset_id, orderbook)
+
+    def close(self, unlink: bool = True) -> None:
+        """Detach; the owner unlinks the block so readers see it disappear."""
+        self._view.release()
+        self._shm.close()
+        if unlink:
+            self._shm.unlink()
+
+
+class SharedBookReader:
+    """
+    Reader side: attach to a SharedBookBus by name.
+
+    Reads are seqlock-consistent snapshots of one asset's slot; they never
+    block the writer.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._shm = shared_memory.SharedMemory(name=name)
+        # Readers must not unlink the writer's block when they exit
+        resource_tracker.unregister(self._shm._name, "shared_memory")
+        magic, version, slots, depth, _ = _HEADER.unpack_from(self._shm.buf, 0)
+        if magic != _MAGIC or version != _VERSION:
+            self._shm.close()
+            raise ValueError(f"{name} is not a version {_VERSION} book bus")
+        self.depth = depth
+        self._view = _BusView(self._shm, slots, depth)
+        self._slot_by_asset: Dict[str, int] = {}
+        self._scanned = 0
+
+    def _slot(self, asset_id: str) -> Optional[int]:
+        slot = self._slot_by_asset.get(asset_id)
+        if slot is not None:
+            return slot
+        view = self._view
+        used = int(view.used[0])
+        for index in range(self._scanned, used):
+            raw = bytes(view.asset_id[index])[: int(view.asset_len[index])]
+            self._slot_by_asset[raw.decode()] = index
+        self._scanned = used
+        return self._slot_by_asset.get(asset_id)
+
+    def assets(self) -> list[str]:
+        """Asset keys currently on the bus."""
+        self._slot("")
+        return list(self._slot_by_asset)
+
+    def seq(self, asset_id: str) -> int:
+        """Slot sequence number; changes on every publish (0 if unknown)."""
+        slot = self._slot(asset_id)
+        return 0 if slot is None else int(self._view.seq[slot])
+
+    def levels(self, asset_id: str) -> Optional[Tuple[int, np.ndarray, np.ndarray]]:
+        """
+        Zero-copy (seq, bids, asks) views into shared memory.
+
+        The arrays are live: re-check `seq(asset_id)` after using them, and
+        discard the result if it changed.
+        """
+        slot = self._slot(asset_id)
+        if slot is None:
+            return None
+        view = self._view
+        seq = int(view.seq[slot])
+        return (
+            seq,
+            view.bids[slot, : int(view.n_bids[slot])],
+            view.asks[slot, : int(view.n_asks[slot])],
+        )
+
+    def _read(self, asset_id: str, depth: int):
+        slot = self._slot(asset_id)
+        if slot is None:
+            return None
+        view = self._view
+        for _ in range(READ_RETRIES):
+            seq = int(view.seq[slot])
+            if seq & 1 or seq == 0:
+                if seq == 0:
+                    return None
+                continue
+            n_bids = min(int(view.n_bids[slot]), depth)
+            n_asks = min(int(view.n_asks[slot]), depth)
+            bids = view.bids[slot, :n_bids].tolist()
+            asks = view.asks[slot, :n_asks].tolist()
+            timestamp = int(view.timestamp[slot])
+            if int(view.seq[slot]) == seq:
+                return bids, asks, timestamp
+        return None
+
+    def read(self, asset_id: str) -> Optional[Orderbook]:
+        """Consistent copy of the asset's book, or None if absent or contended."""
+        result = self._read(asset_id, self.depth)
+        if result is None:
+            return None
+        bids, asks, timestamp = result
+        return Orderbook(
+            bids=[(price, size) for price, size in bids],
+            asks=[(price, size) for price, size in asks],
+            timestamp=timestamp,
+            asset_id=asset_id,
+        )
+
+    def top_of_book(self, asset_id: str, depth: int = 1) -> Optional[TopOfBook]:
+        """Best `depth` levels per side, copying only those."""
+        result = self._read(asset_id, depth)
+        if result is None:
+            return None
+        bids, asks, timestamp = result
+        return TopOfBook(
+            asset_id=asset_id,
+            bids=tuple((price, size) for price, size in bids),
+            asks=tuple((price, size) for price, size in asks),
+            timestamp=timestamp,
+        )
+
+    def close(self) -> None:
+        self._view.release()
+        self._shm.close()
@@ -0,0 +1,217 @@
+"""Upstream orderbook feeds for the relay.
+
+A feed adapts one exchange's market-data interface to a common shape: it
+subscribes exchange-native asset IDs and calls ``callback(asset_id, book)``
+with a book dict (``bids``/``asks`` as ``(price, size)`` levels, best first,
+plus ``timestamp``) on every update.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from typing import Any
+
+from dr_manhattan.models.orderbook import Orderbook
+
+logger = logging.getLogger(__name__)
+
+BookCallback = Callable[[str, dict[str, Any]], None]
+
+
+class OrderbookFeed(ABC):
+    """Book source for one exchange, addressed by exchange-native asset IDs."""
+
+    @property
+    @abstractmethod
+    def assets(self) -> set[str]:
+        """Asset IDs currently subscribed upstream."""
+
+    async def start(self) -> None:
+        """Open upstream connections; subscriptions may come before or after."""
+
+    async def stop(self) -> None:
+        """Close upstream connections."""
+
+    @abstractmethod
+    async def subscribe(self, callbacks: dict[str, BookCallback]) -> None:
+        """Subscribe assets, each with its own callback."""
+
+    @abstractmethod
+    async def unsubscribe(self, asset_ids: list[str]) -> None:
+        """Stop updates for assets."""
+
+
+class WebSocketFeed(OrderbookFeed):
+    """Feed backed by an OrderBookWebSocket (Polymarket, Predict.fun)."""
+
+    def __init__(self, websocket: Any) -> None:
+        self.websocket = websocket
+        self._receive_task: asyncio.Task | None = None
+
+    @property
+    def assets(self) -> set[str]:
+        return set(self.websocket.subscriptions)
+
+    async def start(self) -> None:
+        await self.websocket.connect()
+        self._receive_task = asyncio.create_task(self.websocket._receive_loop())
+
+    async def stop(self) -> None:
+        if self._receive_task:
+            self._receive_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._receive_task
+            self._receive_task = None
+        await self.websocket.disconnect()
+
+    async def subscribe(self, callbacks: dict[str, BookCallback]) -> None:
+        # Batch where the exchange supports it (one subscription message)
+        watch_many = getattr(self.websocket, "watch_orderbooks_by_assets", None)
+        if watch_many is not None:
+            await watch_many(callbacks)
+            return
+        for asset_id, callback in callbacks.items():
+            await self.websocket.watch_orderbook(asset_id, callback)
+
+    async def unsubscribe(self, asset_ids: list[str]) -> None:
+        unwatch_many = getattr(self.websocket, "unwatch_orderbooks_by_assets", None)
+        if unwatch_many is not None:
+            await unwatch_many(asset_ids)
+            return
+        for asset_id in asset_ids:
+            await self.websocket.unwatch_orderbook(asset_id)
+
+
+class LimitlessFeed(OrderbookFeed):
+    """Feed backed by a LimitlessWebSocket; asset IDs are market slugs."""
+
+    def __init__(self, websocket: Any) -> None:
+        self.websocket = websocket
+        self.callbacks: dict[str, BookCallback] = {}
+        websocket.on_orderbook(self._on_orderbook)
+
+    @property
+    def assets(self) -> set[str]:
+        return set(self.callbacks)
+
+    async def start(self) -> None:
+        await self.websocket.connect()
+
+    async def stop(self) -> None:
+        await self.websocket.disconnect()
+
+    async def subscribe(self, callbacks: dict[str, BookCallback]) -> None:
+        self.callbacks.update(callbacks)
+        for slug in callbacks:
+            await self.websocket.subscribe_market(slug)
+
+    async def unsubscribe(self, asset_ids: list[str]) -> None:
+        for slug in asset_ids:
+            if self.callbacks.pop(slug, None) is not None:
+                await self.websocket.unsubscribe_market(slug)
+
+    def _on_orderbook(self, update: Any) -> None:
+        callback = self.callbacks.get(update.slug)
+        if callback is None:
+            return
+        callback(
+            update.slug,
+            {
+                "bids": update.bids,
+                "asks": update.asks,
+                "timestamp": int(update.timestamp.timestamp() * 1000),
+                "market_id": update.slug,
+            },
+        )
+
+
+class PollingFeed(OrderbookFeed):
+    """
+    Feed that polls an exchange's REST orderbook, for venues without a
+    market-data websocket (Kalshi, Opinion).
+
+    Every `interval_sec` each subscribed asset is fetched with
+    `exchange.get_orderbook(asset_id)` in a worker thread, at most
+    `max_concurrency` at a time. Callbacks fire only when the levels changed.
+    """
+
+    def __init__(self, exchange: Any, interval_sec: float = 1.0, max_concurrency: int = 8) -> None:
+        self.exchange = exchange
+        self.interval_sec = max(0.05, interval_sec)
+        self.callbacks: dict[str, BookCallback] = {}
+        self._last_levels: dict[str, tuple[list, list]] = {}
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self._task: asyncio.Task | None = None
+
+    @property
+    def assets(self) -> set[str]:
+        return set(self.callbacks)
+
+    async def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._poll_loop())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def subscribe(self, callbacks: dict[str, BookCallback]) -> None:
+        self.callbacks.update(callbacks)
+        await asyncio.gather(*(self.poll(asset_id) for asset_id in callbacks))
+
+    async def unsubscribe(self, asset_ids: list[str]) -> None:
+        for asset_id in asset_ids:
+            self.callbacks.pop(asset_id, None)
+            self._last_levels.pop(asset_id, None)
+
+    async def poll(self, asset_id: str) -> None:
+        """Fetch one asset's book and emit it if its levels changed."""
+        async with self._semaphore:
+            try:
+                data = await asyncio.to_thread(self.exchange.get_orderbook, asset_id)
+            except Exception as e:
+                logger.debug(f"Orderbook poll failed for {asset_id}: {e}")
+                return
+        callback = self.callbacks.get(asset_id)
+        if callback is None:
+            return
+        orderbook = Orderbook.from_rest_response(data or {}, token_id=asset_id)
+        levels = (orderbook.bids, orderbook.asks)
+        if self._last_levels.get(asset_id) == levels:
+            return
+        self._last_levels[asset_id] = levels
+        orderbook.timestamp = int(time.time() * 1000)
+        callback(asset_id, orderbook.to_dict())
+
+    async def _poll_loop(self) -> None:
+        while True:
+            started = time.monotonic()
+            await asyncio.gather(*(self.poll(asset_id) for asset_id in list(self.callbacks)))
+            await asyncio.sleep(max(0.0, self.interval_sec - (time.monotonic() - started)))
+
+
+def as_feed(source: Any) -> OrderbookFeed:
+    """
+    Wrap an exchange market-data object in the matching feed.
+
+    Args:
+        source: An OrderbookFeed, an OrderBookWebSocket, a LimitlessWebSocket,
+            or an exchange exposing get_orderbook (polled over REST)
+    """
+    if isinstance(source, OrderbookFeed):
+        return source
+    if hasattr(source, "on_orderbook") and hasattr(source, "subscribe_market"):
+        return LimitlessFeed(source)
+    if hasattr(source, "watch_orderbook") and hasattr(source, "subscriptions"):
+        return WebSocketFeed(source)
+    if hasattr(source, "get_orderbook"):
+        return PollingFeed(source)
+    raise TypeError(f"Cannot build an orderbook feed from {type(source).__name__}")
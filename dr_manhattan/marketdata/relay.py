@@ -0,0 +1,793 @@
+"""Orderbook relay: fan out upstream exchange feeds to local websocket clients.
+
+One relay fronts any number of exchange feeds behind a single endpoint.
+Assets are namespaced by feed, ``"<exchange>:<asset id>"``, e.g.
+``"polymarket:<clob token id>"`` or ``"kalshi:<ticker>"``. Clients subscribe
+with:
+
+    {"type": "subscribe", "assets": ["polymarket:<token id>", "kalshi:<ticker>"]}
+
+Each book is serialized once and queued into per-client mailboxes that keep
+only the latest book per asset; one writer task per client drains its mailbox,
+so a slow client never delays the others.
+
+Upstream subscriptions change incrementally: newly requested assets are
+subscribed on their feed, and assets no client wants are unsubscribed after
+``unsubscribe_grace_sec``. Cached books stay warm throughout, so a client that
+reconnects within the grace period gets an immediate replay.
+
+Clients can opt into the delta protocol by adding ``"protocol": "delta"`` to
+the subscribe message. They then receive a ``book_snapshot`` per asset
+followed by ``book_delta`` messages carrying only changed levels as
+``[price, size]`` pairs (size 0 removes the level). Every message has a
+per-asset ``seq``; a delta applies only on top of ``seq - 1``. A client that
+sees a gap sends ``{"type": "resync", "assets": [...]}`` and gets fresh
+snapshots. When a delta is coalesced or dropped for a slow client, the relay
+sends that client a snapshot instead, so the chain never breaks silently.
+
+Either protocol can be sent as JSON text (default) or as fixed-layout binary
+frames by adding ``"encoding": "binary"``; see ``relay_codec`` for the layout
+and ``relay_client`` for a decoder that yields ``Orderbook`` objects. Each
+message is serialized at most once per encoding in use.
+
+Same-host consumers can skip the websocket entirely: pass ``bus=`` a
+``SharedBookBus`` and every received book is also written to shared memory,
+where ``SharedBookReader`` processes read it directly.
+
+With ``snapshot_path`` set, cached books and upstream assets are checkpointed
+to SQLite every ``snapshot_interval_sec`` and on stop. A restarted relay
+reloads them, resubscribes the assets, and replays the old books with
+``"stale": true`` until fresh upstream data replaces them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import sys
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from dr_manhattan.runtime.latency import LatencyHistogram, LatencySummary, exchange_time_ns
+from dr_manhattan.utils import json_codec
+
+from .book_bus import SharedBookBus
+from .feeds import BookCallback, OrderbookFeed, as_feed
+from .relay_codec import (
+    ENCODERS,
+    ENCODING_JSON,
+    ENCODINGS,
+    PROTOCOL_BOOK,
+    PROTOCOL_DELTA,
+    PROTOCOLS,
+)
+from .relay_metrics import AssetCounters, AssetMetrics, ClientMetrics, RateCounter, RelayMetrics
+from .relay_snapshot import RelaySnapshotStore
+
+NAMESPACE_SEPARATOR = ":"
+
+
+def now_ms() -> int:
+    return time.time_ns() // 1_000_000
+
+
+def _level_map(levels: Any) -> dict[float, float]:
+    return {float(price): float(size) for price, size in levels or ()}
+
+
+def _level_changes(old: dict[float, float], new: dict[float, float]) -> list[tuple[float, float]]:
+    changes = [(price, size) for price, size in new.items() if old.get(price) != size]
+    changes.extend((price, 0.0) for price in old if price not in new)
+    return changes
+
+
+@dataclass(frozen=True)
+class RelayStats:
+    clients: int
+    source_assets: int
+    cached_books: int
+    books_received: int
+    books_sent: int
+    books_dropped: int
+    books_coalesced: int = 0
+    pending_unsubscribes: int = 0
+
+
+class _Frame:
+    """One outgoing message, serialized at most once per wire encoding."""
+
+    __slots__ = ("message", "_encoded")
+
+    def __init__(self, message: dict[str, Any]) -> None:
+        self.message = message
+        self._encoded: dict[str, str | bytes] = {}
+
+    def encode(self, encoding: str) -> str | bytes:
+        data = self._encoded.get(encoding)
+        if data is None:
+            data = self._encoded[encoding] = ENCODERS[encoding](self.message)
+        return data
+
+
+class _DeltaBook:
+    """Levels delta-protocol clients hold for one asset, as of `seq`."""
+
+    __slots__ = ("seq", "bids", "asks", "timestamp", "stale")
+
+    def __init__(self) -> None:
+        self.seq = 0
+        self.bids: dict[float, float] = {}
+        self.asks: dict[float, float] = {}
+        self.timestamp: Any = None
+        # Set when an update went by without delta subscribers to track it
+        self.stale = True
+
+    def reset(self, book: dict[str, Any]) -> None:
+        self.seq += 1
+        self.bids = _level_map(book.get("bids"))
+        self.asks = _level_map(book.get("asks"))
+        self.timestamp = book.get("timestamp")
+        self.stale = False
+
+
+class _ClientMailbox:
+    """Latest serialized book per asset for one client, drained by one writer task."""
+
+    def __init__(self, relay: "OrderbookRelay", client: Any) -> None:
+        self.relay = relay
+        self.client = client
+        # Insertion-ordered; a newer book for a queued asset replaces it in place
+        self.pending: dict[str, str | bytes] = {}
+        # Delta-protocol assets whose chain broke (a message was dropped)
+        self.resync: set[str] = set()
+        # perf_counter_ns when the upstream book behind each pending message arrived
+        self.queued_ns: dict[str, int] = {}
+        self.sent = RateCounter()
+        self.dropped = 0
+        self.coalesced = 0
+        self.latency = LatencyHistogram()
+        self._ready = asyncio.Event()
+        self.idle = asyncio.Event()
+        self.idle.set()
+        self.task: asyncio.Task | None = None
+
+    def put(
+        self,
+        asset: str,
+        message: str | bytes | None,
+        snapshot: Callable[[], str | bytes] | None = None,
+        queued_ns: int | None = None,
+    ) -> bool:
+        """Queue a message; returns True when it replaced an unsent one.
+
+        `snapshot` is given for delta messages: a delta only applies on top of
+        the previous message, so one that would replace or follow a lost
+        message is swapped for the full snapshot.
+        """
+        replaced = asset in self.pending
+        if snapshot is not None and (replaced or asset in self.resync):
+            message = snapshot()
+        if message is None:
+            return False
+        self.resync.discard(asset)
+        self.pending[asset] = message
+        if queued_ns is None:
+            self.queued_ns.pop(asset, None)
+        else:
+            self.queued_ns[asset] = queued_ns
+        self.idle.clear()
+        self._ready.set()
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self._run())
+        return replaced
+
+    async def _run(self) -> None:
+        relay = self.relay
+        while True:
+            await self._ready.wait()
+            while self.pending:
+                asset = next(iter(self.pending))
+                message = self.pending.pop(asset)
+                queued_ns = self.queued_ns.pop(asset, None)
+                if (
+                    relay._client_write_buffer_size(self.client)
+                    > relay.max_client_write_buffer_bytes
+                ):
+                    relay.books_dropped += 1
+                    self.dropped += 1
+                    self.resync.add(asset)
+                    continue
+                try:
+                    await self.client.send(message)
+                except Exception:
+                    self.pending.clear()
+                    self.idle.set()
+                    relay._drop_client(self.client)
+                    return
+                relay.books_sent += 1
+                self.sent.add()
+                counters = relay._asset_counters.get(asset)
+                if counters is not None:
+                    counters.sent += 1
+                if queued_ns is not None:
+                    elapsed_ns = time.perf_counter_ns() - queued_ns
+                    self.latency.record(elapsed_ns)
+                    if counters is not None:
+                        counters.receive_to_send.record(elapsed_ns)
+            self._ready.clear()
+            self.idle.set()
+
+
+def asset_key(namespace: str, asset_id: str) -> str:
+    return f"{namespace}{NAMESPACE_SEPARATOR}{asset_id}"
+
+
+def split_asset_key(key: str) -> tuple[str, str]:
+    """Split ``"<namespace>:<asset id>"``; asset IDs may themselves contain ':'."""
+    namespace, _, asset_id = key.partition(NAMESPACE_SEPARATOR)
+    return namespace, asset_id
+
+
+class OrderbookRelay:
+    """
+    Fan out orderbook feeds from several exchanges to many local clients.
+
+    Feeds can be given as OrderbookFeed instances or as anything as_feed
+    accepts: an OrderBookWebSocket, a LimitlessWebSocket, or an exchange to
+    poll over REST (Kalshi, Opinion).
+
+    Example:
+        relay = OrderbookRelay(
+            feeds={
+                "polymarket": polymarket.get_websocket(),
+                "predictfun": predictfun.get_websocket(),
+                "kalshi": kalshi,
+            }
+        )
+        await relay.start()
+        async with websockets.serve(relay.handle_client, "127.0.0.1", 8765):
+            ...
+    """
+
+    name = "orderbook_relay"
+
+    def __init__(
+        self,
+        feeds: Mapping[str, OrderbookFeed | Any] | None = None,
+        *,
+        verbose: bool = False,
+        stats_interval_sec: float = 30.0,
+        max_client_write_buffer_bytes: int = 512 * 1024,
+        unsubscribe_grace_sec: float = 30.0,
+        bus: SharedBookBus | None = None,
+        snapshot_path: str | Path | None = None,
+        snapshot_interval_sec: float = 30.0,
+    ) -> None:
+        self.verbose = verbose
+        self.bus = bus
+        self.snapshot_store = RelaySnapshotStore(snapshot_path) if snapshot_path else None
+        self.snapshot_interval_sec = max(0.0, snapshot_interval_sec)
+        self.feeds: dict[str, OrderbookFeed] = {
+            namespace: as_feed(feed) for namespace, feed in (feeds or {}).items()
+        }
+        self.stats_interval_sec = max(0.0, stats_interval_sec)
+        self.max_client_write_buffer_bytes = max(0, int(max_client_write_buffer_bytes))
+        self.unsubscribe_grace_sec = max(0.0, unsubscribe_grace_sec)
+        self.clients: set[Any] = set()
+        self.assets_by_client: dict[Any, set[str]] = {}
+        self.last_book_by_asset: dict[str, dict[str, Any]] = {}
+        self.mailboxes: dict[Any, _ClientMailbox] = {}
+        self.protocol_by_client: dict[Any, str] = {}
+        self.encoding_by_client: dict[Any, str] = {}
+        self._delta_books: dict[str, _DeltaBook] = {}
+        self._asset_counters: dict[str, AssetCounters] = {}
+        # Asset -> monotonic deadline after which it is unsubscribed upstream
+        self.pending_unsubscribes: dict[str, float] = {}
+        self._unsubscribe_task: asyncio.Task | None = None
+        self._stats_task: asyncio.Task | None = None
+        self._snapshot_task: asyncio.Task | None = None
+        self._source_lock = asyncio.Lock()
+        self.books_received = 0
+        self.books_sent = 0
+        self.books_dropped = 0
+        self.books_coalesced = 0
+
+    @property
+    def stats(self) -> RelayStats:
+        return RelayStats(
+            clients=len(self.clients),
+            source_assets=len(self._source_assets()),
+            cached_books=len(self.last_book_by_asset),
+            books_received=self.books_received,
+            books_sent=self.books_sent,
+            books_dropped=self.books_dropped,
+            books_coalesced=self.books_coalesced,
+            pending_unsubscribes=len(self.pending_unsubscribes),
+        )
+
+    def metrics(self) -> RelayMetrics:
+        """Per-client and per-asset counters, rates and latencies."""
+        subscribers: dict[str, int] = {}
+        clients = []
+        for client in list(self.clients):
+            assets = self.assets_by_client.get(client, set())
+            for asset in assets:
+                subscribers[asset] = subscribers.get(asset, 0) + 1
+            mailbox = self.mailboxes.get(client)
+            peer = getattr(client, "remote_address", None)
+            clients.append(
+                ClientMetrics(
+                    client=f"{peer[0]}:{peer[1]}" if peer else f"id-{id(client):x}",
+                    protocol=self.protocol_by_client.get(client, PROTOCOL_BOOK),
+                    encoding=self.encoding_by_client.get(client, ENCODING_JSON),
+                    assets=len(assets),
+                    sent=mailbox.sent.total if mailbox else 0,
+                    send_rate=mailbox.sent.rate() if mailbox else 0.0,
+                    dropped=mailbox.dropped if mailbox else 0,
+                    coalesced=mailbox.coalesced if mailbox else 0,
+                    pending=len(mailbox.pending) if mailbox else 0,
+                    write_buffer_bytes=self._client_write_buffer_size(client),
+                    receive_to_send=mailbox.latency.summary() if mailbox else LatencySummary(),
+                )
+            )
+        assets = [
+            AssetMetrics(
+                asset=asset,
+                subscribers=subscribers.get(asset, 0),
+                updates=counters.updates.total,
+                update_rate=counters.updates.rate(),
+                sent=counters.sent,
+                exchange_to_receive=counters.exchange_to_receive.summary(),
+                receive_to_send=counters.receive_to_send.summary(),
+            )
+            for asset, counters in sorted(self._asset_counters.items())
+        ]
+        return RelayMetrics(relay=self.name, stats=self.stats, clients=clients, assets=assets)
+
+    async def start(self) -> None:
+        await self._start_source()
+        if self.stats_interval_sec > 0:
+            self._stats_task = asyncio.create_task(self._stats_loop())
+        print(f"{self.name}_source_connected", file=sys.stderr, flush=True)
+        if self.snapshot_store is not None:
+            await self._restore_snapshot()
+            if self.snapshot_interval_sec > 0:
+                self._snapshot_task = asyncio.create_task(self._snapshot_loop())
+
+    async def stop(self) -> None:
+        if self._snapshot_task:
+            self._snapshot_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._snapshot_task
+            self._snapshot_task = None
+        if self.snapshot_store is not None:
+            await self.save_snapshot()
+        if self._stats_task:
+            self._stats_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._stats_task
+            self._stats_task = None
+        for client in list(self.mailboxes):
+            self._drop_client(client)
+        if self._unsubscribe_task:
+            self._unsubscribe_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._unsubscribe_task
+            self._unsubscribe_task = None
+        self.pending_unsubscribes.clear()
+        await self._stop_source()
+
+    async def save_snapshot(self) -> None:
+        """Checkpoint cached books and upstream assets to the snapshot store."""
+        if self.snapshot_store is None:
+            return
+        books = dict(self.last_book_by_asset)
+        assets = self._source_assets() | self._wanted_assets()
+        try:
+            await asyncio.to_thread(self.snapshot_store.save, books, assets, now_ms())
+        except Exception as e:
+            print(f"{self.name}_snapshot_failed error={e!r}", file=sys.stderr, flush=True)
+
+    async def _snapshot_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.snapshot_interval_sec)
+            await self.save_snapshot()
+
+    async def _restore_snapshot(self) -> None:
+        """Reload the last checkpoint: stale books for replay, assets resubscribed."""
+        snapshot = await asyncio.to_thread(self.snapshot_store.load)
+        assets = {asset for asset in snapshot.assets if self._accepts_asset(asset)}
+        for asset, payload in snapshot.books.items():
+            if asset in assets and asset not in self.last_book_by_asset:
+                self.last_book_by_asset[asset] = {**payload, "stale": True}
+        if assets:
+            async with self._source_lock:
+                new_assets = sorted(assets - self._source_assets())
+                if new_assets:
+                    await self._watch_source_assets(
+                        {asset: self._make_callback(asset) for asset in new_assets}
+                    )
+            # Released after the grace period unless a client asks for them again
+            self._schedule_unsubscribe(assets - self._wanted_assets())
+        age_ms = now_ms() - snapshot.saved_ms if snapshot.saved_ms else 0
+        print(
+            f"{self.name}_snapshot_restored "
+            f"books={len(self.last_book_by_asset)} assets={len(assets)} age_ms={age_ms}",
+            file=sys.stderr,
+            flush=True,
+        )
+
+    async def handle_client(self, websocket: Any) -> None:
+        self.clients.add(websocket)
+        self.assets_by_client[websocket] = set()
+        peer = getattr(websocket, "remote_address", None)
+        print(f"client_connected peer={peer}", file=sys.stderr, flush=True)
+        try:
+            async for message in websocket:
+                await self.handle_client_message(websocket, message)
+        finally:
+            self._drop_client(websocket)
+            print(f"client_disconnected peer={peer}", file=sys.stderr, flush=True)
+
+    async def handle_client_message(self, websocket: Any, message: str) -> None:
+        try:
+            payload = json_codec.loads(message)
+        except json.JSONDecodeError:
+            return
+        message_type = payload.get("type")
+        if message_type == "resync":
+            subscribed = self.assets_by_client.get(websocket, set())
+            requested = payload.get("assets")
+            assets = {str(a) for a in requested} & subscribed if requested else subscribed
+            self._replay(websocket, assets)
+            return
+        if message_type != "subscribe":
+            return
+        requested = {str(asset) for asset in payload.get("assets", []) if asset}
+        assets = {asset for asset in requested if self._accepts_asset(asset)}
+        protocol = payload.get("protocol", PROTOCOL_BOOK)
+        if protocol not in PROTOCOLS:
+            protocol = PROTOCOL_BOOK
+        encoding = payload.get("encoding", ENCODING_JSON)
+        if encoding not in ENCODINGS:
+            encoding = ENCODING_JSON
+        self.assets_by_client[websocket] = assets
+        self.protocol_by_client[websocket] = protocol
+        self.encoding_by_client[websocket] = encoding
+        await self._subscribe_client_assets()
+        reply = {
+            "type": "subscribed",
+            "assets": len(assets),
+            "protocol": protocol,
+            "encoding": encoding,
+            "ts_ms": now_ms(),
+        }
+        if requested != assets:
+            reply["rejected"] = sorted(requested - assets)
+        await websocket.send(json.dumps(reply))
+        self._replay(websocket, assets)
+        print(
+            f"client_subscribed assets={len(assets)} protocol={protocol} encoding={encoding}",
+            file=sys.stderr,
+            flush=True,
+        )
+
+    def _replay(self, websocket: Any, assets: set[str]) -> None:
+        """Queue the cached book (or delta snapshot) for each asset, replacing pending ones."""
+        delta = self.protocol_by_client.get(websocket) == PROTOCOL_DELTA
+        encoding = self.encoding_by_client.get(websocket, ENCODING_JSON)
+        for asset in sorted(assets):
+            cached = self.last_book_by_asset.get(asset)
+            if cached is None:
+                continue
+            if delta:
+                frame = self._delta_snapshot(asset, cached)
+            else:
+                frame = _Frame({**cached, "replay": True, "relay_sent_ms": now_ms()})
+            self._enqueue(websocket, asset, frame.encode(encoding))
+
+    # Upstream hooks; subclasses with a single source override these.
+
+    def _accepts_asset(self, asset: str) -> bool:
+        return split_asset_key(asset)[0] in self.feeds
+
+    def _source_assets(self) -> set[str]:
+        return {
+            asset_key(namespace, asset_id)
+            for namespace, feed in self.feeds.items()
+            for asset_id in feed.assets
+        }
+
+    async def _start_source(self) -> None:
+        for feed in self.feeds.values():
+            await feed.start()
+
+    async def _stop_source(self) -> None:
+        for feed in self.feeds.values():
+            await feed.stop()
+
+    async def _watch_source_assets(self, callbacks: dict[str, BookCallback]) -> None:
+        by_feed: dict[str, dict[str, BookCallback]] = {}
+        for key, callback in callbacks.items():
+            namespace, asset_id = split_asset_key(key)
+            by_feed.setdefault(namespace, {})[asset_id] = callback
+        for namespace, feed_callbacks in by_feed.items():
+            await self.feeds[namespace].subscribe(feed_callbacks)
+
+    async def _unwatch_source_assets(self, assets: list[str]) -> None:
+        by_feed: dict[str, list[str]] = {}
+        for key in assets:
+            namespace, asset_id = split_asset_key(key)
+            by_feed.setdefault(namespace, []).append(asset_id)
+        for namespace, asset_ids in by_feed.items():
+            await self.feeds[namespace].unsubscribe(asset_ids)
+
+    def _wanted_assets(self) -> set[str]:
+        return set().union(*self.assets_by_client.values()) if self.assets_by_client else set()
+
+    async def _subscribe_client_assets(self) -> None:
+        assets = self._wanted_assets()
+        # Wanted again before the grace period ran out: keep the upstream feed
+        for asset in assets:
+            self.pending_unsubscribes.pop(asset, None)
+        self._schedule_unsubscribe(self._source_assets() - assets)
+
+        async with self._source_lock:
+            new_assets = sorted(assets - self._source_assets())
+            if not new_assets:
+                return
+            await self._watch_source_assets(
+                {asset: self._make_callback(asset) for asset in new_assets}
+            )
+        print(
+            "source_subscribed "
+            f"assets={len(assets)} new_assets={len(new_assets)} "
+            f"total_assets={len(self._source_assets())}",
+            file=sys.stderr,
+            flush=True,
+        )
+
+    def _schedule_unsubscribe(self, assets: set[str]) -> None:
+        """Unsubscribe `assets` upstream once the grace period passes without a client."""
+        if not assets:
+            return
+        deadline = time.monotonic() + self.unsubscribe_grace_sec
+        for asset in assets:
+            self.pending_unsubscribes.setdefault(asset, deadline)
+        if self._unsubscribe_task is None or self._unsubscribe_task.done():
+            self._unsubscribe_task = asyncio.create_task(self._unsubscribe_loop())
+
+    async def _unsubscribe_loop(self) -> None:
+        while self.pending_unsubscribes:
+            delay = min(self.pending_unsubscribes.values()) - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            now = time.monotonic()
+            due = [
+                asset for asset, deadline in self.pending_unsubscribes.items() if deadline <= now
+            ]
+            for asset in due:
+                del self.pending_unsubscribes[asset]
+            try:
+                await self._unsubscribe_source_assets(due)
+            except Exception as exc:
+                # The assets stay subscribed; the next client change retries them
+                print(f"source_unsubscribe_failed error={exc!r}", file=sys.stderr, flush=True)
+
+    async def _unsubscribe_source_assets(self, assets: list[str]) -> None:
+        async with self._source_lock:
+            wanted = self._wanted_assets()
+            subscribed = self._source_assets()
+            stale = [a for a in assets if a not in wanted and a in subscribed]
+            if not stale:
+                return
+            await self._unwatch_source_assets(stale)
+            for asset in stale:
+                self.last_book_by_asset.pop(asset, None)
+                self._delta_books.pop(asset, None)
+                self._asset_counters.pop(asset, None)
+        print(
+            f"source_unsubscribed assets={len(stale)} total_assets={len(self._source_assets())}",
+            file=sys.stderr,
+            flush=True,
+        )
+
+    def _make_callback(self, asset: str) -> BookCallback:
+        def callback(_asset_id: str, orderbook: dict[str, Any]) -> None:
+            payload = {
+                "type": "book",
+                "asset_id": asset,
+                "relay_received_ms": now_ms(),
+                "book": orderbook,
+            }
+            self.last_book_by_asset[asset] = payload
+            self.books_received += 1
+            counters = self._asset_counters.get(asset)
+            if counters is None:
+                counters = self._asset_counters[asset] = AssetCounters()
+            counters.updates.add()
+            exchange_ns = exchange_time_ns(orderbook.get("timestamp"))
+            if exchange_ns:
+                counters.exchange_to_receive.record(time.time_ns() - exchange_ns)
+            if self.bus is not None:
+                self.bus.publish(asset, orderbook)
+            self.publish(asset, payload)
+
+        return callback
+
+    def publish(self, asset: str, payload: dict[str, Any]) -> None:
+        """Serialize a book once per encoding and queue it for clients subscribed to `asset`.
+
+        relay_sent_ms is stamped when the message is built, since the same bytes
+        go to every client using an encoding.
+        """
+        queued_ns = time.perf_counter_ns()
+        frame: _Frame | None = None
+        delta: tuple[_Frame | None, Callable[[], _Frame]] | None = None
+        for client in list(self.clients):
+            if asset not in self.assets_by_client.get(client, ()):
+                continue
+            encoding = self.encoding_by_client.get(client, ENCODING_JSON)
+            if self.protocol_by_client.get(client) == PROTOCOL_DELTA:
+                if delta is None:
+                    delta = self._encode_delta(asset, payload)
+                delta_frame, snapshot = delta
+                self._enqueue(
+                    client,
+                    asset,
+                    delta_frame.encode(encoding) if delta_frame is not None else None,
+                    lambda snapshot=snapshot, encoding=encoding: snapshot().encode(encoding),
+                    queued_ns,
+                )
+                continue
+            if frame is None:
+                frame = _Frame({**payload, "relay_sent_ms": now_ms()})
+            self._enqueue(client, asset, frame.encode(encoding), queued_ns=queued_ns)
+        if delta is None and asset in self._delta_books:
+            self._delta_books[asset].stale = True
+
+    def _encode_delta(
+        self, asset: str, payload: dict[str, Any]
+    ) -> tuple[_Frame | None, Callable[[], _Frame]]:
+        """Diff a book against the delta clients' levels once for all of them.
+
+        Returns the delta frame (None when no level changed) and a lazy, cached
+        snapshot frame for clients that cannot apply it.
+        """
+        book = payload.get("book") or {}
+        state = self._delta_books.get(asset)
+        if state is None:
+            state = self._delta_books[asset] = _DeltaBook()
+        received_ms = payload.get("relay_received_ms")
+        snapshot_frame: list[_Frame] = []
+
+        def snapshot() -> _Frame:
+            if not snapshot_frame:
+                snapshot_frame.append(self._snapshot_frame(asset, state, received_ms))
+            return snapshot_frame[0]
+
+        if state.stale:
+            state.reset(book)
+            return snapshot(), snapshot
+
+        bids = _level_map(book.get("bids"))
+        asks = _level_map(book.get("asks"))
+        bid_changes = _level_changes(state.bids, bids)
+        ask_changes = _level_changes(state.asks, asks)
+        if not bid_changes and not ask_changes:
+            return None, snapshot
+        state.seq += 1
+        state.bids, state.asks = bids, asks
+        state.timestamp = book.get("timestamp")
+        frame = _Frame(
+            {
+                "type": "book_delta",
+                "asset_id": asset,
+                "seq": state.seq,
+                "timestamp": state.timestamp,
+                "bids": bid_changes,
+                "asks": ask_changes,
+                "relay_received_ms": received_ms,
+                "relay_sent_ms": now_ms(),
+            }
+        )
+        return frame, snapshot
+
+    def _delta_snapshot(self, asset: str, cached: dict[str, Any]) -> _Frame:
+        state = self._delta_books.get(asset)
+        if state is None:
+            state = self._delta_books[asset] = _DeltaBook()
+        if state.stale:
+            state.reset(cached.get("book") or {})
+        frame = self._snapshot_frame(asset, state, cached.get("relay_received_ms"))
+        if cached.get("stale"):
+            # Restored from a checkpoint: the first fresh book goes out as a snapshot
+            frame.message["stale"] = True
+            state.stale = True
+        return frame
+
+    @staticmethod
+    def _snapshot_frame(asset: str, state: _DeltaBook, received_ms: Any) -> _Frame:
+        return _Frame(
+            {
+                "type": "book_snapshot",
+                "asset_id": asset,
+                "seq": state.seq,
+                "timestamp": state.timestamp,
+                "bids": sorted(state.bids.items(), reverse=True),
+                "asks": sorted(state.asks.items()),
+                "relay_received_ms": received_ms,
+                "relay_sent_ms": now_ms(),
+            }
+        )
+
+    async def broadcast(self, asset: str, payload: dict[str, Any]) -> None:
+        """Queue a book for subscribed clients; writers send it in the background."""
+        self.publish(asset, payload)
+
+    async def flush(self) -> None:
+        """Wait until every client mailbox has been drained."""
+        for mailbox in list(self.mailboxes.values()):
+            await mailbox.idle.wait()
+
+    def _enqueue(
+        self,
+        client: Any,
+        asset: str,
+        message: str | bytes | None,
+        snapshot: Callable[[], str | bytes] | None = None,
+        queued_ns: int | None = None,
+    ) -> None:
+        mailbox = self.mailboxes.get(client)
+        if mailbox is None:
+            mailbox = self.mailboxes[client] = _ClientMailbox(self, client)
+        if mailbox.put(asset, message, snapshot, queued_ns):
+            self.books_coalesced += 1
+            mailbox.coalesced += 1
+
+    def _drop_client(self, client: Any) -> None:
+        self.clients.discard(client)
+        assets = self.assets_by_client.pop(client, None)
+        self.protocol_by_client.pop(client, None)
+        self.encoding_by_client.pop(client, None)
+        if assets:
+            self._schedule_unsubscribe(assets - self._wanted_assets())
+        mailbox = self.mailboxes.pop(client, None)
+        if mailbox is not None and mailbox.task is not None:
+            if mailbox.task is not asyncio.current_task():
+                mailbox.task.cancel()
+            mailbox.idle.set()
+
+    @staticmethod
+    def _client_write_buffer_size(client: Any) -> int:
+        transport = getattr(client, "transport", None)
+        get_size = getattr(transport, "get_write_buffer_size", None)
+        if not callable(get_size):
+            return 0
+        try:
+            return int(get_size())
+        except Exception:
+            return 0
+
+    async def _stats_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.stats_interval_sec)
+            stats = self.stats
+            print(
+                f"{self.name}_stats "
+                f"clients={stats.clients} "
+                f"source_assets={stats.source_assets} "
+                f"cached_books={stats.cached_books} "
+                f"books_received={stats.books_received} "
+                f"books_sent={stats.books_sent} "
+                f"books_dropped={stats.books_dropped} "
+                f"books_coalesced={stats.books_coalesced} "
+                f"pending_unsubscribes={stats.pending_unsubscribes}",
+                file=sys.stderr,
+                flush=True,
+            )
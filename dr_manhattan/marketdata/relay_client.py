@@ -0,0 +1,143 @@
+"""Client-side helpers for consuming the orderbook relay.
+
+Example:
+    async for orderbook in stream_orderbooks("ws://127.0.0.1:8765", [token_id]):
+        print(orderbook.asset_id, orderbook.best_bid, orderbook.best_ask)
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import AsyncIterator, Iterable
+
+import websockets
+
+from dr_manhattan.models.orderbook import Orderbook
+
+from .relay_codec import (
+    ENCODING_BINARY,
+    PROTOCOL_DELTA,
+    RelayMessage,
+    decode_message,
+)
+
+
+class _ClientBook:
+    __slots__ = ("seq", "bids", "asks")
+
+    def __init__(self, message: RelayMessage) -> None:
+        self.seq = message.seq
+        self.bids = dict(message.bids)
+        self.asks = dict(message.asks)
+
+    def apply(self, message: RelayMessage) -> None:
+        for levels, changes in ((self.bids, message.bids), (self.asks, message.asks)):
+            for price, size in changes:
+                if size:
+                    levels[price] = size
+                else:
+                    levels.pop(price, None)
+        self.seq = message.seq
+
+
+class RelayBookDecoder:
+    """
+    Turn relay frames into Orderbook objects.
+
+    Handles both protocols and both encodings. For the delta protocol it keeps
+    the levels per asset, applies diffs in sequence, and records assets whose
+    chain has a gap in `resync_assets` until a new snapshot arrives.
+    """
+
+    def __init__(self) -> None:
+        self._books: dict[str, _ClientBook] = {}
+        # Assets awaiting a snapshot, and those not yet asked for
+        self.resync_assets: set[str] = set()
+        self._unrequested: set[str] = set()
+
+    def feed(self, data: str | bytes) -> Orderbook | None:
+        """
+        Decode one frame.
+
+        Returns:
+            The updated Orderbook, or None for control messages and deltas that
+            cannot be applied
+        """
+        message = decode_message(data)
+        if message is None:
+            return None
+        if message.type == "book":
+            return Orderbook(
+                bids=message.bids,
+                asks=message.asks,
+                timestamp=message.timestamp,
+                asset_id=message.asset_id,
+                market_id=message.market_id,
+            )
+
+        asset_id = message.asset_id
+        if message.type == "book_snapshot":
+            book = self._books[asset_id] = _ClientBook(message)
+            self.resync_assets.discard(asset_id)
+            self._unrequested.discard(asset_id)
+        else:
+            book = self._books.get(asset_id)
+            if book is None or message.seq != book.seq + 1:
+                if asset_id not in self.resync_assets:
+                    self.resync_assets.add(asset_id)
+                    self._unrequested.add(asset_id)
+                return None
+            book.apply(message)
+        return Orderbook(
+            bids=sorted(book.bids.items(), reverse=True),
+            asks=sorted(book.asks.items()),
+            timestamp=message.timestamp,
+            asset_id=asset_id,
+        )
+
+    def resync_message(self) -> str | None:
+        """Resync request for newly broken delta chains; each gap is requested once."""
+        if not self._unrequested:
+            return None
+        assets = sorted(self._unrequested)
+        self._unrequested.clear()
+        return json.dumps({"type": "resync", "assets": assets})
+
+
+def subscribe_message(
+    assets: Iterable[str], protocol: str = PROTOCOL_DELTA, encoding: str = ENCODING_BINARY
+) -> str:
+    return json.dumps(
+        {"type": "subscribe", "assets": list(assets), "protocol": protocol, "encoding": encoding}
+    )
+
+
+async def stream_orderbooks(
+    url: str,
+    assets: Iterable[str],
+    protocol: str = PROTOCOL_DELTA,
+    encoding: str = ENCODING_BINARY,
+) -> AsyncIterator[Orderbook]:
+    """
+    Connect to a relay and yield an Orderbook for every update.
+
+    Gaps in the delta chain are resynced automatically; the affected asset is
+    silent until its snapshot arrives.
+
+    Args:
+        url: Relay websocket URL
+        assets: Token IDs to subscribe to
+        protocol: "delta" (snapshot + diffs) or "book" (full book per update)
+        encoding: "binary" or "json"
+    """
+    decoder = RelayBookDecoder()
+    async with websockets.connect(url, max_size=None, compression=None) as websocket:
+        await websocket.send(subscribe_message(assets, protocol, encoding))
+        async for data in websocket:
+            orderbook = decoder.feed(data)
+            if orderbook is None:
+                resync = decoder.resync_message()
+                if resync is not None:
+                    await websocket.send(resync)
+                continue
+            yield orderbook
@@ -0,0 +1,181 @@
+"""Wire formats for orderbook relay messages.
+
+Clients pick a protocol and an encoding in the subscribe message:
+
+    {"type": "subscribe", "assets": [...], "protocol": "delta", "encoding": "binary"}
+
+The JSON encoding sends the dict messages as text frames. The binary encoding
+sends each book, snapshot or delta as one binary frame with a fixed layout
+(all little-endian):
+
+    header   version u8, kind u8, flags u8, pad u8,
+             asset_id length u16, market_id length u16,
+             seq u64, timestamp i64, relay_received_ms i64, relay_sent_ms i64,
+             bid count u32, ask count u32
+    asset_id UTF-8 bytes
+    market_id UTF-8 bytes
+    levels   (price f64, size f64) for every bid, then every ask
+
+Flags: 1 = replayed from the relay cache, 2 = stale (restored from a
+checkpoint, not yet refreshed upstream).
+
+Control messages (``subscribed``) stay JSON text in both encodings. Timestamps
+are carried as integers; 0 means unknown.
+"""
+
+from __future__ import annotations
+
+import struct
+from dataclasses import dataclass, field
+from itertools import chain
+from typing import Any
+
+from dr_manhattan.models.orderbook import PriceLevel
+from dr_manhattan.utils import json_codec
+
+PROTOCOL_BOOK = "book"
+PROTOCOL_DELTA = "delta"
+PROTOCOLS = (PROTOCOL_BOOK, PROTOCOL_DELTA)
+
+ENCODING_JSON = "json"
+ENCODING_BINARY = "binary"
+ENCODINGS = (ENCODING_JSON, ENCODING_BINARY)
+
+BINARY_VERSION = 1
+KIND_BOOK = 1
+KIND_SNAPSHOT = 2
+KIND_DELTA = 3
+FLAG_REPLAY = 1
+FLAG_STALE = 2
+
+_HEADER = struct.Struct("<BBBxHHQqqqII")
+_KIND_BY_TYPE = {"book": KIND_BOOK, "book_snapshot": KIND_SNAPSHOT, "book_delta": KIND_DELTA}
+_TYPE_BY_KIND = {kind: message_type for message_type, kind in _KIND_BY_TYPE.items()}
+
+
+@dataclass
+class RelayMessage:
+    """A decoded book, snapshot or delta message."""
+
+    type: str
+    asset_id: str
+    bids: list[PriceLevel] = field(default_factory=list)
+    asks: list[PriceLevel] = field(default_factory=list)
+    seq: int = 0
+    timestamp: int = 0
+    market_id: str = ""
+    relay_received_ms: int = 0
+    relay_sent_ms: int = 0
+    replay: bool = False
+    stale: bool = False
+
+
+def _int(value: Any) -> int:
+    try:
+        return int(float(value or 0))
+    except (TypeError, ValueError):
+        return 0
+
+
+def encode_json(message: dict[str, Any]) -> str:
+    return json_codec.dumps(message)
+
+
+def encode_binary(message: dict[str, Any]) -> bytes:
+    """Encode a relay book/snapshot/delta dict into one binary frame."""
+    kind = _KIND_BY_TYPE[message["type"]]
+    if kind == KIND_BOOK:
+        book = message.get("book") or {}
+        bids = book.get("bids") or ()
+        asks = book.get("asks") or ()
+        timestamp = book.get("timestamp")
+        market_id = book.get("market_id") or ""
+    else:
+        bids = message.get("bids") or ()
+        asks = message.get("asks") or ()
+        timestamp = message.get("timestamp")
+        market_id = ""
+    asset = str(message.get("asset_id", "")).encode()
+    market = str(market_id).encode()
+    header = _HEADER.pack(
+        BINARY_VERSION,
+        kind,
+        (FLAG_REPLAY if message.get("replay") else 0) | (FLAG_STALE if message.get("stale") else 0),
+        len(asset),
+        len(market),
+        message.get("seq", 0),
+        _int(timestamp),
+        _int(message.get("relay_received_ms")),
+        _int(message.get("relay_sent_ms")),
+        len(bids),
+        len(asks),
+    )
+    count = 2 * (len(bids) + len(asks))
+    levels = struct.pack(f"<{count}d", *chain.from_iterable(bids), *chain.from_iterable(asks))
+    return b"".join((header, asset, market, levels))
+
+
+ENCODERS = {ENCODING_JSON: encode_json, ENCODING_BINARY: encode_binary}
+
+
+def decode_binary(data: bytes) -> RelayMessage:
+    """Decode one binary frame produced by encode_binary."""
+    (
+        version,
+        kind,
+        flags,
+        asset_len,
+        market_len,
+        seq,
+        timestamp,
+        received_ms,
+        sent_ms,
+        bid_count,
+        ask_count,
+    ) = _HEADER.unpack_from(data)
+    if version != BINARY_VERSION or kind not in _TYPE_BY_KIND:
+        raise ValueError(f"Unsupported relay frame: version={version} kind={kind}")
+    offset = _HEADER.size
+    asset_id = bytes(data[offset : offset + asset_len]).decode()
+    offset += asset_len
+    market_id = bytes(data[offset : offset + market_len]).decode()
+    offset += market_len
+    values = iter(struct.unpack_from(f"<{2 * (bid_count + ask_count)}d", data, offset))
+    levels = list(zip(values, values))
+    return RelayMessage(
+        type=_TYPE_BY_KIND[kind],
+        asset_id=asset_id,
+        bids=levels[:bid_count],
+        asks=levels[bid_count:],
+        seq=seq,
+        timestamp=timestamp,
+        market_id=market_id,
+        relay_received_ms=received_ms,
+        relay_sent_ms=sent_ms,
+        replay=bool(flags & FLAG_REPLAY),
+        stale=bool(flags & FLAG_STALE),
+    )
+
+
+def decode_message(data: str | bytes) -> RelayMessage | None:
+    """Decode a relay frame in either encoding; control messages return None."""
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return decode_binary(data)
+    payload = json_codec.loads(data)
+    message_type = payload.get("type")
+    if message_type not in _KIND_BY_TYPE:
+        return None
+    source = (payload.get("book") or {}) if message_type == "book" else payload
+    return RelayMessage(
+        type=message_type,
+        asset_id=str(payload.get("asset_id", "")),
+        bids=[(price, size) for price, size in source.get("bids") or ()],
+        asks=[(price, size) for price, size in source.get("asks") or ()],
+        seq=payload.get("seq", 0),
+        timestamp=_int(source.get("timestamp")),
+        market_id=str(source.get("market_id") or ""),
+        relay_received_ms=_int(payload.get("relay_received_ms")),
+        relay_sent_ms=_int(payload.get("relay_sent_ms")),
+        replay=bool(payload.get("replay")),
+        stale=bool(payload.get("stale")),
+    )
@@ -0,0 +1,216 @@
+"""Per-client and per-asset relay metrics, served over HTTP on a side port.
+
+    GET /metrics       Prometheus text exposition
+    GET /metrics.json  the same data as JSON
+
+Counters are cumulative; ``*_rate`` values are per-second averages over the
+last ``RATE_WINDOW_SEC`` seconds. Latencies come from fixed power-of-two
+histograms (see ``runtime.latency``):
+
+    exchange_to_receive  exchange book timestamp -> relay receive (clock skew included)
+    receive_to_send      relay receive -> message written to the client socket
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from dr_manhattan.runtime.latency import LatencyHistogram, LatencySummary
+from dr_manhattan.utils import json_codec
+
+if TYPE_CHECKING:
+    from .relay import OrderbookRelay, RelayStats
+
+RATE_WINDOW_SEC = 10
+
+
+class RateCounter:
+    """Cumulative count plus a per-second rate over a sliding window of 1 s buckets."""
+
+    __slots__ = ("total", "_buckets", "_second")
+
+    def __init__(self) -> None:
+        self.total = 0
+        self._buckets = [0] * RATE_WINDOW_SEC
+        self._second = int(time.monotonic())
+
+    def _advance(self, second: int) -> None:
+        # Zero the buckets for seconds with no samples since the last add
+        for skipped in range(second - min(second - self._second, RATE_WINDOW_SEC) + 1, second + 1):
+            self._buckets[skipped % RATE_WINDOW_SEC] = 0
+        self._second = second
+
+    def add(self, count: int = 1) -> None:
+        second = int(time.monotonic())
+        if second != self._second:
+            self._advance(second)
+        self._buckets[second % RATE_WINDOW_SEC] += count
+        self.total += count
+
+    def rate(self) -> float:
+        second = int(time.monotonic())
+        if second != self._second:
+            self._advance(second)
+        return sum(self._buckets) / RATE_WINDOW_SEC
+
+
+class AssetCounters:
+    """Live counters for one relayed asset."""
+
+    __slots__ = ("updates", "sent", "exchange_to_receive", "receive_to_send")
+
+    def __init__(self) -> None:
+        self.updates = RateCounter()
+        self.sent = 0
+        self.exchange_to_receive = LatencyHistogram()
+        self.receive_to_send = LatencyHistogram()
+
+
+@dataclass(frozen=True)
+class ClientMetrics:
+    client: str
+    protocol: str
+    encoding: str
+    assets: int
+    sent: int
+    send_rate: float
+    dropped: int
+    coalesced: int
+    pending: int
+    write_buffer_bytes: int
+    receive_to_send: LatencySummary = LatencySummary()
+
+
+@dataclass(frozen=True)
+class AssetMetrics:
+    asset: str
+    subscribers: int
+    updates: int
+    update_rate: float
+    sent: int
+    exchange_to_receive: LatencySummary = LatencySummary()
+    receive_to_send: LatencySummary = LatencySummary()
+
+
+@dataclass(frozen=True)
+class RelayMetrics:
+    relay: str
+    stats: RelayStats
+    clients: list[ClientMetrics] = field(default_factory=list)
+    assets: list[AssetMetrics] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_prometheus(metrics: RelayMetrics) -> str:
+    """Render metrics in the Prometheus text exposition format."""
+    prefix = metrics.relay
+    lines = []
+
+    def sample(name: str, value: float, labels: str = "") -> None:
+        lines.append(
+            f"{prefix}_{name}{{{labels}}} {value}" if labels else f"{prefix}_{name} {value}"
+        )
+
+    def latency(name: str, summary: LatencySummary, labels: str) -> None:
+        for quantile, value in (
+            ("0.5", summary.p50_ms),
+            ("0.9", summary.p90_ms),
+            ("0.99", summary.p99_ms),
+        ):
+            sample(f"{name}_ms", value, f'{labels},quantile="{quantile}"')
+        sample(f"{name}_ms_count", summary.count, labels)
+        sample(f"{name}_ms_max", summary.max_ms, labels)
+
+    for name, value in asdict(metrics.stats).items():
+        sample(name, value)
+    for client in metrics.clients:
+        labels = (
+            f'client="{_label(client.client)}",protocol="{client.protocol}",'
+            f'encoding="{client.encoding}"'
+        )
+        sample("client_assets", client.assets, labels)
+        sample("client_sent_total", client.sent, labels)
+        sample("client_send_rate", client.send_rate, labels)
+        sample("client_dropped_total", client.dropped, labels)
+        sample("client_coalesced_total", client.coalesced, labels)
+        sample("client_pending", client.pending, labels)
+        sample("client_write_buffer_bytes", client.write_buffer_bytes, labels)
+        latency("client_receive_to_send", client.receive_to_send, labels)
+    for asset in metrics.assets:
+        labels = f'asset="{_label(asset.asset)}"'
+        sample("asset_subscribers", asset.subscribers, labels)
+        sample("asset_updates_total", asset.updates, labels)
+        sample("asset_update_rate", asset.update_rate, labels)
+        sample("asset_sent_total", asset.sent, labels)
+        latency("asset_exchange_to_receive", asset.exchange_to_receive, labels)
+        latency("asset_receive_to_send", asset.receive_to_send, labels)
+    return "\n".join(lines) + "\n"
+
+
+class MetricsServer:
+    """
+    Minimal HTTP server exposing a relay's metrics.
+
+    Example:
+        server = MetricsServer(relay, port=9108)
+        await server.start()
+    """
+
+    def __init__(self, relay: OrderbookRelay, host: str = "127.0.0.1", port: int = 9108) -> None:
+        self.relay = relay
+        self.host = host
+        self.port = port
+        self._server: asyncio.AbstractServer | None = None
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        if not self.port:
+            self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), timeout=5.0)
+            method, path, *_ = request.split(b"\r\n", 1)[0].decode("latin-1").split(" ")
+            path = path.split("?", 1)[0]
+            if method != "GET" or path not in ("/metrics", "/metrics.json"):
+                status, content_type, body = "404 Not Found", "text/plain", "not found\n"
+            elif path == "/metrics.json":
+                body = json_codec.dumps(self.relay.metrics().to_dict())
+                status, content_type = "200 OK", "application/json"
+            else:
+                body = format_prometheus(self.relay.metrics())
+                status, content_type = "200 OK", "text/plain; version=0.0.4"
+            data = body.encode()
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                f"Content-Length: {len(data)}\r\nConnection: close\r\n\r\n".encode()
+                + data
+            )
+            await writer.drain()
+        except (
+            asyncio.IncompleteReadError,
+            asyncio.LimitOverrunError,
+            asyncio.TimeoutError,
+            ValueError,
+        ):
+            pass
+        finally:
+            writer.close()
+            with contextlib.suppress(Exception):
+                await writer.wait_closed()
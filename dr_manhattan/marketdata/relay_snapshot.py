@@ -0,0 +1,110 @@
+"""SQLite checkpoints of the relay's cached books for warm restarts.
+
+The relay periodically saves every cached book message plus the set of
+upstream assets; on startup it reloads them, marks the books stale, and
+resubscribes the assets, so clients reconnecting after a deploy get an
+immediate (stale) replay instead of nothing until upstream resends.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from dr_manhattan.utils import json_codec
+
+SNAPSHOT_SCHEMA_VERSION = 1
+
+RELAY_SNAPSHOT_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshot_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS books (
+    asset TEXT PRIMARY KEY,
+    payload_json TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS assets (
+    asset TEXT PRIMARY KEY
+);
+"""
+
+
+@dataclass(frozen=True)
+class RelaySnapshot:
+    saved_ms: int = 0
+    books: dict[str, dict[str, Any]] = field(default_factory=dict)
+    assets: frozenset[str] = frozenset()
+
+
+class RelaySnapshotStore:
+    """
+    One SQLite file holding the latest relay checkpoint.
+
+    Each save replaces the previous checkpoint in a single transaction, so a
+    crash mid-save leaves the last complete one in place. Methods block and
+    are meant to run in a worker thread.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), timeout=1.0)
+        conn.executescript(RELAY_SNAPSHOT_SCHEMA)
+        return conn
+
+    def save(
+        self,
+        books: Mapping[str, dict[str, Any]],
+        assets: Iterable[str],
+        saved_ms: int,
+    ) -> None:
+        rows = [(asset, json_codec.dumps(payload)) for asset, payload in books.items()]
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM books")
+                conn.execute("DELETE FROM assets")
+                conn.executemany("INSERT INTO books(asset, payload_json) VALUES (?, ?)", rows)
+                conn.executemany(
+                    "INSERT INTO assets(asset) VALUES (?)", [(asset,) for asset in set(assets)]
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO snapshot_meta(key, value) VALUES (?, ?)",
+                    [
+                        ("schema_version", str(SNAPSHOT_SCHEMA_VERSION)),
+                        ("saved_ms", str(saved_ms)),
+                    ],
+                )
+        finally:
+            conn.close()
+
+    def load(self) -> RelaySnapshot:
+        """Return the last checkpoint; empty if there is none or it is unreadable."""
+        if not self.path.exists():
+            return RelaySnapshot()
+        try:
+            conn = self._connect()
+        except sqlite3.DatabaseError:
+            return RelaySnapshot()
+        try:
+            meta = dict(conn.execute("SELECT key, value FROM snapshot_meta"))
+            if meta.get("schema_version") != str(SNAPSHOT_SCHEMA_VERSION):
+                return RelaySnapshot()
+            books = {}
+            for asset, payload_json in conn.execute("SELECT asset, payload_json FROM books"):
+                try:
+                    books[asset] = json_codec.loads(payload_json)
+                except json_codec.JSONDecodeError:
+                    continue
+            assets = frozenset(asset for (asset,) in conn.execute("SELECT asset FROM assets"))
+            return RelaySnapshot(int(meta.get("saved_ms") or 0), books, assets)
+        except sqlite3.DatabaseError:
+            return RelaySnapshot()
+        finally:
+            conn.close()
@@ -2,7 +2,7 @@ from .crypto_hourly import CryptoHourlyMarket
 from .market import ExchangeOutcomeRef, Market, OutcomeRef, OutcomeToken, parse_market_datetime
 from .nav import NAV, PositionBreakdown
 from .order import Order, OrderSide, OrderStatus, OrderTimeInForce
-from .orderbook import Orderbook, PriceLevel
+from .orderbook import Orderbook, PriceLevel, TickOrderbook, TickOrderbookManager, TopOfBook
 from .position import Position
 
 __all__ = [
@@ -17,6 +17,9 @@ __all__ = [
     "OrderTimeInForce",
     "Orderbook",
     "PriceLevel",
+    "TickOrderbook",
+    "TickOrderbookManager",
+    "TopOfBook",
     "Position",
     "CryptoHourlyMarket",
     "NAV",
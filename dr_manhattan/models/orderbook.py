@@ -1,9 +1,43 @@
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from itertools import accumulate, islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
 
 # Price level: (price, size)
 PriceLevel = Tuple[float, float]
 
+# Integer ticks per 1.0 of price. Exact for every venue tick size (0.1 .. 0.0001),
+# so float prices parsed from the same string always land on the same level.
+PRICE_TICK_SCALE = 1_000_000
+
+
+def price_to_tick(price: float) -> int:
+    """Convert a price to its integer tick index."""
+    return int(round(price * PRICE_TICK_SCALE))
+
+
+def parse_price_levels(levels: Iterable[Dict[str, Any]]) -> List[PriceLevel]:
+    """
+    Convert wire levels ({"price": "0.52", "size": "100"}) to (price, size) tuples.
+
+    Levels that are malformed or have a non-positive price or size are dropped.
+    The result keeps input order; callers sort as needed.
+    """
+    parsed: List[PriceLevel] = []
+    append = parsed.append
+    for level in levels:
+        try:
+            price = float(level["price"])
+            size = float(level["size"])
+        except (KeyError, ValueError, TypeError):
+            continue
+        if price > 0 and size > 0:
+            append((price, size))
+    return parsed
+
 
 @dataclass
 class Orderbook:
@@ -46,26 +80,8 @@ class Orderbook:
 
         REST format: {"bids": [{"price": "0.5", "size": "100"}, ...], "asks": [...]}
         """
-        bids: List[PriceLevel] = []
-        asks: List[PriceLevel] = []
-
-        for bid in data.get("bids", []):
-            try:
-                price = float(bid.get("price", 0))
-                size = float(bid.get("size", 0))
-                if price > 0 and size > 0:
-                    bids.append((price, size))
-            except (ValueError, TypeError):
-                continue
-
-        for ask in data.get("asks", []):
-            try:
-                price = float(ask.get("price", 0))
-                size = float(ask.get("size", 0))
-                if price > 0 and size > 0:
-                    asks.append((price, size))
-            except (ValueError, TypeError):
-                continue
+        bids = parse_price_levels(data.get("bids") or ())
+        asks = parse_price_levels(data.get("asks") or ())
 
         # Sort: bids descending, asks ascending
         bids.sort(reverse=True)
@@ -84,14 +100,157 @@ class Orderbook:
         }
 
 
+BOOK_SIDES = ("bids", "asks")
+
+
+def _check_side(side: str) -> None:
+    if side not in BOOK_SIDES:
+        raise ValueError(f"side must be 'bids' or 'asks', got {side!r}")
+
+
+class _SideDepth:
+    """
+    Prefix sums over one side's levels (best-first).
+
+    Levels can be truncated and re-extended from any position, so a book that
+    changed deep in the side only recomputes the sums from that level on.
+    """
+
+    __slots__ = ("levels", "descending", "keys", "sizes", "notionals")
+
+    def __init__(self, levels: Iterable[PriceLevel] = (), descending: bool = False):
+        self.levels: List[PriceLevel] = []
+        self.descending = descending
+        # Ascending keys for bisect: bids are stored best-first (descending), so negate
+        self.keys: List[float] = []
+        self.sizes: List[float] = []
+        self.notionals: List[float] = []
+        self.extend(levels)
+
+    def truncate(self, count: int) -> None:
+        del self.levels[count:], self.keys[count:], self.sizes[count:], self.notionals[count:]
+
+    def extend(self, levels: Iterable[PriceLevel]) -> None:
+        added = list(levels)
+        if not added:
+            return
+        self.levels.extend(added)
+        prices = [level[0] for level in added]
+        self.keys.extend([-price for price in prices] if self.descending else prices)
+        size_total = self.sizes[-1] if self.sizes else 0.0
+        notional_total = self.notionals[-1] if self.notionals else 0.0
+        self.sizes.extend(
+            islice(accumulate((level[1] for level in added), initial=size_total), 1, None)
+        )
+        self.notionals.extend(
+            islice(accumulate((p * q for p, q in added), initial=notional_total), 1, None)
+        )
+
+    def depth_through(self, price: float) -> float:
+        count = bisect_right(self.keys, -price if self.descending else price)
+        return self.sizes[count - 1] if count else 0.0
+
+    def depth_top(self, levels: Optional[int]) -> float:
+        if not self.sizes:
+            return 0.0
+        if levels is None or levels >= len(self.sizes):
+            return self.sizes[-1]
+        return self.sizes[levels - 1] if levels > 0 else 0.0
+
+    def notional_for_size(self, size: float) -> Optional[float]:
+        index = bisect_left(self.sizes, size)
+        if index == len(self.sizes):
+            return None
+        prev_size = self.sizes[index - 1] if index else 0.0
+        prev_notional = self.notionals[index - 1] if index else 0.0
+        return prev_notional + (size - prev_size) * self.levels[index][0]
+
+    def size_for_notional(self, notional: float) -> Optional[float]:
+        index = bisect_left(self.notionals, notional)
+        if index == len(self.notionals):
+            return None
+        prev_size = self.sizes[index - 1] if index else 0.0
+        prev_notional = self.notionals[index - 1] if index else 0.0
+        return prev_size + (notional - prev_notional) / self.levels[index][0]
+
+
+@dataclass(frozen=True)
+class TopOfBook:
+    """Compact top-of-book event: the best `depth` levels on each side."""
+
+    asset_id: str
+    bids: Tuple[PriceLevel, ...] = ()  # Best first
+    asks: Tuple[PriceLevel, ...] = ()  # Best first
+    timestamp: Any = 0
+    market_id: str = ""
+
+    @property
+    def best_bid(self) -> float | None:
+        """Get best bid price."""
+        return self.bids[0][0] if self.bids else None
+
+    @property
+    def best_ask(self) -> float | None:
+        """Get best ask price."""
+        return self.asks[0][0] if self.asks else None
+
+    @property
+    def mid_price(self) -> float | None:
+        """Get mid price."""
+        if self.best_bid is None or self.best_ask is None:
+            return None
+        return (self.best_bid + self.best_ask) / 2
+
+    @property
+    def spread(self) -> float | None:
+        """Get bid-ask spread."""
+        if self.best_bid is None or self.best_ask is None:
+            return None
+        return self.best_ask - self.best_bid
+
+    def same_levels(self, other: Optional["TopOfBook"]) -> bool:
+        """Check whether both events carry the same top levels, sizes included."""
+        return other is not None and self.bids == other.bids and self.asks == other.asks
+
+    def same_prices(self, other: Optional["TopOfBook"]) -> bool:
+        """Check whether both events carry the same top prices, ignoring sizes."""
+        return (
+            other is not None
+            and [level[0] for level in self.bids] == [level[0] for level in other.bids]
+            and [level[0] for level in self.asks] == [level[0] for level in other.asks]
+        )
+
+    @classmethod
+    def from_orderbook(
+        cls, orderbook: Dict[str, Any], asset_id: str = "", depth: int = 1
+    ) -> "TopOfBook":
+        """Build from an orderbook dict with best-first (price, size) levels."""
+        depth = max(1, depth)
+        return cls(
+            asset_id=orderbook.get("asset_id") or asset_id,
+            bids=tuple((level[0], level[1]) for level in orderbook.get("bids", [])[:depth]),
+            asks=tuple((level[0], level[1]) for level in orderbook.get("asks", [])[:depth]),
+            timestamp=orderbook.get("timestamp", 0),
+            market_id=orderbook.get("market_id", ""),
+        )
+
+
 class OrderbookManager:
     """
     Helper class to manage multiple orderbooks efficiently.
     Stores orderbooks for multiple tokens and provides easy access.
+
+    Depth queries (cumulative depth, VWAP, price impact, imbalance) bisect
+    per-side prefix sums, so each query costs O(log depth). Books fed from a
+    DepthBook (BookLevels sides) keep those sums in the BookSide and recompute
+    them only from the shallowest changed level; plain level lists are summed
+    once per replacement and cached until the next one.
     """
 
     def __init__(self):
         self.orderbooks: Dict[str, Dict[str, List[PriceLevel]]] = {}
+        # (token_id, side) -> (source level list, prefix sums built from it)
+        self._depth_cache: Dict[Tuple[str, str], Tuple[Any, _SideDepth]] = {}
 
     def update(self, token_id: str, orderbook: Dict[str, List[PriceLevel]]):
         """Update orderbook for a token."""
@@ -125,3 +284,712 @@ class OrderbookManager:
     def has_all_data(self, token_ids: List[str]) -> bool:
         """Check if we have orderbook data for all tokens."""
         return all(self.has_data(tid) for tid in token_ids)
+
+    def _side_depth(self, token_id: str, side: str) -> Optional[_SideDepth]:
+        _check_side(side)
+        orderbook = self.get(token_id)
+        if not orderbook:
+            self._depth_cache.pop((token_id, side), None)
+            return None
+        levels = orderbook.get(side, [])
+        if isinstance(levels, BookLevels):
+            # Incremental books maintain their own prefix sums per delta
+            self._depth_cache.pop((token_id, side), None)
+            return levels.side.depth()
+        cached = self._depth_cache.get((token_id, side))
+        # Books are replaced, not mutated, on update, so identity marks a new version
+        if cached is None or cached[0] is not levels:
+            cached = (levels, _SideDepth(levels, descending=side == "bids"))
+            self._depth_cache[(token_id, side)] = cached
+        return cached[1]
+
+    def get_cumulative_depth(self, token_id: str, side: str, price: float) -> float:
+        """
+        Total size resting at the given price or better.
+
+        Args:
+            token_id: Token ID
+            side: "bids" or "asks"
+            price: Limit price
+
+        Returns:
+            Cumulative size (0.0 if no data)
+        """
+        depth = self._side_depth(token_id, side)
+        return depth.depth_through(price) if depth else 0.0
+
+    def get_vwap(self, token_id: str, side: str, size: float) -> Optional[float]:
+        """
+        Volume-weighted average price for taking `size` from one side.
+
+        Args:
+            token_id: Token ID
+            side: "asks" to price a buy, "bids" to price a sell
+            size: Size to fill
+
+        Returns:
+            Average fill price, or None if the side cannot fill `size`
+        """
+        depth = self._side_depth(token_id, side)
+        if depth is None or size <= 0:
+            return None
+        notional = depth.notional_for_size(size)
+        return notional / size if notional is not None else None
+
+    def get_price_impact(self, token_id: str, side: str, notional: float) -> Optional[float]:
+        """
+        Relative slippage of spending `notional` against one side.
+
+        Args:
+            token_id: Token ID
+            side: "asks" to price a buy, "bids" to price a sell
+            notional: Amount to trade in quote currency (price * size)
+
+        Returns:
+            (VWAP - best) / best for asks, (best - VWAP) / best for bids,
+            or None if the side cannot absorb `notional`
+        """
+        depth = self._side_depth(token_id, side)
+        if depth is None or notional <= 0:
+            return None
+        size = depth.size_for_notional(notional)
+        if not size:
+            return None
+        best = depth.levels[0][0]
+        vwap = notional / size
+        return (vwap - best) / best if side == "asks" else (best - vwap) / best
+
+    def get_imbalance(self, token_id: str, levels: Optional[int] = None) -> Optional[float]:
+        """
+        Order book imbalance (bid_depth - ask_depth) / (bid_depth + ask_depth).
+
+        Args:
+            token_id: Token ID
+            levels: Number of top levels per side to include (None = all)
+
+        Returns:
+            Imbalance in [-1, 1], or None if the book is empty
+        """
+        bids = self._side_depth(token_id, "bids")
+        asks = self._side_depth(token_id, "asks")
+        if bids is None or asks is None:
+            return None
+        bid_depth = bids.depth_top(levels)
+        ask_depth = asks.depth_top(levels)
+        total = bid_depth + ask_depth
+        if total <= 0:
+            return None
+        return (bid_depth - ask_depth) / total
+
+
+# Shared read-only price grids, one per tick size
+_PRICE_GRIDS: Dict[float, np.ndarray] = {}
+
+
+def _price_grid(tick_size: float) -> np.ndarray:
+    grid = _PRICE_GRIDS.get(tick_size)
+    if grid is None:
+        grid = np.round(np.arange(int(round(1.0 / tick_size)) + 1) * tick_size, 10)
+        grid.flags.writeable = False
+        _PRICE_GRIDS[tick_size] = grid
+    return grid
+
+
+def _readonly(array: np.ndarray) -> np.ndarray:
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+class TickOrderbook:
+    """
+    Orderbook on the fixed 0-1 price grid, backed by NumPy size buffers.
+
+    Level i holds price i * tick_size, so level updates are O(1) array writes and
+    depth/VWAP queries are vectorized. Prices off the grid are rounded to the
+    nearest tick, so use the venue's smallest tick size.
+
+    The buffers only span the book's active price window (plus WINDOW_PADDING
+    ticks each way), not the whole 0-1 grid: a book quoted around 0.50 at tick
+    0.001 stores about a hundred levels, not a thousand. A write outside the
+    window grows it; replace() re-fits it to the new levels.
+
+    Example:
+        >>> book = TickOrderbook(tick_size=0.01)
+        >>> book.replace(bids=[(0.48, 100)], asks=[(0.52, 50)])
+        >>> book.best_bid, book.best_ask
+        (0.48, 0.52)
+    """
+
+    # Spare ticks allocated beyond the outermost levels when the window is resized
+    WINDOW_PADDING = 16
+
+    __slots__ = (
+        "tick_size",
+        "asset_id",
+        "market_id",
+        "timestamp",
+        "_grid",
+        "_lo",
+        "_bid_sizes",
+        "_ask_sizes",
+        "_best_bid",
+        "_best_ask",
+    )
+
+    def __init__(
+        self,
+        tick_size: float = 0.001,
+        asset_id: str = "",
+        market_id: str = "",
+        timestamp: Any = 0,
+    ):
+        if not 0 < tick_size <= 1:
+            raise ValueError("tick_size must be in (0, 1]")
+        self.tick_size = tick_size
+        self.asset_id = asset_id
+        self.market_id = market_id
+        self.timestamp = timestamp
+        self._grid = _price_grid(tick_size)
+        # Buffers cover grid indices [_lo, _lo + len(buffer))
+        self._lo = 0
+        self._bid_sizes = np.zeros(0)
+        self._ask_sizes = np.zeros(0)
+        # Best level grid indices; -1 / len(grid) mean the side is empty
+        self._best_bid = -1
+        self._best_ask = len(self._grid)
+
+    @property
+    def prices(self) -> np.ndarray:
+        """Prices of the active window, aligned with the size buffers."""
+        return self._grid[self._lo : self._lo + len(self._bid_sizes)]
+
+    def _index(self, price: float) -> Optional[int]:
+        index = int(round(price / self.tick_size))
+        if 0 < index < len(self._grid):
+            return index
+        return None
+
+    def _resize(self, lo: int, hi: int, keep: bool = True) -> None:
+        """Re-allocate the buffers to span grid indices [lo, hi] plus padding."""
+        lo = max(lo - self.WINDOW_PADDING, 0)
+        hi = min(hi + self.WINDOW_PADDING, len(self._grid) - 1)
+        bid_sizes = np.zeros(hi - lo + 1)
+        ask_sizes = np.zeros(hi - lo + 1)
+        if keep and len(self._bid_sizes):
+            # The new window always contains the old one when keeping levels
+            start = self._lo - lo
+            bid_sizes[start : start + len(self._bid_sizes)] = self._bid_sizes
+            ask_sizes[start : start + len(self._ask_sizes)] = self._ask_sizes
+        self._lo = lo
+        self._bid_sizes = bid_sizes
+        self._ask_sizes = ask_sizes
+
+    def _ensure(self, index: int) -> int:
+        """Grow the window to include a grid index; return its buffer offset."""
+        hi = self._lo + len(self._bid_sizes) - 1
+        if not len(self._bid_sizes):
+            self._resize(index, index, keep=False)
+        elif index < self._lo or index > hi:
+            self._resize(min(index, self._lo), max(index, hi))
+        return index - self._lo
+
+    def _parse_levels(self, levels: Iterable[Any]) -> Tuple[np.ndarray, np.ndarray]:
+        pairs = [
+            (level.get("price", 0), level.get("size", 0)) if isinstance(level, dict) else level
+            for level in levels
+        ]
+        if not pairs:
+            return np.zeros(0, dtype=np.intp), np.zeros(0)
+        data = np.asarray(pairs, dtype=float).reshape(-1, 2)
+        indices = np.rint(data[:, 0] / self.tick_size).astype(np.intp)
+        mask = (indices > 0) & (indices < len(self._grid)) & (data[:, 1] > 0)
+        return indices[mask], data[mask, 1]
+
+    def _find_best_bid(self, below: int) -> int:
+        nonzero = np.flatnonzero(self._bid_sizes[: max(below - self._lo, 0)])
+        return self._lo + int(nonzero[-1]) if nonzero.size else -1
+
+    def _find_best_ask(self, above: int) -> int:
+        start = max(above - self._lo, 0)
+        nonzero = np.flatnonzero(self._ask_sizes[start:])
+        return self._lo + start + int(nonzero[0]) if nonzero.size else len(self._grid)
+
+    def replace(self, bids: Iterable[Any] = (), asks: Iterable[Any] = ()) -> None:
+        """Replace both sides from (price, size) levels or {"price", "size"} dicts."""
+        bid_indices, bid_sizes = self._parse_levels(bids)
+        ask_indices, ask_sizes = self._parse_levels(asks)
+        indices = np.concatenate((bid_indices, ask_indices))
+        if indices.size:
+            self._resize(int(indices.min()), int(indices.max()), keep=False)
+        else:
+            self._lo = 0
+            self._bid_sizes = np.zeros(0)
+            self._ask_sizes = np.zeros(0)
+        self._bid_sizes[bid_indices - self._lo] = bid_sizes
+        self._ask_sizes[ask_indices - self._lo] = ask_sizes
+        self._best_bid = self._find_best_bid(len(self._grid))
+        self._best_ask = self._find_best_ask(0)
+
+    def _offset(self, index: int) -> Optional[int]:
+        offset = index - self._lo
+        return offset if 0 <= offset < len(self._bid_sizes) else None
+
+    def set_bid(self, price: float, size: float) -> None:
+        """Set bid size at a price; size <= 0 removes the level."""
+        index = self._index(price)
+        if index is None:
+            return
+        if size > 0:
+            offset = self._ensure(index)
+            self._bid_sizes[offset] = size
+            if index > self._best_bid:
+                self._best_bid = index
+        else:
+            existing = self._offset(index)
+            if existing is None:
+                return
+            self._bid_sizes[existing] = 0.0
+            if index == self._best_bid:
+                self._best_bid = self._find_best_bid(index)
+
+    def set_ask(self, price: float, size: float) -> None:
+        """Set ask size at a price; size <= 0 removes the level."""
+        index = self._index(price)
+        if index is None:
+            return
+        if size > 0:
+            offset = self._ensure(index)
+            self._ask_sizes[offset] = size
+            if index < self._best_ask:
+                self._best_ask = index
+        else:
+            existing = self._offset(index)
+            if existing is None:
+                return
+            self._ask_sizes[existing] = 0.0
+            if index == self._best_ask:
+                self._best_ask = self._find_best_ask(index + 1)
+
+    @property
+    def best_bid(self) -> float | None:
+        """Get best bid price."""
+        return float(self._grid[self._best_bid]) if self._best_bid >= 0 else None
+
+    @property
+    def best_ask(self) -> float | None:
+        """Get best ask price."""
+        return float(self._grid[self._best_ask]) if self._best_ask < len(self._grid) else None
+
+    @property
+    def mid_price(self) -> float | None:
+        """Get mid price."""
+        if self.best_bid is None or self.best_ask is None:
+            return None
+        return (self.best_bid + self.best_ask) / 2
+
+    @property
+    def spread(self) -> float | None:
+        """Get bid-ask spread."""
+        if self.best_bid is None or self.best_ask is None:
+            return None
+        return self.best_ask - self.best_bid
+
+    @property
+    def bids(self) -> List[PriceLevel]:
+        """Bid levels sorted descending by price."""
+        indices = np.flatnonzero(self._bid_sizes)[::-1]
+        return list(zip(self.prices[indices].tolist(), self._bid_sizes[indices].tolist()))
+
+    @property
+    def asks(self) -> List[PriceLevel]:
+        """Ask levels sorted ascending by price."""
+        indices = np.flatnonzero(self._ask_sizes)
+        return list(zip(self.prices[indices].tolist(), self._ask_sizes[indices].tolist()))
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by this book's size buffers."""
+        return self._bid_sizes.nbytes + self._ask_sizes.nbytes
+
+    def to_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Export (prices, bid_sizes, ask_sizes) for the active window as read-only views.
+
+        The views track later in-window updates; re-export after the window moves.
+        """
+        return self.prices, _readonly(self._bid_sizes), _readonly(self._ask_sizes)
+
+    def cumulative_depth(self, side: str, price: float) -> float:
+        """
+        Total size resting at the given price or better.
+
+        Args:
+            side: "bids" or "asks"
+            price: Limit price
+        """
+        offset = int(round(price / self.tick_size)) - self._lo
+        if side == "bids":
+            return float(self._bid_sizes[max(offset, 0) :].sum())
+        return float(self._ask_sizes[: max(offset + 1, 0)].sum())
+
+    def vwap(self, side: str, size: float) -> float | None:
+        """
+        Volume-weighted average price for taking `size` from one side.
+
+        Args:
+            side: "asks" to price a buy, "bids" to price a sell
+            size: Size to fill
+
+        Returns:
+            Average fill price, or None if the side cannot fill `size`
+        """
+        if size <= 0:
+            return None
+        if side == "bids":
+            sizes = self._bid_sizes[::-1]
+            prices = self.prices[::-1]
+        else:
+            sizes = self._ask_sizes
+            prices = self.prices
+        cumulative = np.cumsum(sizes)
+        if cumulative.size == 0 or cumulative[-1] < size:
+            return None
+        last = int(np.searchsorted(cumulative, size))
+        filled = np.minimum(sizes[: last + 1], size - (cumulative[: last + 1] - sizes[: last + 1]))
+        return float(np.dot(prices[: last + 1], filled) / size)
+
+    def price_impact(self, side: str, notional: float) -> float | None:
+        """
+        Relative slippage of spending `notional` against one side.
+
+        Returns:
+            (VWAP - best) / best for asks, (best - VWAP) / best for bids,
+            or None if the side cannot absorb `notional`
+        """
+        best = self.best_bid if side == "bids" else self.best_ask
+        if best is None or notional <= 0:
+            return None
+        if side == "bids":
+            sizes = self._bid_sizes[::-1]
+            prices = self.prices[::-1]
+        else:
+            sizes = self._ask_sizes
+            prices = self.prices
+        notionals = np.cumsum(prices * sizes)
+        if notionals.size == 0 or notionals[-1] < notional:
+            return None
+        last = int(np.searchsorted(notionals, notional))
+        prev_notional = notionals[last - 1] if last else 0.0
+        size = sizes[:last].sum() + (notional - prev_notional) / prices[last]
+        vwap = notional / float(size)
+        return (vwap - best) / best if side == "asks" else (best - vwap) / best
+
+    def imbalance(self, levels: Optional[int] = None) -> float | None:
+        """
+        Order book imbalance (bid_depth - ask_depth) / (bid_depth + ask_depth).
+
+        Args:
+            levels: Number of top levels per side to include (None = all)
+        """
+        bid_sizes = self._bid_sizes[np.flatnonzero(self._bid_sizes)][::-1]
+        ask_sizes = self._ask_sizes[np.flatnonzero(self._ask_sizes)]
+        if levels is not None:
+            bid_sizes = bid_sizes[: max(levels, 0)]
+            ask_sizes = ask_sizes[: max(levels, 0)]
+        bid_depth = float(bid_sizes.sum())
+        ask_depth = float(ask_sizes.sum())
+        total = bid_depth + ask_depth
+        if total <= 0:
+            return None
+        return (bid_depth - ask_depth) / total
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dict format for OrderbookManager compatibility."""
+        return {
+            "bids": self.bids,
+            "asks": self.asks,
+            "timestamp": self.timestamp,
+            "asset_id": self.asset_id,
+            "market_id": self.market_id,
+        }
+
+
+class TickOrderbookManager:
+    """
+    Drop-in alternative to OrderbookManager that stores TickOrderbook buffers.
+
+    Each token keeps one TickOrderbook whose buffers span only its active price
+    window, so holding thousands of books does not churn per-update lists and
+    tuples.
+    """
+
+    def __init__(self, tick_size: float = 0.001):
+        self.tick_size = tick_size
+        self.orderbooks: Dict[str, TickOrderbook] = {}
+
+    def update(self, token_id: str, orderbook: Dict[str, Any]) -> None:
+        """Update orderbook for a token."""
+        book = self.orderbooks.get(token_id)
+        if book is None:
+            book = TickOrderbook(tick_size=self.tick_size, asset_id=token_id)
+            self.orderbooks[token_id] = book
+        book.replace(orderbook.get("bids", []), orderbook.get("asks", []))
+        book.timestamp = orderbook.get("timestamp", 0)
+        book.market_id = orderbook.get("market_id", book.market_id)
+
+    def get(self, token_id: str) -> Optional[Dict[str, Any]]:
+        """Get orderbook for a token as a dict of (price, size) lists."""
+        book = self.orderbooks.get(token_id)
+        return book.to_dict() if book is not None else None
+
+    def get_book(self, token_id: str) -> Optional[TickOrderbook]:
+        """Get the underlying TickOrderbook for a token."""
+        return self.orderbooks.get(token_id)
+
+    def get_best_bid_ask(self, token_id: str) -> Tuple[Optional[float], Optional[float]]:
+        """Get best bid and ask for a token."""
+        book = self.orderbooks.get(token_id)
+        if book is None:
+            return None, None
+        return book.best_bid, book.best_ask
+
+    def has_data(self, token_id: str) -> bool:
+        """Check if we have orderbook data for a token."""
+        bid, ask = self.get_best_bid_ask(token_id)
+        return bid is not None and ask is not None
+
+    def has_all_data(self, token_ids: List[str]) -> bool:
+        """Check if we have orderbook data for all tokens."""
+        return all(self.has_data(tid) for tid in token_ids)
+
+    def get_cumulative_depth(self, token_id: str, side: str, price: float) -> float:
+        """Total size resting at the given price or better."""
+        _check_side(side)
+        book = self.orderbooks.get(token_id)
+        return book.cumulative_depth(side, price) if book is not None else 0.0
+
+    def get_vwap(self, token_id: str, side: str, size: float) -> Optional[float]:
+        """Volume-weighted average price for taking `size` from one side."""
+        _check_side(side)
+        book = self.orderbooks.get(token_id)
+        return book.vwap(side, size) if book is not None else None
+
+    def get_price_impact(self, token_id: str, side: str, notional: float) -> Optional[float]:
+        """Relative slippage of spending `notional` against one side."""
+        _check_side(side)
+        book = self.orderbooks.get(token_id)
+        return book.price_impact(side, notional) if book is not None else None
+
+    def get_imbalance(self, token_id: str, levels: Optional[int] = None) -> Optional[float]:
+        """Order book imbalance (bid_depth - ask_depth) / (bid_depth + ask_depth)."""
+        book = self.orderbooks.get(token_id)
+        return book.imbalance(levels) if book is not None else None
+
+
+class BookSide:
+    """
+    One side of an incrementally maintained orderbook.
+
+    Levels are keyed by integer tick index and kept in an ascending list via
+    bisect, so a delta costs O(log n) comparisons instead of re-sorting the whole
+    side. The best-first level list and its prefix sums (for depth queries) are
+    rebuilt lazily on read, and only from the first position a change touched,
+    so deep-level churn leaves the top intact.
+    """
+
+    __slots__ = ("descending", "_ticks", "_levels", "_depth", "_clean", "_snapshot", "_view")
+
+    def __init__(self, descending: bool, levels: Iterable[PriceLevel] = ()):
+        self.descending = descending
+        self._ticks: List[int] = []
+        self._levels: Dict[int, PriceLevel] = {}
+        # Best-first levels and prefix sums; only the first `_clean` entries are current
+        self._depth = _SideDepth(descending=descending)
+        self._clean = 0
+        self._snapshot: Optional[Tuple[PriceLevel, ...]] = None
+        self._view: Optional["BookLevels"] = None
+        self.replace(levels)
+
+    def __len__(self) -> int:
+        return len(self._ticks)
+
+    def __contains__(self, price: float) -> bool:
+        return price_to_tick(price) in self._levels
+
+    def _touched(self, position: int) -> None:
+        """Mark best-first positions from `position` onward as stale."""
+        if position < self._clean:
+            self._clean = position
+        self._snapshot = None
+
+    def replace(self, levels: Iterable[PriceLevel]) -> None:
+        """Replace all levels (e.g. from a full snapshot)."""
+        self._levels = {}
+        for price, size in levels:
+            if size > 0:
+                self._levels[price_to_tick(price)] = (price, size)
+        self._ticks = sorted(self._levels)
+        self._touched(0)
+
+    def set(self, price: float, size: float) -> None:
+        """Set the size at a price level; size <= 0 removes the level."""
+        tick = price_to_tick(price)
+        ticks = self._ticks
+        count = len(ticks)
+        index = bisect_left(ticks, tick)
+        if size > 0:
+            if tick in self._levels:
+                position = count - 1 - index if self.descending else index
+            else:
+                ticks.insert(index, tick)
+                position = count - index if self.descending else index
+            self._levels[tick] = (price, size)
+        elif self._levels.pop(tick, None) is not None:
+            del ticks[index]
+            position = count - 1 - index if self.descending else index
+        else:
+            return
+        self._touched(position)
+
+    def remove_better_than(self, price: float) -> None:
+        """Drop levels that cross the given top-of-book price."""
+        tick = price_to_tick(price)
+        if self.descending:
+            index = bisect_left(self._ticks, tick + 1)
+            stale, self._ticks = self._ticks[index:], self._ticks[:index]
+        else:
+            index = bisect_left(self._ticks, tick)
+            stale, self._ticks = self._ticks[:index], self._ticks[index:]
+        if not stale:
+            return
+        for existing in stale:
+            del self._levels[existing]
+        self._touched(0)
+
+    @property
+    def best(self) -> Optional[PriceLevel]:
+        """Best level (highest bid / lowest ask)."""
+        if not self._ticks:
+            return None
+        return self._levels[self._ticks[-1] if self.descending else self._ticks[0]]
+
+    def level(self, position: int) -> PriceLevel:
+        """Level at a best-first position (negative positions count from the worst)."""
+        count = len(self._ticks)
+        if position < 0:
+            position += count
+        if not 0 <= position < count:
+            raise IndexError("book level index out of range")
+        return self._levels[self._ticks[count - 1 - position if self.descending else position]]
+
+    def depth(self) -> _SideDepth:
+        """Best-first levels with prefix sums, rebuilding only the stale suffix."""
+        depth = self._depth
+        count = len(self._ticks)
+        clean = self._clean
+        if clean < count or len(depth.levels) != count:
+            levels = self._levels
+            stale: Iterable[int]
+            if self.descending:
+                stale = reversed(self._ticks[: count - clean])
+            else:
+                stale = self._ticks[clean:]
+            depth.truncate(clean)
+            depth.extend(levels[tick] for tick in stale)
+            self._clean = count
+        return depth
+
+    def snapshot(self) -> Tuple[PriceLevel, ...]:
+        """Levels sorted best-first, cached until the next change."""
+        if self._snapshot is None:
+            self._snapshot = tuple(self.depth().levels)
+        return self._snapshot
+
+    def view(self) -> "BookLevels":
+        """Read-only, lazily materialized view of this side's current levels."""
+        if self._view is None:
+            self._view = BookLevels(self)
+        return self._view
+
+
+class BookLevels(Sequence):
+    """
+    Read-only best-first (price, size) sequence backed by a live BookSide.
+
+    Indexing and short slices read straight from the side in O(1) per level;
+    iteration and comparison use the side's cached snapshot. The view always
+    reflects the side's current levels, so keep snapshot() or list(view) to hold
+    on to a particular version.
+    """
+
+    __slots__ = ("_side",)
+
+    def __init__(self, side: BookSide):
+        self._side = side
+
+    @property
+    def side(self) -> BookSide:
+        return self._side
+
+    def __len__(self) -> int:
+        return len(self._side)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self._side))
+            level = self._side.level
+            return [level(position) for position in range(start, stop, step)]
+        return self._side.level(index)
+
+    def __iter__(self) -> Iterator[PriceLevel]:
+        return iter(self._side.snapshot())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, BookLevels):
+            return self._side.snapshot() == other._side.snapshot()
+        if isinstance(other, (list, tuple)):
+            return list(self._side.snapshot()) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"BookLevels({list(self._side.snapshot())!r})"
+
+
+class DepthBook:
+    """Incrementally maintained orderbook for delta-based WebSocket feeds."""
+
+    __slots__ = ("market_id", "timestamp", "hash", "bids", "asks")
+
+    def __init__(
+        self,
+        market_id: str = "",
+        timestamp: Any = 0,
+        hash: str = "",
+        bids: Iterable[PriceLevel] = (),
+        asks: Iterable[PriceLevel] = (),
+    ):
+        self.market_id = market_id
+        self.timestamp = timestamp
+        self.hash = hash
+        self.bids = BookSide(descending=True, levels=bids)
+        self.asks = BookSide(descending=False, levels=asks)
+
+    def to_dict(self, asset_id: str) -> Dict[str, Any]:
+        """
+        Build the standard orderbook dict with best-first level tuples as sides.
+
+        The sides are each BookSide's cached snapshot(), so they are immutable
+        and safe to keep or hand to another thread; unchanged sides cost
+        nothing to emit again.
+        """
+        return {
+            "market_id": self.market_id or asset_id,
+            "asset_id": asset_id,
+            "bids": self.bids.snapshot(),
+            "asks": self.asks.snapshot(),
+            "timestamp": self.timestamp,
+            "hash": self.hash,
+        }
@@ -1,6 +1,10 @@
 """Runtime helpers for low-latency trading workflows."""
 
 from .async_worker import AsyncWorker, OverflowPolicy, WorkerStats
+from .dispatch import CoalescingDispatcher, DispatchStats
+from .event_loop import EventLoopRuntime, get_runtime
+from .latency import FeedLatency, FeedLatencyTracker, LatencyHistogram, LatencySummary
+from .market_cache import MarketCacheStats, MarketMetadata, MarketMetadataCache
 from .order_hooks import (
     OrderDecision,
     OrderHookPipeline,
@@ -8,17 +12,53 @@ from .order_hooks import (
     OrderResult,
     PostOrderDispatcher,
 )
+from .rate_limit import (
+    ACCOUNT,
+    MARKET_DATA,
+    ORDERS,
+    RateLimiter,
+    RateLimitStats,
+    TokenBucket,
+    shared_rate_limiter,
+)
+from .retry import CircuitBreaker, CircuitState, CircuitStats, RetryPolicy
+from .single_flight import SingleFlight, SingleFlightStats, shared_single_flight
 from .sqlite_sink import SQLITE_EVENT_SCHEMA, SqliteEvent, SqliteEventSink
 
 __all__ = [
     "AsyncWorker",
     "OverflowPolicy",
     "WorkerStats",
+    "CoalescingDispatcher",
+    "DispatchStats",
+    "EventLoopRuntime",
+    "get_runtime",
+    "FeedLatency",
+    "FeedLatencyTracker",
+    "LatencyHistogram",
+    "LatencySummary",
+    "MarketCacheStats",
+    "MarketMetadata",
+    "MarketMetadataCache",
     "OrderDecision",
     "OrderHookPipeline",
     "OrderIntent",
     "OrderResult",
     "PostOrderDispatcher",
+    "ACCOUNT",
+    "MARKET_DATA",
+    "ORDERS",
+    "RateLimiter",
+    "RateLimitStats",
+    "TokenBucket",
+    "shared_rate_limiter",
+    "CircuitBreaker",
+    "CircuitState",
+    "CircuitStats",
+    "RetryPolicy",
+    "SingleFlight",
+    "SingleFlightStats",
+    "shared_single_flight",
     "SQLITE_EVENT_SCHEMA",
     "SqliteEvent",
     "SqliteEventSink",
@@ -0,0 +1,204 @@
+"""Bounded, coalescing hand-off from WebSocket receive loops to user callbacks."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Hashable, Tuple
+
+from .async_worker import OverflowPolicy
+
+logger = logging.getLogger(__name__)
+
+_Item = Tuple[Callable[..., Any], Tuple[Any, ...], int]
+
+
+@dataclass(frozen=True)
+class DispatchStats:
+    submitted: int = 0
+    delivered: int = 0
+    coalesced: int = 0
+    dropped: int = 0
+    failed: int = 0
+    pending: int = 0
+    last_lag_ms: float = 0.0
+    max_lag_ms: float = 0.0
+
+
+class CoalescingDispatcher:
+    """Decouple callback execution from a receive loop with per-key queues.
+
+    Each key (an asset ID for orderbooks) gets a queue of at most `depth`
+    updates. With the default DROP_OLDEST policy a lagging consumer only sees
+    the latest `depth` updates per key; superseded updates are counted as
+    coalesced. BLOCK instead makes submit() wait for room, pushing back on the
+    receive loop; DROP_NEWEST keeps the queued updates and discards the new
+    one; RAISE raises asyncio.QueueFull.
+
+    Keys are served round-robin by a single consumer task on the running loop,
+    so one busy asset cannot starve the others. Lag is measured from submit()
+    to the start of the callback.
+    """
+
+    def __init__(
+        self,
+        *,
+        depth: int = 1,
+        overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        verbose: bool = False,
+    ) -> None:
+        if depth < 1:
+            raise ValueError("depth must be >= 1")
+        self.depth = depth
+        self.overflow_policy = overflow_policy
+        self.verbose = verbose
+        self._queues: Dict[Hashable, Deque[_Item]] = {}
+        self._ready: Deque[Hashable] = deque()
+        self._wakeup = asyncio.Event()
+        self._space = asyncio.Condition()
+        self._task: asyncio.Task | None = None
+        self._closed = False
+        self._submitted = 0
+        self._delivered = 0
+        self._coalesced = 0
+        self._dropped = 0
+        self._failed = 0
+        self._pending = 0
+        self._last_lag_ms = 0.0
+        self._max_lag_ms = 0.0
+
+    @property
+    def stats(self) -> DispatchStats:
+        return DispatchStats(
+            submitted=self._submitted,
+            delivered=self._delivered,
+            coalesced=self._coalesced,
+            dropped=self._dropped,
+            failed=self._failed,
+            pending=self._pending,
+            last_lag_ms=self._last_lag_ms,
+            max_lag_ms=self._max_lag_ms,
+        )
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    async def submit(self, key: Hashable, callback: Callable[..., Any], *args: Any) -> bool:
+        """Queue callback(*args) for delivery.
+
+        Returns False when the update was dropped or the dispatcher is closed.
+        Must be called from the loop that runs the consumer.
+        """
+
+        if self._closed:
+            return False
+        self._ensure_consumer()
+
+        queue = self._queues.get(key)
+        if queue is None:
+            queue = self._queues[key] = deque()
+        # A key is in _ready exactly while its queue is non-empty; decide that
+        # before any overflow handling touches the queue.
+        scheduled = bool(queue)
+        if len(queue) >= self.depth:
+            if self.overflow_policy == OverflowPolicy.BLOCK:
+                async with self._space:
+                    await self._space.wait_for(lambda: len(queue) < self.depth or self._closed)
+                if self._closed:
+                    return False
+                scheduled = bool(queue)
+            elif self.overflow_policy == OverflowPolicy.RAISE:
+                raise asyncio.QueueFull(f"dispatch queue for {key!r} is full")
+            elif self.overflow_policy == OverflowPolicy.DROP_NEWEST:
+                self._dropped += 1
+                return False
+            else:
+                queue.popleft()
+                self._pending -= 1
+                self._coalesced += 1
+
+        if not scheduled:
+            self._ready.append(key)
+        queue.append((callback, args, time.perf_counter_ns()))
+        self._pending += 1
+        self._submitted += 1
+        self._wakeup.set()
+        return True
+
+    async def join(self) -> None:
+        """Wait until every queued update has been delivered."""
+
+        while self._pending and not self._closed:
+            async with self._space:
+                await self._space.wait_for(lambda: not self._pending or self._closed)
+
+    async def close(self) -> None:
+        """Stop the consumer and discard undelivered updates."""
+
+        self._closed = True
+        dropped = self._pending
+        self._queues.clear()
+        self._ready.clear()
+        self._pending = 0
+        self._dropped += dropped
+        async with self._space:
+            self._space.notify_all()
+        task, self._task = self._task, None
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def _ensure_consumer(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._consume())
+
+    async def _consume(self) -> None:
+        while not self._closed:
+            try:
+                await self._deliver_next()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Bookkeeping errors must not silently kill the consumer, or
+                # join() and BLOCK submitters would wait forever.
+                logger.warning(f"Dispatch consumer error: {e}")
+
+    async def _deliver_next(self) -> None:
+        if not self._ready:
+            self._wakeup.clear()
+            await self._wakeup.wait()
+            return
+
+        key = self._ready.popleft()
+        queue = self._queues.get(key)
+        if not queue:
+            return
+        callback, args, enqueued_ns = queue.popleft()
+        self._pending -= 1
+        if queue:
+            self._ready.append(key)
+
+        lag_ms = (time.perf_counter_ns() - enqueued_ns) / 1_000_000
+        self._last_lag_ms = lag_ms
+        if lag_ms > self._max_lag_ms:
+            self._max_lag_ms = lag_ms
+
+        try:
+            result = callback(*args)
+            if asyncio.iscoroutine(result):
+                await result
+            self._delivered += 1
+        except Exception as e:
+            self._failed += 1
+            if self.verbose:
+                logger.debug(f"Dispatch callback for {key!r} failed: {e}")
+
+        async with self._space:
+            self._space.notify_all()
@@ -0,0 +1,134 @@
+"""Shared background asyncio loop for hosting WebSocket clients."""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import threading
+from typing import Any, Callable, Coroutine, TypeVar
+
+T = TypeVar("T")
+
+
+class EventLoopRuntime:
+    """Run many clients' coroutines on one background event loop thread.
+
+    WebSocket clients started from synchronous code need a running loop.
+    Instead of each client owning a thread and loop, they submit their receive
+    loops here, so a process hosting a dozen strategies runs one loop thread
+    rather than dozens. Sync callers hand work to the loop with submit() (a
+    concurrent Future) or run() (blocking), both thread-safe.
+
+    Callbacks run on the loop thread and must not block; move slow side effects
+    to an AsyncWorker. Clients accept a runtime argument, so load can be split
+    across a few runtimes when one loop is not enough.
+    """
+
+    def __init__(self, *, name: str = "dr-manhattan-loop") -> None:
+        self.name = name
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The running loop; the runtime is started on first use."""
+        return self.start()
+
+    @property
+    def thread(self) -> threading.Thread:
+        self.start()
+        assert self._thread is not None
+        return self._thread
+
+    @property
+    def running(self) -> bool:
+        with self._lock:
+            return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is not None and self._thread is not None and self._thread.is_alive():
+                return self._loop
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+            self._loop = loop
+            self._thread = threading.Thread(
+                target=self._run, args=(loop, ready), name=self.name, daemon=True
+            )
+            self._thread.start()
+        ready.wait()
+        return loop
+
+    def in_loop_thread(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> concurrent.futures.Future[T]:
+        """Schedule a coroutine on the loop from any thread.
+
+        Cancelling the returned future cancels the task on the loop.
+        """
+
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Coroutine[Any, Any, T], *, timeout: float | None = None) -> T:
+        """Run a coroutine on the loop and block until it finishes.
+
+        Raises RuntimeError when called from the loop thread itself, where
+        blocking would deadlock; await the coroutine there instead.
+        """
+
+        if self.in_loop_thread():
+            coro.close()
+            raise RuntimeError("EventLoopRuntime.run() called from its own loop thread")
+        return self.submit(coro).result(timeout=timeout)
+
+    def call_soon(self, callback: Callable[..., Any], *args: Any) -> None:
+        """Run a plain callable on the loop thread."""
+
+        self.loop.call_soon_threadsafe(callback, *args)
+
+    def stop(self, *, timeout: float | None = 5.0) -> None:
+        """Cancel every task still on the loop and stop its thread.
+
+        The runtime can be started again afterwards with a fresh loop.
+        """
+
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+        if loop is None or thread is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not threading.current_thread():
+            thread.join(timeout=timeout)
+
+    @staticmethod
+    def _run(loop: asyncio.AbstractEventLoop, ready: threading.Event) -> None:
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        try:
+            loop.run_forever()
+        finally:
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+
+_default_runtime: EventLoopRuntime | None = None
+_default_lock = threading.Lock()
+
+
+def get_runtime() -> EventLoopRuntime:
+    """Return the process-wide runtime shared by all WebSocket clients."""
+
+    global _default_runtime
+    with _default_lock:
+        if _default_runtime is None:
+            _default_runtime = EventLoopRuntime()
+        return _default_runtime
@@ -0,0 +1,161 @@
+"""Per-asset latency histograms for WebSocket market-data feeds."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+# Bucket i holds samples below 2**i microseconds; the last bucket is open-ended
+_BUCKETS = 28  # 2**27 us ~ 134 s
+
+
+@dataclass(frozen=True)
+class LatencySummary:
+    count: int = 0
+    mean_ms: float = 0.0
+    p50_ms: float = 0.0
+    p90_ms: float = 0.0
+    p99_ms: float = 0.0
+    max_ms: float = 0.0
+
+
+@dataclass(frozen=True)
+class FeedLatency:
+    """Latency breakdown for one asset's updates."""
+
+    updates: int = 0
+    # Exchange event timestamp -> local receive (includes clock skew)
+    exchange_to_receive: LatencySummary = LatencySummary()
+    # Message parse and book update
+    parse: LatencySummary = LatencySummary()
+    # User callback (or hand-off to the dispatch stage)
+    callback: LatencySummary = LatencySummary()
+
+
+class LatencyHistogram:
+    """Fixed power-of-two buckets: O(1) record, no allocation per sample.
+
+    Percentiles are bucket upper bounds, so they overstate by at most 2x; max
+    and mean are exact.
+    """
+
+    __slots__ = ("buckets", "count", "total_ns", "max_ns")
+
+    def __init__(self) -> None:
+        self.buckets: List[int] = [0] * _BUCKETS
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def record(self, ns: int) -> None:
+        if ns < 0:
+            ns = 0
+        index = (ns // 1000).bit_length()
+        self.buckets[index if index < _BUCKETS else _BUCKETS - 1] += 1
+        self.count += 1
+        self.total_ns += ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+
+    def percentile_ms(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, bucket in enumerate(self.buckets):
+            seen += bucket
+            if seen >= rank:
+                return min((1 << index) / 1000, self.max_ns / 1_000_000)
+        return self.max_ns / 1_000_000
+
+    def summary(self) -> LatencySummary:
+        if not self.count:
+            return LatencySummary()
+        return LatencySummary(
+            count=self.count,
+            mean_ms=self.total_ns / self.count / 1_000_000,
+            p50_ms=self.percentile_ms(0.50),
+            p90_ms=self.percentile_ms(0.90),
+            p99_ms=self.percentile_ms(0.99),
+            max_ms=self.max_ns / 1_000_000,
+        )
+
+
+def exchange_time_ns(timestamp: Any) -> int:
+    """Exchange timestamps arrive as seconds or milliseconds, int or string; 0 if unknown."""
+    try:
+        value = float(timestamp or 0)
+    except (TypeError, ValueError):
+        return 0
+    if value > 1e17:  # already nanoseconds
+        return int(value)
+    if value > 1e14:  # microseconds
+        return int(value * 1_000)
+    if value > 1e11:  # milliseconds
+        return int(value * 1_000_000)
+    if value > 1e8:  # seconds
+        return int(value * 1_000_000_000)
+    return 0
+
+
+class _AssetLatency:
+    __slots__ = ("exchange_to_receive", "parse", "callback")
+
+    def __init__(self) -> None:
+        self.exchange_to_receive = LatencyHistogram()
+        self.parse = LatencyHistogram()
+        self.callback = LatencyHistogram()
+
+
+class FeedLatencyTracker:
+    """Collect exchange-to-receive, parse and callback latency per asset.
+
+    Recording is a dict lookup plus a few integer operations, so it is cheap
+    enough to leave on in production.
+    """
+
+    def __init__(self) -> None:
+        self._assets: Dict[str, _AssetLatency] = {}
+
+    def _asset(self, key: str) -> _AssetLatency:
+        asset = self._assets.get(key)
+        if asset is None:
+            asset = self._assets[key] = _AssetLatency()
+        return asset
+
+    def record_update(
+        self, key: str, exchange_timestamp: Any, received_ns: int, parse_ns: int
+    ) -> None:
+        """Record one update's receive and parse latency.
+
+        Args:
+            key: Asset (or market) key
+            exchange_timestamp: Event timestamp from the exchange payload
+            received_ns: Local wall-clock receive time (time.time_ns())
+            parse_ns: Time spent parsing the message and updating the book
+        """
+        asset = self._asset(key)
+        asset.parse.record(parse_ns)
+        sent_ns = exchange_time_ns(exchange_timestamp)
+        if sent_ns and received_ns:
+            asset.exchange_to_receive.record(received_ns - sent_ns)
+
+    def record_callback(self, key: str, ns: int) -> None:
+        self._asset(key).callback.record(ns)
+
+    def get(self, key: str) -> FeedLatency:
+        asset = self._assets.get(key)
+        if asset is None:
+            return FeedLatency()
+        return FeedLatency(
+            updates=asset.parse.count,
+            exchange_to_receive=asset.exchange_to_receive.summary(),
+            parse=asset.parse.summary(),
+            callback=asset.callback.summary(),
+        )
+
+    def snapshot(self) -> Dict[str, FeedLatency]:
+        return {key: self.get(key) for key in list(self._assets)}
+
+    def reset(self) -> None:
+        self._assets.clear()
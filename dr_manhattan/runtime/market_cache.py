@@ -0,0 +1,349 @@
+"""Bounded TTL + LRU cache of market metadata used to resolve IDs.
+
+Resolving a market identifier (Gamma ID, condition ID, slug, token ID) to
+its token IDs, outcomes and tick size normally costs one or more REST
+calls; on the order path that is pure latency. MarketMetadataCache keeps
+these records keyed by market ID, with indexes from every alias and token
+ID back to the market. Entries expire after `ttl` seconds and the least
+recently used entry is evicted beyond `maxsize`.
+
+With a `path`, save() writes the metadata (not full Market objects) to
+SQLite and the next process loads it on startup, so token lookups are
+warm immediately after a restart.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+from dr_manhattan.models.market import Market
+from dr_manhattan.utils import json_codec
+
+MARKET_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS market_metadata (
+    market_id TEXT PRIMARY KEY,
+    payload_json TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+"""
+
+
+@dataclass(frozen=True)
+class MarketMetadata:
+    market_id: str
+    token_ids: Tuple[str, ...] = ()
+    outcomes: Tuple[str, ...] = ()
+    tick_size: float = 0.01
+    aliases: Tuple[str, ...] = ()  # Other identifiers: condition ID, slug, Gamma ID
+
+    def token_id(self, outcome: int | str = 0) -> Optional[str]:
+        """Token ID for an outcome index or name ("Yes"/"No" fall back to 0/1)."""
+        if isinstance(outcome, str):
+            if outcome in self.outcomes:
+                index = self.outcomes.index(outcome)
+            elif outcome.lower() in ("yes", "0"):
+                index = 0
+            elif outcome.lower() in ("no", "1"):
+                index = 1
+            else:
+                return None
+        else:
+            index = outcome
+        if 0 <= index < len(self.token_ids):
+            return self.token_ids[index]
+        return None
+
+
+@dataclass(frozen=True)
+class MarketCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    size: int = 0
+
+
+class _Entry:
+    __slots__ = ("metadata", "market", "expires_at")
+
+    def __init__(self, metadata: MarketMetadata, market: Optional[Market], expires_at: float):
+        self.metadata = metadata
+        self.market = market
+        self.expires_at = expires_at
+
+
+class MarketMetadataCache:
+    """
+    Thread-safe TTL + LRU cache of MarketMetadata, optionally persisted.
+
+    Example:
+        cache = MarketMetadataCache(maxsize=4096, ttl=3600)
+        cache.put_market(market, token_ids)
+        token_id = cache.get(condition_id).token_id("No")
+        metadata, outcome_index = cache.by_token(token_id)
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 4096,
+        ttl: float = 3600.0,
+        path: str | Path | None = None,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.path = Path(path) if path else None
+        self._lock = threading.RLock()
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._aliases: Dict[str, str] = {}
+        self._tokens: Dict[str, Tuple[str, int]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        if self.path is not None:
+            self.load()
+
+    def put(self, metadata: MarketMetadata, market: Optional[Market] = None) -> MarketMetadata:
+        """Insert or replace a market's metadata (and optionally its Market object)."""
+        with self._lock:
+            self._put(metadata, market, time.time() + self.ttl)
+        return metadata
+
+    def put_market(
+        self,
+        market: Market,
+        token_ids: Optional[Sequence[str]] = None,
+        aliases: Iterable[str] = (),
+    ) -> MarketMetadata:
+        """Cache a Market under its ID, its metadata identifiers and `aliases`."""
+        meta = market.metadata or {}
+        if token_ids is None:
+            token_ids = meta.get("clobTokenIds") or meta.get("token_ids") or ()
+            if isinstance(token_ids, str):
+                # Gamma returns clobTokenIds as a JSON-encoded list
+                try:
+                    token_ids = json_codec.loads(token_ids)
+                except json_codec.JSONDecodeError:
+                    token_ids = [token_ids]
+        alias_set = {
+            str(value)
+            for value in (
+                meta.get("id"),
+                meta.get("conditionId"),
+                meta.get("condition_id"),
+                meta.get("slug"),
+                *aliases,
+            )
+            if value
+        }
+        alias_set.discard(str(market.id))
+        metadata = MarketMetadata(
+            market_id=str(market.id),
+            token_ids=tuple(str(token_id) for token_id in token_ids if token_id),
+            outcomes=tuple(market.outcomes),
+            tick_size=market.tick_size,
+            aliases=tuple(sorted(alias_set)),
+        )
+        return self.put(metadata, market)
+
+    def put_token_ids(self, identifier: str, token_ids: Sequence[str]) -> MarketMetadata:
+        """
+        Record token IDs for a market ID or alias.
+
+        An existing entry keeps its Market object, aliases, outcomes and tick
+        size; only when nothing is cached is a bare entry created.
+        """
+        tokens = tuple(str(token_id) for token_id in token_ids if token_id)
+        with self._lock:
+            entry = self._peek(str(identifier))
+            if entry is None:
+                metadata = MarketMetadata(market_id=str(identifier), token_ids=tokens)
+                market = None
+            else:
+                metadata = replace(entry.metadata, token_ids=tokens)
+                market = entry.market
+            self._put(metadata, market, time.time() + self.ttl)
+        return metadata
+
+    def get(self, identifier: str) -> Optional[MarketMetadata]:
+        """Look up by market ID or any alias."""
+        with self._lock:
+            entry = self._lookup(str(identifier))
+            return entry.metadata if entry else None
+
+    def market(self, identifier: str) -> Optional[Market]:
+        """The cached Market object for an ID or alias, if one was stored."""
+        with self._lock:
+            entry = self._lookup(str(identifier))
+            if entry is None or entry.market is None:
+                if entry is not None:
+                    # Metadata alone (e.g. loaded from disk) cannot answer this
+                    self._hits -= 1
+                    self._misses += 1
+                return None
+            return entry.market
+
+    def by_token(self, token_id: str) -> Optional[Tuple[MarketMetadata, int]]:
+        """(metadata, outcome index) for a token ID."""
+        with self._lock:
+            location = self._tokens.get(str(token_id))
+            entry = self._lookup(location[0]) if location else None
+            if entry is None:
+                if location is None:
+                    self._misses += 1
+                return None
+            return entry.metadata, location[1]
+
+    def invalidate(self, identifier: str) -> None:
+        with self._lock:
+            market_id = self._aliases.get(str(identifier), str(identifier))
+            entry = self._entries.pop(market_id, None)
+            if entry is not None:
+                self._unindex(entry.metadata)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._aliases.clear()
+            self._tokens.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> MarketCacheStats:
+        with self._lock:
+            return MarketCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                size=len(self._entries),
+            )
+
+    # Persistence
+
+    def _connect(self) -> sqlite3.Connection:
+        assert self.path is not None
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), timeout=1.0)
+        conn.executescript(MARKET_CACHE_SCHEMA)
+        return conn
+
+    def save(self) -> None:
+        """Replace the on-disk cache with the live, unexpired entries."""
+        if self.path is None:
+            return
+        now = time.time()
+        with self._lock:
+            rows = [
+                (market_id, json_codec.dumps(asdict(entry.metadata)), entry.expires_at)
+                for market_id, entry in self._entries.items()
+                if entry.expires_at > now
+            ]
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM market_metadata")
+                conn.executemany(
+                    "INSERT INTO market_metadata(market_id, payload_json, expires_at) "
+                    "VALUES (?, ?, ?)",
+                    rows,
+                )
+        finally:
+            conn.close()
+
+    def load(self) -> int:
+        """Load unexpired entries from disk; returns how many were loaded."""
+        if self.path is None or not self.path.exists():
+            return 0
+        try:
+            conn = self._connect()
+        except sqlite3.DatabaseError:
+            return 0
+        try:
+            rows = conn.execute(
+                "SELECT payload_json, expires_at FROM market_metadata "
+                "WHERE expires_at > ? ORDER BY expires_at",
+                (time.time(),),
+            ).fetchall()
+        except sqlite3.DatabaseError:
+            return 0
+        finally:
+            conn.close()
+        loaded = 0
+        with self._lock:
+            for payload_json, expires_at in rows:
+                try:
+                    payload: Dict[str, Any] = json_codec.loads(payload_json)
+                    metadata = MarketMetadata(
+                        market_id=payload["market_id"],
+                        token_ids=tuple(payload.get("token_ids", ())),
+                        outcomes=tuple(payload.get("outcomes", ())),
+                        tick_size=payload.get("tick_size", 0.01),
+                        aliases=tuple(payload.get("aliases", ())),
+                    )
+                except (json_codec.JSONDecodeError, KeyError, TypeError):
+                    continue
+                self._put(metadata, None, expires_at)
+                loaded += 1
+        return loaded
+
+    # Internals (call with the lock held)
+
+    def _put(self, metadata: MarketMetadata, market: Optional[Market], expires_at: float) -> None:
+        previous = self._entries.pop(metadata.market_id, None)
+        if previous is not None:
+            self._unindex(previous.metadata)
+        self._entries[metadata.market_id] = _Entry(metadata, market, expires_at)
+        for alias in metadata.aliases:
+            self._aliases[alias] = metadata.market_id
+        for index, token_id in enumerate(metadata.token_ids):
+            self._tokens[token_id] = (metadata.market_id, index)
+        while len(self._entries) > self.maxsize:
+            _, evicted = self._entries.popitem(last=False)
+            self._unindex(evicted.metadata)
+            self._evictions += 1
+
+    def _unindex(self, metadata: MarketMetadata) -> None:
+        for alias in metadata.aliases:
+            if self._aliases.get(alias) == metadata.market_id:
+                del self._aliases[alias]
+        for token_id in metadata.token_ids:
+            if self._tokens.get(token_id, ("",))[0] == metadata.market_id:
+                del self._tokens[token_id]
+
+    def _peek(self, identifier: str) -> Optional[_Entry]:
+        """Live entry for an ID or alias, without touching stats or LRU order."""
+        market_id = identifier if identifier in self._entries else self._aliases.get(identifier)
+        entry = self._entries.get(market_id) if market_id is not None else None
+        if entry is None or entry.expires_at <= time.time():
+            return None
+        return entry
+
+    def _lookup(self, identifier: str) -> Optional[_Entry]:
+        if identifier in self._entries:
+            market_id = identifier
+        else:
+            market_id = self._aliases.get(identifier, identifier)
+        entry = self._entries.get(market_id)
+        if entry is None:
+            self._misses += 1
+            return None
+        if entry.expires_at <= time.time():
+            del self._entries[market_id]
+            self._unindex(entry.metadata)
+            self._expirations += 1
+            self._misses += 1
+            return None
+        self._entries.move_to_end(market_id)
+        self._hits += 1
+        return entry
@@ -0,0 +1,222 @@
+"""Token-bucket rate limiting with separate budgets per endpoint class.
+
+Exchanges spend from one bucket per endpoint class, so a bulk market-data
+scan cannot starve order placement:
+
+    market_data  markets, orderbooks, prices, public data
+    orders       order placement, cancels and order queries
+    account      balances, positions, fills
+
+Instances configured with the same credentials share one limiter (see
+``shared_rate_limiter``), because exchanges enforce limits per account, not
+per client object.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Dict, Hashable, Mapping, Tuple, Union
+
+MARKET_DATA = "market_data"
+ORDERS = "orders"
+ACCOUNT = "account"
+ENDPOINT_CLASSES = (MARKET_DATA, ORDERS, ACCOUNT)
+
+Budget = Union[float, Tuple[float, float]]  # rate, or (rate, burst)
+
+MIN_RATE_FRACTION = 0.1  # penalize() never cuts below this share of the configured rate
+RECOVERY_STEP = 0.02  # Share of the configured rate regained per successful request
+
+
+@dataclass(frozen=True)
+class RateLimitStats:
+    rate: float = 0.0
+    base_rate: float = 0.0
+    burst: float = 0.0
+    tokens: float = 0.0
+    acquired: int = 0
+    delayed: int = 0
+    rejected: int = 0
+    penalties: int = 0
+    total_wait_ms: float = 0.0
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilling at `rate` tokens/s up to `burst`.
+
+    reserve() is the primitive: it takes the tokens immediately, letting the
+    balance go negative, and returns how long the caller must wait before
+    using them. Because the debt is booked under the lock, concurrent callers
+    (threads or tasks) are spaced out in arrival order instead of all waking
+    at once. acquire() and acquire_async() wait out the reservation;
+    try_acquire() only takes tokens that are available now.
+
+    The rate adapts to server pushback: penalize() halves it (and can hold
+    the bucket empty for a Retry-After period), and each recover() call
+    adds back a small step until the configured rate is reached again.
+    """
+
+    def __init__(self, rate: float, burst: float | None = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+        self.rate = float(rate)
+        self.base_rate = self.rate
+        self.burst = float(burst) if burst is not None else max(self.rate, 1.0)
+        if self.burst <= 0:
+            raise ValueError("burst must be > 0")
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._acquired = 0
+        self._delayed = 0
+        self._rejected = 0
+        self._penalties = 0
+        self._total_wait = 0.0
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take `tokens` now; return the seconds to wait before using them."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= tokens
+            self._acquired += 1
+            if self._tokens >= 0:
+                return 0.0
+            delay = -self._tokens / self.rate
+            self._delayed += 1
+            self._total_wait += delay
+            return delay
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Take `tokens` only if they are available without waiting."""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens < tokens:
+                self._rejected += 1
+                return False
+            self._tokens -= tokens
+            self._acquired += 1
+            return True
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block the calling thread until `tokens` are available; return the wait."""
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self, tokens: float = 1.0) -> float:
+        """Like acquire(), but waits with asyncio.sleep."""
+        delay = self.reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def penalize(self, retry_after: float | None = None, factor: float = 0.5) -> None:
+        """Slow down after a 429: cut the rate and hold tokens for retry_after seconds."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = max(self.base_rate * MIN_RATE_FRACTION, self.rate * factor)
+            if retry_after:
+                self._tokens = min(self._tokens, -retry_after * self.rate)
+            self._penalties += 1
+
+    def recover(self) -> None:
+        """Step the rate back toward the configured rate after a success."""
+        if self.rate >= self.base_rate:
+            return
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = min(self.base_rate, self.rate + self.base_rate * RECOVERY_STEP)
+
+    @property
+    def stats(self) -> RateLimitStats:
+        with self._lock:
+            self._refill(time.monotonic())
+            return RateLimitStats(
+                rate=self.rate,
+                base_rate=self.base_rate,
+                burst=self.burst,
+                tokens=self._tokens,
+                acquired=self._acquired,
+                delayed=self._delayed,
+                rejected=self._rejected,
+                penalties=self._penalties,
+                total_wait_ms=self._total_wait * 1000.0,
+            )
+
+
+class RateLimiter:
+    """One TokenBucket per endpoint class.
+
+    Example:
+        limiter = RateLimiter({MARKET_DATA: 20, ORDERS: (5, 10), ACCOUNT: 5})
+        limiter.acquire(ORDERS)
+        if limiter.try_acquire(MARKET_DATA):
+            ...
+    """
+
+    def __init__(self, budgets: Mapping[str, Budget]) -> None:
+        if not budgets:
+            raise ValueError("at least one budget is required")
+        self._buckets: Dict[str, TokenBucket] = {}
+        for endpoint, budget in budgets.items():
+            if isinstance(budget, (tuple, list)):
+                self._buckets[endpoint] = TokenBucket(*budget)
+            else:
+                self._buckets[endpoint] = TokenBucket(budget)
+
+    def bucket(self, endpoint: str = MARKET_DATA) -> TokenBucket:
+        try:
+            return self._buckets[endpoint]
+        except KeyError:
+            raise ValueError(f"No rate limit budget for endpoint class {endpoint!r}") from None
+
+    def reserve(self, endpoint: str = MARKET_DATA, tokens: float = 1.0) -> float:
+        return self.bucket(endpoint).reserve(tokens)
+
+    def try_acquire(self, endpoint: str = MARKET_DATA, tokens: float = 1.0) -> bool:
+        return self.bucket(endpoint).try_acquire(tokens)
+
+    def acquire(self, endpoint: str = MARKET_DATA, tokens: float = 1.0) -> float:
+        return self.bucket(endpoint).acquire(tokens)
+
+    async def acquire_async(self, endpoint: str = MARKET_DATA, tokens: float = 1.0) -> float:
+        return await self.bucket(endpoint).acquire_async(tokens)
+
+    def penalize(self, endpoint: str = MARKET_DATA, retry_after: float | None = None) -> None:
+        self.bucket(endpoint).penalize(retry_after)
+
+    def recover(self, endpoint: str = MARKET_DATA) -> None:
+        self.bucket(endpoint).recover()
+
+    @property
+    def stats(self) -> Dict[str, RateLimitStats]:
+        return {endpoint: bucket.stats for endpoint, bucket in self._buckets.items()}
+
+
+_shared_limiters: "weakref.WeakValueDictionary[Hashable, RateLimiter]" = (
+    weakref.WeakValueDictionary()
+)
+_shared_lock = threading.Lock()
+
+
+def shared_rate_limiter(key: Hashable, budgets: Mapping[str, Budget]) -> RateLimiter:
+    """Return the live limiter for `key`, creating it from `budgets` if needed.
+
+    The first caller's budgets win; the limiter is dropped once no exchange
+    holds it.
+    """
+    with _shared_lock:
+        limiter = _shared_limiters.get(key)
+        if limiter is None:
+            limiter = RateLimiter(budgets)
+            _shared_limiters[key] = limiter
+        return limiter
@@ -0,0 +1,169 @@
+"""Retry policy and circuit breaker for exchange REST calls.
+
+RetryPolicy decides how long to back off after a failed attempt, honoring
+a server-provided Retry-After over the exponential schedule. CircuitBreaker
+counts consecutive failures per endpoint class and, once tripped, rejects
+calls until a cool-down passes, so callers fail fast during an exchange
+incident instead of piling up threads asleep in backoff.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from enum import Enum
+from typing import Any, Optional
+
+
+def parse_retry_after(value: Any) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        when = parsedate_to_datetime(str(value))
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Exponential backoff with jitter that defers to server-provided delays.
+
+    Attempt n waits base_delay * backoff**n plus up to `jitter` seconds,
+    capped at max_delay. An error carrying `retry_after` waits exactly that
+    long instead; if the server asks for more than max_delay the call gives
+    up rather than parking a thread.
+    """
+
+    max_retries: int = 3
+    base_delay: float = 1.0
+    backoff: float = 2.0
+    max_delay: float = 30.0
+    jitter: float = 1.0
+
+    def delay(self, attempt: int, error: Optional[BaseException] = None) -> Optional[float]:
+        """Seconds to wait before retrying after `attempt` (0-based); None to give up."""
+        if attempt >= self.max_retries:
+            return None
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is not None:
+            return retry_after if retry_after <= self.max_delay else None
+        delay = self.base_delay * (self.backoff**attempt) + random.uniform(0, self.jitter)
+        return min(delay, self.max_delay)
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"  # Calls flow; failures are counted
+    OPEN = "open"  # Calls are rejected until reset_timeout passes
+    HALF_OPEN = "half_open"  # One probe call decides whether to close or re-open
+
+
+@dataclass(frozen=True)
+class CircuitStats:
+    state: CircuitState = CircuitState.CLOSED
+    consecutive_failures: int = 0
+    failures: int = 0
+    trips: int = 0
+    rejected: int = 0
+
+
+class CircuitBreaker:
+    """
+    Thread-safe consecutive-failure circuit breaker.
+
+    After `failure_threshold` failures in a row the circuit opens and allow()
+    returns False for `reset_timeout` seconds. The first allow() after that
+    admits a single probe (half-open): success closes the circuit, failure
+    re-opens it for another reset_timeout.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be >= 1")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+        self._consecutive_failures = 0
+        self._failures = 0
+        self._trips = 0
+        self._rejected = 0
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            if (
+                self._state is CircuitState.OPEN
+                and time.monotonic() - self._opened_at >= self.reset_timeout
+            ):
+                return CircuitState.HALF_OPEN
+            return self._state
+
+    def retry_in(self) -> float:
+        """Seconds until an open circuit admits a probe (0 if not open)."""
+        with self._lock:
+            if self._state is not CircuitState.OPEN:
+                return 0.0
+            return max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._state is CircuitState.CLOSED:
+                return True
+            if self._state is CircuitState.OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    self._rejected += 1
+                    return False
+                self._state = CircuitState.HALF_OPEN
+                self._probing = False
+            if self._probing:
+                self._rejected += 1
+                return False
+            self._probing = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._consecutive_failures = 0
+            self._state = CircuitState.CLOSED
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._consecutive_failures += 1
+            if (
+                self._state is CircuitState.HALF_OPEN
+                or self._consecutive_failures >= self.failure_threshold
+            ):
+                if self._state is not CircuitState.OPEN:
+                    self._trips += 1
+                self._state = CircuitState.OPEN
+                self._opened_at = time.monotonic()
+                self._probing = False
+
+    @property
+    def stats(self) -> CircuitStats:
+        state = self.state
+        with self._lock:
+            return CircuitStats(
+                state=state,
+                consecutive_failures=self._consecutive_failures,
+                failures=self._failures,
+                trips=self._trips,
+                rejected=self._rejected,
+            )
@@ -0,0 +1,139 @@
+"""Single-flight request coalescing: concurrent identical calls share one execution.
+
+The first caller for a key runs the function; callers arriving with the
+same key while it is in flight wait for and receive the same result (or
+exception). Nothing is cached: once the call completes, the next caller
+starts a fresh one. Callers share the returned object, so treat results
+as read-only.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class SingleFlightStats:
+    calls: int = 0
+    executions: int = 0
+    shared: int = 0
+    in_flight: int = 0
+
+
+class _Call:
+    __slots__ = ("owner", "done", "result", "error")
+
+    def __init__(self) -> None:
+        self.owner = threading.get_ident()
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """
+    Thread-safe single-flight group with sync and asyncio entry points.
+
+    Example:
+        flight = SingleFlight()
+        book = flight.do(("book", token_id), exchange.get_orderbook, token_id)
+        book = await flight.do_async(("book", token_id), fetch_book, token_id)
+
+    Async calls are keyed per event loop and run as a shielded task, so one
+    caller being cancelled does not cancel the request for the others.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._tasks: Dict[Hashable, asyncio.Task] = {}
+        self._total = 0
+        self._executions = 0
+        self._shared = 0
+
+    def do(self, key: Hashable, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        with self._lock:
+            self._total += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self._executions += 1
+            else:
+                self._shared += 1
+
+        if not leader:
+            if call.owner == threading.get_ident():
+                # Re-entrant call from the leader itself; waiting would deadlock
+                return fn(*args, **kwargs)
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def do_async(
+        self, key: Hashable, fn: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any
+    ) -> T:
+        loop = asyncio.get_running_loop()
+        task_key = (id(loop), key)
+        with self._lock:
+            self._total += 1
+            task = self._tasks.get(task_key)
+            if task is None or task.get_loop() is not loop:
+                task = loop.create_task(fn(*args, **kwargs))
+                self._tasks[task_key] = task
+                self._executions += 1
+                task.add_done_callback(lambda done: self._task_done(task_key, done))
+            else:
+                self._shared += 1
+        return await asyncio.shield(task)
+
+    def _task_done(self, task_key: Hashable, task: asyncio.Task) -> None:
+        with self._lock:
+            if self._tasks.get(task_key) is task:
+                del self._tasks[task_key]
+        if not task.cancelled():
+            task.exception()  # Retrieved here so an unawaited failure is not logged
+
+    @property
+    def stats(self) -> SingleFlightStats:
+        with self._lock:
+            return SingleFlightStats(
+                calls=self._total,
+                executions=self._executions,
+                shared=self._shared,
+                in_flight=len(self._calls) + len(self._tasks),
+            )
+
+
+_shared_flights: "weakref.WeakValueDictionary[Hashable, SingleFlight]" = (
+    weakref.WeakValueDictionary()
+)
+_shared_lock = threading.Lock()
+
+
+def shared_single_flight(key: Hashable) -> SingleFlight:
+    """Return the live SingleFlight group for `key`, creating it if needed."""
+    with _shared_lock:
+        flight = _shared_flights.get(key)
+        if flight is None:
+            flight = SingleFlight()
+            _shared_flights[key] = flight
+        return flight
@@ -0,0 +1,97 @@
+"""JSON encoding/decoding for WebSocket hot paths.
+
+Uses orjson or msgspec when installed and falls back to the stdlib json module.
+All backends raise ``json.JSONDecodeError`` on invalid input, so callers keep a
+single except clause regardless of which one is active.
+
+    loads(data)  -> decode JSON text or UTF-8 bytes
+    dumps(obj)   -> compact JSON text (str keys only)
+    typed_decoder(schema) -> loads-compatible decoder validating against a
+                             TypedDict schema (msgspec only; else loads)
+
+Install the ``fast-json`` extra to get both backends.
+
+Read-only sequences such as orderbook BookLevels views encode as arrays.
+"""
+
+import json
+from collections.abc import Sequence
+from typing import Any, Callable, Union
+
+JSONDecodeError = json.JSONDecodeError
+
+loads: Callable[[Union[str, bytes]], Any]
+dumps: Callable[[Any], str]
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, Sequence) and not isinstance(obj, (str, bytes)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+try:
+    import orjson
+
+    BACKEND = "orjson"
+
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    loads = orjson.loads
+
+    def dumps(obj: Any) -> str:
+        return orjson.dumps(obj, default=_default).decode()
+
+except ImportError:
+    try:
+        import msgspec
+
+        BACKEND = "msgspec"
+        _decoder = msgspec.json.Decoder()
+        _encoder = msgspec.json.Encoder(enc_hook=_default)
+
+        def loads(data: Union[str, bytes]) -> Any:
+            try:
+                return _decoder.decode(data)
+            except msgspec.DecodeError as e:
+                raise JSONDecodeError(str(e), data if isinstance(data, str) else "", 0) from e
+
+        def dumps(obj: Any) -> str:
+            return _encoder.encode(obj).decode()
+
+    except ImportError:
+        BACKEND = "json"
+        loads = json.loads
+
+        def dumps(obj: Any) -> str:
+            return json.dumps(obj, separators=(",", ":"), default=_default)
+
+
+try:
+    import msgspec as _msgspec
+except ImportError:
+    _msgspec = None
+
+
+def typed_decoder(schema: Any) -> Callable[[Union[str, bytes]], Any]:
+    """
+    Build a decoder for frames described by `schema` (TypedDicts, lists, unions).
+
+    With msgspec installed, frames are decoded and validated against the schema
+    in one pass, with numeric strings coerced where the schema asks for numbers;
+    keys the schema does not declare are dropped. A frame that does not match
+    the schema is decoded with loads() instead, so unexpected messages still get
+    through. Without msgspec this returns loads.
+    """
+    if _msgspec is None:
+        return loads
+    decoder = _msgspec.json.Decoder(schema, strict=False)
+
+    def decode(data: Union[str, bytes]) -> Any:
+        try:
+            return decoder.decode(data)
+        except _msgspec.ValidationError:
+            return loads(data)
+        except _msgspec.DecodeError as e:
+            raise JSONDecodeError(str(e), data if isinstance(data, str) else "", 0) from e
+
+    return decode
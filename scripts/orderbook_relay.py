@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Run one local orderbook websocket relay in front of several exchanges."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import signal
+
+import websockets
+
+from dr_manhattan.base.exchange_factory import create_exchange
+from dr_manhattan.marketdata import MetricsServer, OrderbookRelay, PollingFeed, SharedBookBus
+
+
+def build_feed(name: str, args: argparse.Namespace):
+    exchange = create_exchange(name, verbose=args.verbose, validate=False)
+    if name not in args.poll and hasattr(exchange, "get_websocket"):
+        return exchange.get_websocket()
+    # No market-data websocket (Kalshi, Opinion) or polling requested
+    return PollingFeed(exchange, interval_sec=args.poll_interval_sec)
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    bus = (
+        SharedBookBus(args.shm_bus, slots=args.shm_slots, depth=args.shm_depth)
+        if args.shm_bus
+        else None
+    )
+    relay = OrderbookRelay(
+        feeds={name: build_feed(name, args) for name in args.exchange},
+        verbose=args.verbose,
+        stats_interval_sec=args.stats_interval_sec,
+        unsubscribe_grace_sec=args.unsubscribe_grace_sec,
+        snapshot_path=args.snapshot_path,
+        snapshot_interval_sec=args.snapshot_interval_sec,
+        bus=bus,
+    )
+    await relay.start()
+    metrics_server = None
+    if args.metrics_port:
+        metrics_server = MetricsServer(relay, host=args.host, port=args.metrics_port)
+        await metrics_server.start()
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signame in ("SIGINT", "SIGTERM"):
+        loop.add_signal_handler(getattr(signal, signame), stop_event.set)
+
+    async with websockets.serve(
+        relay.handle_client,
+        args.host,
+        args.port,
+        ping_interval=20,
+        ping_timeout=20,
+        close_timeout=2,
+        max_size=10 * 1024 * 1024,
+        compression=None,
+    ):
+        print(f"orderbook_relay_listening host={args.host} port={args.port}", flush=True)
+        await stop_event.wait()
+    if metrics_server is not None:
+        await metrics_server.stop()
+    await relay.stop()
+    if bus is not None:
+        bus.close()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Multi-exchange orderbook websocket relay")
+    parser.add_argument(
+        "--exchange",
+        action="append",
+        required=True,
+        help="Exchange to relay (repeatable), e.g. --exchange polymarket --exchange kalshi",
+    )
+    parser.add_argument(
+        "--poll",
+        action="append",
+        default=[],
+        help="Poll this exchange over REST even if it has a websocket (repeatable).",
+    )
+    parser.add_argument("--poll-interval-sec", type=float, default=1.0)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--verbose", action="store_true")
+    parser.add_argument("--unsubscribe-grace-sec", type=float, default=30.0)
+    parser.add_argument("--stats-interval-sec", type=float, default=30.0)
+    parser.add_argument(
+        "--snapshot-path",
+        help="SQLite file to checkpoint cached books to and warm-restart from.",
+    )
+    parser.add_argument("--snapshot-interval-sec", type=float, default=30.0)
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        help="Serve /metrics (Prometheus text) and /metrics.json on this port.",
+    )
+    parser.add_argument(
+        "--shm-bus",
+        help="Also publish books to this shared memory block for same-host SharedBookReaders.",
+    )
+    parser.add_argument("--shm-slots", type=int, default=4096)
+    parser.add_argument("--shm-depth", type=int, default=20)
+    return parser.parse_args()
+
+
+def main() -> int:
+    asyncio.run(main_async(parse_args()))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -9,7 +9,7 @@ import signal
 
 import websockets
 
-from dr_manhattan.marketdata import PolymarketOrderbookRelay
+from dr_manhattan.marketdata import MetricsServer, PolymarketOrderbookRelay
 
 
 async def main_async(args: argparse.Namespace) -> None:
@@ -17,8 +17,15 @@ async def main_async(args: argparse.Namespace) -> None:
         verbose=args.verbose,
         refresh_on_client_subscribe=not args.no_refresh_on_client_subscribe,
         stats_interval_sec=args.stats_interval_sec,
+        unsubscribe_grace_sec=args.unsubscribe_grace_sec,
+        snapshot_path=args.snapshot_path,
+        snapshot_interval_sec=args.snapshot_interval_sec,
     )
     await relay.start()
+    metrics_server = None
+    if args.metrics_port:
+        metrics_server = MetricsServer(relay, host=args.host, port=args.metrics_port)
+        await metrics_server.start()
     stop_event = asyncio.Event()
     loop = asyncio.get_running_loop()
     for signame in ("SIGINT", "SIGTERM"):
@@ -36,6 +43,8 @@ async def main_async(args: argparse.Namespace) -> None:
     ):
         print(f"polymarket_relay_listening host={args.host} port={args.port}", flush=True)
         await stop_event.wait()
+    if metrics_server is not None:
+        await metrics_server.stop()
     await relay.stop()
 
 
@@ -47,9 +56,28 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--no-refresh-on-client-subscribe",
         action="store_true",
-        help="Subscribe only newly requested assets instead of refreshing the upstream batch.",
+        help=(
+            "Change the upstream subscription incrementally instead of refreshing the "
+            "whole batch, keeping other clients streaming and cached books warm."
+        ),
+    )
+    parser.add_argument(
+        "--unsubscribe-grace-sec",
+        type=float,
+        default=30.0,
+        help="With --no-refresh-on-client-subscribe, keep unwanted assets this long.",
     )
     parser.add_argument("--stats-interval-sec", type=float, default=30.0)
+    parser.add_argument(
+        "--snapshot-path",
+        help="SQLite file to checkpoint cached books to and warm-restart from.",
+    )
+    parser.add_argument("--snapshot-interval-sec", type=float, default=30.0)
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        help="Serve /metrics (Prometheus text) and /metrics.json on this port.",
+    )
     return parser.parse_args()
 
 
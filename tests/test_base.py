@@ -1,5 +1,9 @@
 """Tests for base Exchange class"""
 
+import time
+
+import pytest
+
 from dr_manhattan.base.exchange import Exchange
 from dr_manhattan.models.market import Market
 from dr_manhattan.models.order import Order, OrderSide
@@ -185,3 +189,131 @@ def test_fetch_positions():
 
     assert isinstance(positions, list)
     assert len(positions) == 0
+
+
+def test_exchange_http_session_pools_connections():
+    """Test the pooled keep-alive session shared by REST calls"""
+    exchange = MockExchange({"http_pool_maxsize": 4})
+    adapter = exchange.session.get_adapter("https://example.com")
+
+    assert exchange.session is exchange._session
+    assert adapter._pool_maxsize == 4
+    assert adapter.max_retries.total == 0
+    assert MockExchange().session is not exchange.session
+    exchange.close()
+
+
+def test_exchange_rate_limiter_budgets_and_sharing():
+    from dr_manhattan.runtime.rate_limit import ACCOUNT, MARKET_DATA, ORDERS
+
+    config = {"api_key": "k", "rate_limit": 5, "rate_limits": {ORDERS: (2, 4)}}
+    first = MockExchange(config)
+    second = MockExchange(dict(config))
+    anonymous = MockExchange({"rate_limit": 5})
+
+    # Same credentials share one limiter; instances without credentials do not
+    assert first.rate_limiter is second.rate_limiter
+    assert anonymous.rate_limiter is not first.rate_limiter
+    assert first.rate_limiter.bucket(MARKET_DATA).rate == 5
+    assert first.rate_limiter.bucket(ORDERS).burst == 4
+
+    assert Exchange._endpoint_class("GET", "/markets/abc/orderbook") == MARKET_DATA
+    assert Exchange._endpoint_class("POST", "/portfolio/orders") == ORDERS
+    assert Exchange._endpoint_class("DELETE", "/orders/1") == ORDERS
+    assert Exchange._endpoint_class("GET", "/portfolio/balance") == ACCOUNT
+
+
+def test_retry_on_failure_spends_from_endpoint_budget():
+    from dr_manhattan.runtime.rate_limit import MARKET_DATA, ORDERS
+
+    exchange = MockExchange({"rate_limit": 100})
+
+    @exchange._retry_on_failure(endpoint=ORDERS)
+    def place():
+        return "ok"
+
+    assert place() == "ok"
+    assert exchange.rate_limiter.stats[ORDERS].acquired == 1
+    assert exchange.rate_limiter.stats[MARKET_DATA].acquired == 0
+
+
+def test_retry_on_failure_trips_circuit_breaker():
+    from dr_manhattan.base.errors import CircuitOpenError, NetworkError
+    from dr_manhattan.runtime.retry import RetryPolicy
+
+    exchange = MockExchange({"circuit_failure_threshold": 3, "rate_limit": 100})
+    exchange.retry_policy = RetryPolicy(max_retries=1, base_delay=0, jitter=0)
+    calls = []
+
+    @exchange._retry_on_failure
+    def flaky():
+        calls.append(1)
+        raise NetworkError("down")
+
+    with pytest.raises(NetworkError):
+        flaky()
+    with pytest.raises(CircuitOpenError):
+        flaky()
+    # Third failure opened the circuit; later calls never reach the network
+    assert len(calls) == 3
+    with pytest.raises(CircuitOpenError):
+        flaky()
+    assert len(calls) == 3
+
+
+def test_retry_on_failure_honors_retry_after_through_the_rate_limiter():
+    from dr_manhattan.base.errors import RateLimitError
+    from dr_manhattan.runtime.rate_limit import MARKET_DATA
+
+    exchange = MockExchange({"rate_limit": 100})
+    responses = [RateLimitError("slow down", retry_after=0.2), "ok"]
+
+    @exchange._retry_on_failure
+    def fetch():
+        result = responses.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    started = time.monotonic()
+    assert fetch() == "ok"
+
+    assert time.monotonic() - started >= 0.2
+    stats = exchange.rate_limiter.stats[MARKET_DATA]
+    assert stats.penalties == 1
+    assert stats.rate < stats.base_rate
+
+
+def test_concurrent_identical_reads_are_coalesced():
+    import threading
+
+    class SlowExchange(MockExchange):
+        fetches = 0
+
+        def fetch_market(self, market_id: str):
+            SlowExchange.fetches += 1
+            time.sleep(0.05)
+            return super().fetch_market(market_id)
+
+    exchange = SlowExchange({"api_key": "coalesce-test"})
+    other = SlowExchange({"api_key": "coalesce-test"})
+    results = []
+    threads = [
+        threading.Thread(target=lambda ex=ex: results.append(ex.fetch_market("m1")))
+        for ex in [exchange, other] * 3
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Instances sharing credentials share one in-flight request
+    assert SlowExchange.fetches == 1
+    assert len(results) == 6 and all(result is results[0] for result in results)
+    exchange.fetch_market("m1")
+    assert SlowExchange.fetches == 2
+
+    uncoalesced = SlowExchange({"coalesce_requests": False})
+    assert uncoalesced.single_flight is None
+    uncoalesced.fetch_market("m1")
+    assert SlowExchange.fetches == 3
@@ -51,7 +51,7 @@ class TestKalshiInitialization:
 
 
 class TestKalshiFetchMarkets:
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_fetch_markets(self, mock_request):
         # #given
         mock_response = Mock()
@@ -82,7 +82,7 @@ class TestKalshiFetchMarkets:
         assert markets[0].prices["Yes"] == 0.65
         assert markets[0].prices["No"] == 0.35
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_fetch_market(self, mock_request):
         # #given
         mock_response = Mock()
@@ -108,7 +108,7 @@ class TestKalshiFetchMarkets:
         assert market.id == "INXD-24DEC31-B5000"
         assert market.question == "S&P 500 above 5000?"
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_fetch_market_not_found(self, mock_request):
         # #given
         mock_response = Mock()
@@ -313,7 +313,7 @@ class TestKalshiOrderSubmission:
         config.update(overrides)
         return Kalshi(config)
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_create_order_encodes_price_as_cents_and_integer_count(self, mock_request):
         # #given a successful order response
         mock_response = Mock()
@@ -348,7 +348,7 @@ class TestKalshiOrderSubmission:
         assert body["action"] == "buy"
         assert body["side"] == "yes"
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_create_order_does_not_retry_on_network_error(self, mock_request):
         # #given a transport that times out (response possibly lost after the order rested)
         mock_request.side_effect = requests.Timeout("boom")
@@ -361,7 +361,7 @@ class TestKalshiOrderSubmission:
             )
         assert mock_request.call_count == 1
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_idempotent_get_requests_still_retry(self, mock_request):
         # #given the same timing-out transport
         mock_request.side_effect = requests.Timeout("boom")
@@ -372,7 +372,7 @@ class TestKalshiOrderSubmission:
             exchange._request("GET", "/portfolio/balance")
         assert mock_request.call_count == 3
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_no_retry_path_still_enforces_rate_limit(self, mock_request):
         # #given a successful order response
         mock_response = Mock()
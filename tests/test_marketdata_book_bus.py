@@ -0,0 +1,119 @@
+import multiprocessing
+import uuid
+
+import pytest
+
+from dr_manhattan.marketdata import OrderbookRelay, SharedBookBus, SharedBookReader
+from dr_manhattan.marketdata.book_bus import ASSET_ID_BYTES
+
+
+@pytest.fixture
+def bus():
+    bus = SharedBookBus(f"dm_test_{uuid.uuid4().hex[:12]}", slots=4, depth=3)
+    yield bus
+    bus.close()
+
+
+def _read_in_child(name, asset_id, queue):
+    reader = SharedBookReader(name)
+    orderbook = reader.read(asset_id)
+    queue.put((orderbook.bids, orderbook.asks, orderbook.timestamp))
+    reader.close()
+
+
+def test_book_bus_roundtrip_truncates_to_depth(bus):
+    book = {
+        "bids": [(0.5, 10.0), (0.49, 5.0), (0.48, 1.0), (0.47, 2.0)],
+        "asks": [(0.52, 3.0)],
+        "timestamp": 1700000000123,
+    }
+    assert bus.publish("polymarket:tok-1", book)
+
+    reader = SharedBookReader(bus.name)
+    orderbook = reader.read("polymarket:tok-1")
+    assert orderbook.asset_id == "polymarket:tok-1"
+    assert orderbook.bids == [(0.5, 10.0), (0.49, 5.0), (0.48, 1.0)]
+    assert orderbook.asks == [(0.52, 3.0)]
+    assert orderbook.timestamp == 1700000000123
+
+    top = reader.top_of_book("polymarket:tok-1")
+    assert top.bids == ((0.5, 10.0),) and top.asks == ((0.52, 3.0),)
+    assert reader.read("missing") is None
+
+    # Shorter books overwrite the slot without stale levels
+    bus.publish("polymarket:tok-1", {"bids": [], "asks": [(0.6, 1.0)], "timestamp": 2})
+    assert reader.read("polymarket:tok-1").bids == []
+    reader.close()
+
+
+def test_book_bus_reader_views_track_seq(bus):
+    bus.publish("a", {"bids": [(0.4, 1.0)], "asks": [], "timestamp": 1})
+    reader = SharedBookReader(bus.name)
+
+    seq, bids, asks = reader.levels("a")
+    assert seq % 2 == 0 and bids.tolist() == [[0.4, 1.0]] and asks.shape == (0, 2)
+    bus.publish("a", {"bids": [(0.41, 2.0)], "asks": [], "timestamp": 2})
+
+    # The view is live; the changed seq tells the caller to discard it
+    assert bids.tolist() == [[0.41, 2.0]]
+    assert reader.seq("a") == seq + 2
+
+    bus.publish("b", {"bids": [], "asks": [], "timestamp": 3})
+    assert reader.assets() == ["a", "b"]
+    del bids, asks
+    reader.close()
+
+
+def test_book_bus_rejects_when_full_or_asset_too_long(bus):
+    for index in range(4):
+        assert bus.publish(f"asset-{index}", {"bids": [], "asks": []})
+    assert not bus.publish("asset-4", {"bids": [], "asks": []})
+    assert bus.publish("asset-0", {"bids": [(0.1, 1.0)], "asks": []})
+
+    other = SharedBookBus(f"dm_test_{uuid.uuid4().hex[:12]}", slots=1)
+    try:
+        assert not other.publish("x" * (ASSET_ID_BYTES + 1), {"bids": [], "asks": []})
+        assert other.books_rejected == 1
+    finally:
+        other.close()
+
+
+def test_book_bus_reader_rejects_foreign_block():
+    from multiprocessing import shared_memory
+
+    block = shared_memory.SharedMemory(
+        name=f"dm_test_{uuid.uuid4().hex[:12]}", create=True, size=64
+    )
+    try:
+        with pytest.raises(ValueError):
+            SharedBookReader(block.name)
+    finally:
+        block.close()
+        block.unlink()
+
+
+def test_book_bus_is_readable_from_another_process(bus):
+    bus.publish("kalshi:KX-1", {"bids": [(0.3, 7.0)], "asks": [(0.35, 2.0)], "timestamp": 9})
+    queue = multiprocessing.get_context("spawn").Queue()
+    process = multiprocessing.get_context("spawn").Process(
+        target=_read_in_child, args=(bus.name, "kalshi:KX-1", queue)
+    )
+    process.start()
+    result = queue.get(timeout=30)
+    process.join(timeout=30)
+
+    assert result == ([(0.3, 7.0)], [(0.35, 2.0)], 9)
+    assert process.exitcode == 0
+
+
+@pytest.mark.asyncio
+async def test_orderbook_relay_publishes_books_to_bus(bus):
+    relay = OrderbookRelay(stats_interval_sec=0, bus=bus)
+    callback = relay._make_callback("polymarket:tok-1")
+    callback("tok-1", {"bids": [(0.5, 1.0)], "asks": [], "timestamp": 5})
+
+    reader = SharedBookReader(bus.name)
+    assert reader.read("polymarket:tok-1").bids == [(0.5, 1.0)]
+    assert bus.books_published == 1
+    reader.close()
+    await relay.stop()
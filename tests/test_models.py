@@ -1,10 +1,24 @@
 """Tests for data models"""
 
+import json
+import random
 from datetime import datetime, timezone
 
+import numpy as np
+import pytest
+
 from dr_manhattan.models.market import Market
 from dr_manhattan.models.order import Order, OrderSide, OrderStatus, OrderTimeInForce
+from dr_manhattan.models.orderbook import (
+    BookSide,
+    DepthBook,
+    OrderbookManager,
+    TickOrderbook,
+    TickOrderbookManager,
+    parse_price_levels,
+)
 from dr_manhattan.models.position import Position
+from dr_manhattan.utils import json_codec
 
 
 class TestMarket:
@@ -628,3 +642,292 @@ class TestOrderEnums:
             time_in_force=OrderTimeInForce.IOC,
         )
         assert order_ioc.time_in_force == OrderTimeInForce.IOC
+
+
+def test_parse_price_levels_drops_malformed_and_empty_levels():
+    levels = [
+        {"price": "0.52", "size": "100"},
+        {"price": "0.51", "size": "0"},
+        {"price": "bad", "size": "1"},
+        {"size": "5"},
+        {"price": "0.50", "size": None},
+        {"price": "0.49", "size": "2.5"},
+    ]
+
+    assert parse_price_levels(levels) == [(0.52, 100.0), (0.49, 2.5)]
+
+
+class TestBookSide:
+    """Test incremental orderbook side"""
+
+    def test_bid_side_keeps_levels_sorted_best_first(self):
+        bids = BookSide(descending=True, levels=[(0.40, 10.0), (0.42, 5.0)])
+        bids.set(0.41, 3.0)
+        bids.set(0.42, 0)
+
+        assert bids.snapshot() == ((0.41, 3.0), (0.40, 10.0))
+        assert bids.best == (0.41, 3.0)
+        assert 0.41 in bids
+        assert 0.42 not in bids
+
+    def test_ask_side_updates_existing_level(self):
+        asks = BookSide(descending=False)
+        asks.set(0.55, 1.0)
+        asks.set(0.53, 2.0)
+        asks.set(0.55, 4.0)
+
+        assert asks.snapshot() == ((0.53, 2.0), (0.55, 4.0))
+        assert len(asks) == 2
+
+    def test_snapshot_is_cached_until_change(self):
+        asks = BookSide(descending=False, levels=[(0.6, 1.0)])
+        first = asks.snapshot()
+
+        assert asks.snapshot() is first
+        asks.set(0.7, 0)  # removing an absent level is a no-op
+        assert asks.snapshot() is first
+        asks.set(0.7, 1.0)
+        assert asks.snapshot() == ((0.6, 1.0), (0.7, 1.0))
+        assert first == ((0.6, 1.0),)
+
+    def test_remove_better_than_prunes_crossed_levels(self):
+        bids = BookSide(descending=True, levels=[(0.50, 1.0), (0.49, 1.0), (0.47, 1.0)])
+        asks = BookSide(descending=False, levels=[(0.51, 1.0), (0.52, 1.0), (0.55, 1.0)])
+
+        bids.remove_better_than(0.48)
+        asks.remove_better_than(0.52)
+
+        assert bids.snapshot() == ((0.47, 1.0),)
+        assert asks.snapshot() == ((0.52, 1.0), (0.55, 1.0))
+
+    def test_incremental_refresh_matches_full_sort(self):
+        rng = random.Random(7)
+        for descending in (True, False):
+            side = BookSide(descending=descending)
+            expected = {}
+            for _ in range(500):
+                price = rng.randrange(1, 60) / 100
+                size = rng.choice([0.0, 1.0, 2.5, 10.0])
+                side.set(price, size)
+                if size > 0:
+                    expected[price] = size
+                else:
+                    expected.pop(price, None)
+                if rng.random() < 0.3:
+                    ordered = sorted(expected.items(), reverse=descending)
+                    assert side.snapshot() == tuple(ordered)
+                    assert side.view()[:3] == ordered[:3]
+
+    def test_view_is_lazy_read_only_and_live(self):
+        bids = BookSide(descending=True, levels=[(0.40, 10.0), (0.39, 5.0)])
+        view = bids.view()
+
+        assert view is bids.view()
+        assert view[0] == (0.40, 10.0)
+        assert view[-1] == (0.39, 5.0)
+        assert view == [(0.40, 10.0), (0.39, 5.0)]
+        with pytest.raises(TypeError):
+            view[0] = (0.5, 1.0)  # type: ignore[index]
+
+        bids.set(0.41, 1.0)
+        assert len(view) == 3
+        assert view[0] == (0.41, 1.0)
+        assert bids._snapshot is None  # nothing materialized by indexing
+
+    def test_depth_book_to_dict_serializes(self):
+        book = DepthBook(market_id="m1", bids=[(0.40, 10.0)], asks=[(0.42, 3.0)])
+        payload = json.loads(json_codec.dumps(book.to_dict("asset-1")))
+
+        assert payload["bids"] == [[0.40, 10.0]]
+        assert payload["asks"] == [[0.42, 3.0]]
+
+    def test_depth_book_to_dict_emits_immutable_snapshots(self):
+        book = DepthBook(market_id="m1", bids=[(0.40, 10.0)], asks=[(0.42, 3.0)])
+        first = book.to_dict("asset-1")
+
+        book.bids.set(0.41, 1.0)
+        second = book.to_dict("asset-1")
+
+        assert first["bids"] == ((0.40, 10.0),)
+        assert second["bids"] == ((0.41, 1.0), (0.40, 10.0))
+        assert second["asks"] is first["asks"]  # unchanged side is reused
+        assert json.loads(json.dumps(second))["bids"] == [[0.41, 1.0], [0.40, 10.0]]
+
+
+class TestTickOrderbook:
+    """Test array-backed fixed-tick orderbook"""
+
+    def test_replace_and_best_levels(self):
+        book = TickOrderbook(tick_size=0.01)
+        book.replace(
+            bids=[(0.48, 100.0), (0.47, 50.0)],
+            asks=[{"price": "0.52", "size": "10"}, (0.55, 5.0)],
+        )
+
+        assert book.best_bid == 0.48
+        assert book.best_ask == 0.52
+        assert book.spread == pytest.approx(0.04)
+        assert book.bids == [(0.48, 100.0), (0.47, 50.0)]
+        assert book.asks == [(0.52, 10.0), (0.55, 5.0)]
+
+    def test_level_updates_track_best_prices(self):
+        book = TickOrderbook(tick_size=0.01)
+        book.set_bid(0.40, 1.0)
+        book.set_bid(0.42, 2.0)
+        book.set_ask(0.45, 3.0)
+        book.set_ask(0.44, 1.0)
+
+        assert (book.best_bid, book.best_ask) == (0.42, 0.44)
+
+        book.set_bid(0.42, 0)
+        book.set_ask(0.44, 0)
+        assert (book.best_bid, book.best_ask) == (0.40, 0.45)
+
+        book.set_bid(0.40, 0)
+        assert book.best_bid is None
+        assert book.mid_price is None
+
+    def test_vwap_and_cumulative_depth(self):
+        book = TickOrderbook(tick_size=0.01)
+        book.replace(bids=[(0.50, 10.0), (0.49, 10.0)], asks=[(0.51, 10.0), (0.53, 30.0)])
+
+        assert book.vwap("asks", 20.0) == pytest.approx((0.51 * 10 + 0.53 * 10) / 20)
+        assert book.vwap("bids", 15.0) == pytest.approx((0.50 * 10 + 0.49 * 5) / 15)
+        assert book.vwap("asks", 100.0) is None
+        assert book.cumulative_depth("bids", 0.49) == 20.0
+        assert book.cumulative_depth("asks", 0.52) == 10.0
+
+    def test_to_arrays_is_read_only_view(self):
+        book = TickOrderbook(tick_size=0.1)
+        book.set_bid(0.3, 7.0)
+        prices, bid_sizes, ask_sizes = book.to_arrays()
+        book.set_bid(0.2, 1.0)
+
+        offset = int(np.flatnonzero(prices == 0.3)[0])
+        assert bid_sizes[offset] == 7.0
+        assert bid_sizes[offset - 1] == 1.0
+        with pytest.raises(ValueError):
+            ask_sizes[0] = 1.0
+
+    def test_buffers_span_only_the_active_window(self):
+        book = TickOrderbook(tick_size=0.0001)
+        book.replace(
+            bids=[(0.5000 - i * 0.0001, 1.0) for i in range(40)],
+            asks=[(0.5001 + i * 0.0001, 1.0) for i in range(40)],
+        )
+        full_grid_bytes = 2 * 8 * 10_001
+
+        assert book.nbytes <= 2 * 8 * (80 + 2 * TickOrderbook.WINDOW_PADDING)
+        assert book.nbytes < full_grid_bytes / 50
+
+        book.set_ask(0.90, 2.0)  # outside the window: it grows
+        book.set_bid(0.10, 0)  # removing an absent level is a no-op
+        assert book.asks[-1] == (0.90, 2.0)
+        assert book.best_bid == 0.5 and book.best_ask == 0.5001
+        assert book.cumulative_depth("asks", 0.90) == 42.0
+        assert book.cumulative_depth("bids", 0.4961) == 40.0
+
+    def test_manager_is_drop_in_for_orderbook_manager(self):
+        manager = TickOrderbookManager(tick_size=0.01)
+        manager.update("t1", {"bids": [(0.30, 5.0)], "asks": [(0.35, 2.0)], "timestamp": 7})
+
+        assert manager.get_best_bid_ask("t1") == (0.30, 0.35)
+        assert manager.get("t1")["asks"] == [(0.35, 2.0)]
+        assert manager.has_all_data(["t1"])
+        assert not manager.has_data("t2")
+        assert manager.get_best_bid_ask("t2") == (None, None)
+
+
+class TestOrderbookManagerDepth:
+    """Test depth analytics on OrderbookManager"""
+
+    def make_manager(self):
+        manager = OrderbookManager()
+        manager.update(
+            "t1",
+            {
+                "bids": [(0.50, 10.0), (0.49, 20.0), (0.45, 30.0)],
+                "asks": [(0.52, 10.0), (0.55, 10.0)],
+            },
+        )
+        return manager
+
+    def test_cumulative_depth(self):
+        manager = self.make_manager()
+
+        assert manager.get_cumulative_depth("t1", "bids", 0.49) == 30.0
+        assert manager.get_cumulative_depth("t1", "bids", 0.51) == 0.0
+        assert manager.get_cumulative_depth("t1", "asks", 0.60) == 20.0
+        assert manager.get_cumulative_depth("missing", "asks", 0.60) == 0.0
+
+    def test_vwap(self):
+        manager = self.make_manager()
+
+        assert manager.get_vwap("t1", "asks", 15.0) == pytest.approx((0.52 * 10 + 0.55 * 5) / 15)
+        assert manager.get_vwap("t1", "bids", 10.0) == pytest.approx(0.50)
+        assert manager.get_vwap("t1", "asks", 25.0) is None
+
+    def test_price_impact(self):
+        manager = self.make_manager()
+        notional = 0.52 * 10 + 0.55 * 5
+
+        impact = manager.get_price_impact("t1", "asks", notional)
+
+        assert impact == pytest.approx(((notional / 15) - 0.52) / 0.52)
+        assert manager.get_price_impact("t1", "asks", 100.0) is None
+
+    def test_imbalance(self):
+        manager = self.make_manager()
+
+        assert manager.get_imbalance("t1") == pytest.approx((60 - 20) / 80)
+        assert manager.get_imbalance("t1", levels=1) == 0.0
+
+    def test_cache_refreshes_on_update(self):
+        manager = self.make_manager()
+        assert manager.get_vwap("t1", "bids", 10.0) == pytest.approx(0.50)
+
+        manager.update("t1", {"bids": [(0.40, 10.0)], "asks": []})
+
+        assert manager.get_vwap("t1", "bids", 10.0) == pytest.approx(0.40)
+        assert manager.get_imbalance("t1") == 1.0
+
+    def test_rejects_unknown_side(self):
+        with pytest.raises(ValueError):
+            self.make_manager().get_vwap("t1", "buy", 1.0)
+
+    def test_tick_manager_matches_list_manager(self):
+        levels = {"bids": [(0.50, 10.0), (0.49, 20.0)], "asks": [(0.52, 10.0), (0.55, 10.0)]}
+        lists = OrderbookManager()
+        ticks = TickOrderbookManager(tick_size=0.01)
+        lists.update("t1", levels)
+        ticks.update("t1", levels)
+
+        assert ticks.get_vwap("t1", "asks", 15.0) == pytest.approx(
+            lists.get_vwap("t1", "asks", 15.0)
+        )
+        assert ticks.get_price_impact("t1", "bids", 8.0) == pytest.approx(
+            lists.get_price_impact("t1", "bids", 8.0)
+        )
+        assert ticks.get_imbalance("t1", levels=1) == lists.get_imbalance("t1", levels=1)
+
+    def test_depth_book_sides_update_prefix_sums_incrementally(self):
+        book = DepthBook(bids=[(0.50, 10.0), (0.49, 20.0), (0.45, 30.0)], asks=[(0.52, 10.0)])
+        manager = OrderbookManager()
+        # Live views opt in to sharing the book's incrementally maintained sums
+        manager.update("t1", {"bids": book.bids.view(), "asks": book.asks.view()})
+        assert manager.get_cumulative_depth("t1", "bids", 0.45) == 60.0
+
+        depth = book.bids.depth()
+        top = depth.sizes[:2]
+        book.bids.set(0.46, 5.0)  # below the top two levels
+
+        assert book.bids._clean == 2
+        assert manager.get_cumulative_depth("t1", "bids", 0.45) == 65.0
+        assert book.bids.depth() is depth and depth.sizes[:2] == top
+        assert manager.get_vwap("t1", "bids", 35.0) == pytest.approx(
+            (0.50 * 10 + 0.49 * 20 + 0.46 * 5) / 35
+        )
+
+        book.bids.set(0.50, 0)
+        assert manager.get_cumulative_depth("t1", "bids", 0.45) == 55.0
+        assert manager.get_imbalance("t1", levels=1) == pytest.approx((20 - 10) / 30)
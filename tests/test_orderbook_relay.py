@@ -0,0 +1,361 @@
+import asyncio
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from dr_manhattan.marketdata import (
+    LimitlessFeed,
+    MetricsServer,
+    OrderbookFeed,
+    OrderbookRelay,
+    PollingFeed,
+    WebSocketFeed,
+    as_feed,
+    format_prometheus,
+    split_asset_key,
+)
+from dr_manhattan.marketdata.relay_snapshot import RelaySnapshotStore
+
+
+class FakeClient:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, message):
+        self.sent.append(json.loads(message))
+
+
+class FakeFeed(OrderbookFeed):
+    def __init__(self):
+        self.callbacks = {}
+        self.unsubscribed = []
+
+    @property
+    def assets(self):
+        return set(self.callbacks)
+
+    async def subscribe(self, callbacks):
+        self.callbacks.update(callbacks)
+
+    async def unsubscribe(self, asset_ids):
+        self.unsubscribed.extend(asset_ids)
+        for asset_id in asset_ids:
+            self.callbacks.pop(asset_id, None)
+
+
+class FakeOrderBookWebSocket:
+    """Per-asset watch API only, like PredictFunWebSocket."""
+
+    def __init__(self):
+        self.subscriptions = {}
+
+    async def watch_orderbook(self, market_id, callback):
+        self.subscriptions[market_id] = callback
+
+    async def unwatch_orderbook(self, market_id):
+        self.subscriptions.pop(market_id, None)
+
+
+class FakeLimitlessWebSocket:
+    def __init__(self):
+        self.slugs = []
+        self.handlers = []
+
+    def on_orderbook(self, callback):
+        self.handlers.append(callback)
+        return self
+
+    async def subscribe_market(self, slug):
+        self.slugs.append(slug)
+
+    async def unsubscribe_market(self, slug):
+        self.slugs.remove(slug)
+
+
+class FakeRestExchange:
+    def __init__(self):
+        self.books = {}
+        self.calls = 0
+
+    def get_orderbook(self, token_id):
+        self.calls += 1
+        return self.books.get(token_id, {"bids": [], "asks": []})
+
+
+@pytest.mark.asyncio
+async def test_orderbook_relay_routes_namespaced_assets_to_feeds():
+    poly, kalshi = FakeFeed(), FakeFeed()
+    relay = OrderbookRelay(feeds={"polymarket": poly, "kalshi": kalshi}, stats_interval_sec=0)
+    client = FakeClient()
+    relay.clients = {client}
+
+    await relay.handle_client_message(
+        client,
+        json.dumps(
+            {"type": "subscribe", "assets": ["polymarket:tok-1", "kalshi:KX-1", "opinion:9"]}
+        ),
+    )
+
+    assert set(poly.callbacks) == {"tok-1"}
+    assert set(kalshi.callbacks) == {"KX-1"}
+    assert client.sent[0]["assets"] == 2
+    assert client.sent[0]["rejected"] == ["opinion:9"]
+    assert relay.stats.source_assets == 2
+
+    kalshi.callbacks["KX-1"]("KX-1", {"bids": [(0.4, 1.0)], "asks": [], "timestamp": 1})
+    await relay.flush()
+    assert client.sent[-1]["asset_id"] == "kalshi:KX-1"
+    assert "kalshi:KX-1" in relay.last_book_by_asset
+    await relay.stop()
+
+
+@pytest.mark.asyncio
+async def test_orderbook_relay_releases_assets_on_their_own_feed():
+    poly, kalshi = FakeFeed(), FakeFeed()
+    relay = OrderbookRelay(
+        feeds={"polymarket": poly, "kalshi": kalshi},
+        stats_interval_sec=0,
+        unsubscribe_grace_sec=0,
+    )
+    client = FakeClient()
+    relay.clients = {client}
+    await relay.handle_client_message(
+        client, json.dumps({"type": "subscribe", "assets": ["polymarket:a", "kalshi:a:b"]})
+    )
+
+    relay._drop_client(client)
+    await relay._unsubscribe_task
+
+    assert poly.unsubscribed == ["a"]
+    assert kalshi.unsubscribed == ["a:b"]
+    await relay.stop()
+
+
+def test_split_asset_key_keeps_colons_in_asset_id():
+    assert split_asset_key("kalshi:a:b") == ("kalshi", "a:b")
+
+
+@pytest.mark.asyncio
+async def test_websocket_feed_falls_back_to_per_asset_watch():
+    websocket = FakeOrderBookWebSocket()
+    feed = as_feed(websocket)
+    assert isinstance(feed, WebSocketFeed)
+
+    await feed.subscribe({"m1": print, "m2": print})
+    await feed.unsubscribe(["m1"])
+
+    assert feed.assets == {"m2"}
+
+
+@pytest.mark.asyncio
+async def test_limitless_feed_routes_updates_by_slug():
+    websocket = FakeLimitlessWebSocket()
+    feed = as_feed(websocket)
+    assert isinstance(feed, LimitlessFeed)
+    books = []
+    await feed.subscribe({"btc-100k": lambda asset_id, book: books.append((asset_id, book))})
+
+    update = SimpleNamespace(
+        slug="btc-100k",
+        bids=[(0.4, 10.0)],
+        asks=[(0.6, 5.0)],
+        timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    )
+    websocket.handlers[0](update)
+    websocket.handlers[0](SimpleNamespace(**{**vars(update), "slug": "other"}))
+
+    assert websocket.slugs == ["btc-100k"]
+    assert books == [
+        (
+            "btc-100k",
+            {
+                "bids": [(0.4, 10.0)],
+                "asks": [(0.6, 5.0)],
+                "timestamp": 1704067200000,
+                "market_id": "btc-100k",
+            },
+        )
+    ]
+
+
+@pytest.mark.asyncio
+async def test_polling_feed_emits_only_changed_books():
+    exchange = FakeRestExchange()
+    exchange.books["KX-1"] = {"bids": [{"price": "0.40", "size": "10"}], "asks": []}
+    feed = as_feed(exchange)
+    assert isinstance(feed, PollingFeed)
+    books = []
+
+    await feed.subscribe({"KX-1": lambda asset_id, book: books.append(book)})
+    await feed.poll("KX-1")  # unchanged: no callback
+    assert len(books) == 1
+    exchange.books["KX-1"] = {
+        "bids": [{"price": "0.41", "size": "3"}, {"price": "0.40", "size": "10"}],
+        "asks": [{"price": "0.45", "size": "1"}],
+    }
+    await feed.poll("KX-1")
+
+    assert exchange.calls == 3
+    assert [book["bids"] for book in books] == [[(0.40, 10.0)], [(0.41, 3.0), (0.40, 10.0)]]
+    assert books[-1]["asks"] == [(0.45, 1.0)]
+
+    await feed.unsubscribe(["KX-1"])
+    await feed.poll("KX-1")
+    assert len(books) == 2
+
+
+@pytest.mark.asyncio
+async def test_polling_feed_loop_polls_on_interval():
+    exchange = FakeRestExchange()
+    feed = PollingFeed(exchange, interval_sec=0.05)
+    await feed.subscribe({"KX-1": lambda asset_id, book: None})
+    await feed.start()
+    await asyncio.sleep(0.12)
+    await feed.stop()
+
+    assert exchange.calls >= 3
+
+
+def test_as_feed_rejects_unknown_sources():
+    with pytest.raises(TypeError):
+        as_feed(object())
+
+
+@pytest.mark.asyncio
+async def test_orderbook_relay_warm_restarts_from_snapshot(tmp_path):
+    path = tmp_path / "relay.sqlite"
+    feed = FakeFeed()
+    relay = OrderbookRelay(feeds={"kalshi": feed}, stats_interval_sec=0, snapshot_path=path)
+    client = FakeClient()
+    relay.clients = {client}
+    await relay.handle_client_message(
+        client, json.dumps({"type": "subscribe", "assets": ["kalshi:KX-1"]})
+    )
+    feed.callbacks["KX-1"]("KX-1", {"bids": [(0.4, 1.0)], "asks": [], "timestamp": 1})
+    await relay.stop()
+
+    restarted_feed = FakeFeed()
+    restarted = OrderbookRelay(
+        feeds={"kalshi": restarted_feed}, stats_interval_sec=0, snapshot_path=path
+    )
+    await restarted.start()
+    assert set(restarted_feed.callbacks) == {"KX-1"}
+    assert "kalshi:KX-1" in restarted.pending_unsubscribes
+
+    client = FakeClient()
+    restarted.clients = {client}
+    await restarted.handle_client_message(
+        client, json.dumps({"type": "subscribe", "assets": ["kalshi:KX-1"]})
+    )
+    await restarted.flush()
+    replay = client.sent[-1]
+    assert replay["stale"] and replay["replay"]
+    assert replay["book"]["bids"] == [[0.4, 1.0]]
+    assert not restarted.pending_unsubscribes
+
+    restarted_feed.callbacks["KX-1"]("KX-1", {"bids": [(0.41, 2.0)], "asks": [], "timestamp": 2})
+    await restarted.flush()
+    assert "stale" not in client.sent[-1]
+    await restarted.stop()
+
+
+@pytest.mark.asyncio
+async def test_orderbook_relay_stale_delta_snapshot_is_followed_by_fresh_snapshot(tmp_path):
+    path = tmp_path / "relay.sqlite"
+    RelaySnapshotStore(path).save(
+        {
+            "kalshi:KX-1": {
+                "type": "book",
+                "asset_id": "kalshi:KX-1",
+                "book": {"bids": [[0.4, 1.0]], "asks": [], "timestamp": 1},
+            }
+        },
+        {"kalshi:KX-1"},
+        saved_ms=1,
+    )
+    feed = FakeFeed()
+    relay = OrderbookRelay(feeds={"kalshi": feed}, stats_interval_sec=0, snapshot_path=path)
+    await relay.start()
+    client = FakeClient()
+    relay.clients = {client}
+    await relay.handle_client_message(
+        client,
+        json.dumps({"type": "subscribe", "assets": ["kalshi:KX-1"], "protocol": "delta"}),
+    )
+    await relay.flush()
+    assert client.sent[-1]["type"] == "book_snapshot" and client.sent[-1]["stale"]
+
+    feed.callbacks["KX-1"]("KX-1", {"bids": [(0.4, 1.0)], "asks": [], "timestamp": 2})
+    await relay.flush()
+    fresh = client.sent[-1]
+    assert fresh["type"] == "book_snapshot" and "stale" not in fresh
+    assert fresh["seq"] == 2
+    await relay.stop()
+
+
+def test_relay_snapshot_store_ignores_missing_or_corrupt_files(tmp_path):
+    assert RelaySnapshotStore(tmp_path / "missing.sqlite").load().books == {}
+    corrupt = tmp_path / "corrupt.sqlite"
+    corrupt.write_bytes(b"not a database" * 100)
+    assert RelaySnapshotStore(corrupt).load().assets == frozenset()
+
+
+@pytest.mark.asyncio
+async def test_orderbook_relay_metrics_per_client_and_asset():
+    feed = FakeFeed()
+    relay = OrderbookRelay(feeds={"kalshi": feed}, stats_interval_sec=0)
+    fast, slow = FakeClient(), FakeClient()
+    fast.remote_address = ("127.0.0.1", 50001)
+    slow.transport = SimpleNamespace(get_write_buffer_size=lambda: 10**9)
+    relay.clients = {fast, slow}
+    for client in (fast, slow):
+        await relay.handle_client_message(
+            client, json.dumps({"type": "subscribe", "assets": ["kalshi:KX-1"]})
+        )
+
+    for price in (0.40, 0.41):
+        feed.callbacks["KX-1"]("KX-1", {"bids": [(price, 1.0)], "asks": [], "timestamp": 1})
+        await relay.flush()
+
+    metrics = relay.metrics()
+    by_client = {client.client: client for client in metrics.clients}
+    assert by_client["127.0.0.1:50001"].sent == 2
+    assert by_client["127.0.0.1:50001"].receive_to_send.count == 2
+    assert by_client["127.0.0.1:50001"].send_rate == pytest.approx(0.2)
+    (slow_metrics,) = [c for c in metrics.clients if c.client != "127.0.0.1:50001"]
+    assert slow_metrics.dropped == 2 and slow_metrics.write_buffer_bytes == 10**9
+
+    (asset,) = metrics.assets
+    assert (asset.asset, asset.subscribers, asset.updates, asset.sent) == ("kalshi:KX-1", 2, 2, 2)
+    assert asset.receive_to_send.count == 2
+    assert metrics.to_dict()["stats"]["books_received"] == 2
+
+    text = format_prometheus(metrics)
+    assert 'orderbook_relay_asset_updates_total{asset="kalshi:KX-1"} 2' in text
+    assert 'orderbook_relay_client_dropped_total{client="127.0.0.1:50001"' in text
+    await relay.stop()
+
+
+@pytest.mark.asyncio
+async def test_metrics_server_serves_prometheus_and_json():
+    relay = OrderbookRelay(stats_interval_sec=0)
+    server = MetricsServer(relay, port=0)
+    await server.start()
+
+    async def get(path):
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: x\r\n\r\n".encode())
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        return response.decode().split("\r\n\r\n", 1)
+
+    head, body = await get("/metrics")
+    assert head.startswith("HTTP/1.1 200") and "orderbook_relay_clients 0" in body
+    head, body = await get("/metrics.json")
+    assert json.loads(body)["relay"] == "orderbook_relay"
+    head, _ = await get("/other")
+    assert head.startswith("HTTP/1.1 404")
+    await server.stop()
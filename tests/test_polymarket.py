@@ -1,9 +1,12 @@
 """Tests for Polymarket exchange implementation"""
 
+import asyncio
+import time
 from datetime import datetime, timezone
 from unittest.mock import Mock, patch
 
 import pytest
+import pytest_asyncio
 
 from dr_manhattan.base.errors import AuthenticationError, MarketNotFound
 from dr_manhattan.exchanges.polymarket import Polymarket
@@ -59,7 +62,7 @@ def test_polymarket_initialization_with_private_key():
         Polymarket(config)
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_fetch_markets(mock_get):
     """Test fetching markets from CLOB API"""
     mock_response = Mock()
@@ -97,7 +100,7 @@ def test_fetch_markets(mock_get):
 
 
 @patch.object(Polymarket, "fetch_token_ids", return_value=["token1", "token2"])
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_fetch_market(mock_get, mock_fetch_token_ids):
     """Test fetching a specific market"""
     mock_response = Mock()
@@ -124,7 +127,7 @@ def test_fetch_market(mock_get, mock_fetch_token_ids):
     mock_fetch_token_ids.assert_called_once_with("0xmarket123")
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_fetch_market_not_found(mock_get):
     """Test fetching non-existent market"""
     mock_response = Mock()
@@ -341,3 +344,186 @@ def test_parse_gamma_market_extracts_clob_token_ids_from_token_objects():
 
     assert market.metadata["clobTokenIds"] == ["token_yes", "token_no"]
     assert market.metadata["tokens"][0]["token_id"] == "token_yes"
+
+
+@pytest_asyncio.fixture
+async def polymarket_server():
+    """Local HTTP server standing in for the CLOB and Gamma APIs"""
+    from aiohttp import web
+
+    requests_seen = []
+
+    async def book(request):
+        requests_seen.append(request.query["token_id"])
+        return web.json_response(
+            {"asset_id": request.query["token_id"], "bids": [{"price": "0.4", "size": "5"}]}
+        )
+
+    async def sampling_markets(request):
+        return web.json_response({"data": []}, status=500)
+
+    async def markets(request):
+        if request.query.get("slug") == "missing":
+            return web.json_response([])
+        assert request.query["active"] == "true"
+        return web.json_response(
+            [
+                {
+                    "id": "123",
+                    "question": "Async?",
+                    "outcomes": '["Yes", "No"]',
+                    "outcomePrices": '["0.5", "0.5"]',
+                    "clobTokenIds": '["token1", "token2"]',
+                    "minimum_tick_size": 0.01,
+                }
+            ]
+        )
+
+    app = web.Application()
+    app.router.add_get("/book", book)
+    app.router.add_get("/sampling-markets", sampling_markets)
+    app.router.add_get("/markets", markets)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}", requests_seen
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_async_get_orderbooks_fans_out_on_one_session(polymarket_server):
+    url, requests_seen = polymarket_server
+    exchange = Polymarket({"rate_limit": 1000})
+    exchange.CLOB_URL = url
+
+    async with exchange:
+        books = await exchange.async_get_orderbooks([f"tok-{i}" for i in range(50)])
+        session = exchange._async_session
+        assert session is not None
+        assert books["tok-7"]["bids"] == [{"price": "0.4", "size": "5"}]
+    assert len(requests_seen) == 50
+    assert session.closed and exchange._async_session is None
+
+
+@pytest.mark.asyncio
+async def test_async_fetch_markets_falls_back_to_gamma(polymarket_server):
+    url, _ = polymarket_server
+    exchange = Polymarket({"max_retries": 0})
+    exchange.CLOB_URL = exchange.BASE_URL = url
+
+    async with exchange:
+        markets = await exchange.async_fetch_markets()
+        assert [m.question for m in markets] == ["Async?"]
+        with pytest.raises(MarketNotFound):
+            await exchange.async_fetch_market("missing")
+
+
+@pytest.mark.asyncio
+async def test_async_methods_default_to_sync_in_thread():
+    exchange = Polymarket()
+    with patch.object(Polymarket, "fetch_balance", return_value={"USDC": 1.0}) as fetch_balance:
+        assert await exchange.async_fetch_balance() == {"USDC": 1.0}
+    fetch_balance.assert_called_once_with()
+
+
+@patch("requests.Session.get")
+def test_fetch_token_ids_is_served_from_market_cache(mock_get):
+    condition_id = "0x" + "a" * 64
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {
+        "data": [{"condition_id": condition_id, "tokens": [{"token_id": "1"}, {"token_id": "2"}]}]
+    }
+    mock_get.return_value = mock_response
+    exchange = Polymarket()
+
+    assert exchange.fetch_token_ids(condition_id) == ["1", "2"]
+    assert exchange._resolve_token_id(condition_id, "No") == "2"
+
+    # Resolving again on the order path skips the CLOB market scan
+    assert mock_get.call_count == 1
+    assert exchange.market_cache.stats.hits == 1
+
+
+def _paged_rows(total, delay=0.0, calls=None):
+    """fetch_page over `total` rows with ids 0..total-1, sleeping `delay` per page."""
+
+    def fetch_page(offset, limit):
+        if calls is not None:
+            calls.append((offset, limit))
+        time.sleep(delay)
+        return [{"id": i} for i in range(offset, min(offset + limit, total))]
+
+    return fetch_page
+
+
+def test_collect_paginated_fetches_pages_concurrently_in_order():
+    exchange = Polymarket({"pagination_workers": 4})
+    fetch_page = _paged_rows(1000, delay=0.1)
+
+    start = time.monotonic()
+    rows = exchange._collect_paginated(fetch_page, total_limit=800, page_size=100)
+    elapsed = time.monotonic() - start
+
+    assert [row["id"] for row in rows] == list(range(800))
+    assert elapsed < 0.6  # 8 pages sequentially would take 0.8s
+
+
+def test_collect_paginated_stops_on_short_page_and_dedups():
+    exchange = Polymarket({"pagination_workers": 3})
+    calls = []
+    inner = _paged_rows(250, calls=calls)
+
+    def fetch_page(offset, limit):
+        # Overlapping pages: each repeats the last row of the previous one
+        return inner(max(0, offset - 1), limit)
+
+    rows = exchange._collect_paginated(
+        fetch_page, total_limit=1000, page_size=100, dedup_key=lambda row: row["id"]
+    )
+
+    assert [row["id"] for row in rows] == list(range(250))
+    # The short third page ends collection; at most one window of pages follows it
+    assert len(calls) <= 6
+    assert sorted(offset for offset, _ in calls)[:3] == [0, 99, 199]
+
+
+def test_collect_paginated_single_worker_matches_sequential_walk():
+    exchange = Polymarket({"pagination_workers": 1})
+    calls = []
+
+    rows = exchange._collect_paginated(
+        _paged_rows(250, calls=calls), total_limit=1000, page_size=100
+    )
+
+    assert len(rows) == 250
+    assert calls == [(0, 100), (100, 100), (200, 100)]
+
+
+def test_collect_paginated_propagates_page_errors():
+    exchange = Polymarket({})
+
+    def fetch_page(offset, limit):
+        if offset >= 200:
+            raise RuntimeError("boom")
+        return [{"id": i} for i in range(offset, offset + limit)]
+
+    with pytest.raises(RuntimeError, match="boom"):
+        exchange._collect_paginated(fetch_page, total_limit=1000, page_size=100)
+
+
+def test_async_session_from_a_finished_loop_is_closed_on_replacement():
+    exchange = Polymarket()
+
+    async def session():
+        return await exchange._get_async_session()
+
+    first = asyncio.run(session())
+    second = asyncio.run(session())
+
+    assert first.closed
+    assert second is not first and not second.closed
+    asyncio.run(exchange.aclose())
+    assert second.closed
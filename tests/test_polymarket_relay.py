@@ -1,10 +1,17 @@
+import asyncio
 import json
 
 import pytest
 
 from dr_manhattan.base.websocket import WebSocketState
 from dr_manhattan.exchanges.polymarket.polymarket_ws import PolymarketWebSocket
-from dr_manhattan.marketdata import PolymarketOrderbookRelay
+from dr_manhattan.marketdata import (
+    PolymarketOrderbookRelay,
+    RelayBookDecoder,
+    decode_message,
+    encode_binary,
+    relay_codec,
+)
 
 
 class FakeClient:
@@ -33,6 +40,11 @@ class FakeSource:
     async def watch_orderbooks_by_assets(self, callbacks):
         self.subscriptions.update(callbacks)
 
+    async def unwatch_orderbooks_by_assets(self, asset_ids):
+        self.unwatched = getattr(self, "unwatched", []) + list(asset_ids)
+        for asset_id in asset_ids:
+            self.subscriptions.pop(asset_id, None)
+
 
 class FakeWire:
     def __init__(self):
@@ -76,6 +88,285 @@ async def test_polymarket_relay_subscribes_union_of_client_assets():
     assert client.sent[0]["assets"] == 2
 
 
+@pytest.mark.asyncio
+async def test_polymarket_relay_incremental_mode_keeps_source_and_cache_warm():
+    sources = []
+
+    def factory():
+        sources.append(FakeSource())
+        return sources[-1]
+
+    relay = PolymarketOrderbookRelay(
+        source_factory=factory,
+        refresh_on_client_subscribe=False,
+        stats_interval_sec=0,
+        unsubscribe_grace_sec=60,
+    )
+    first, second = FakeClient(), FakeClient()
+    relay.clients = {first, second}
+    await relay.handle_client_message(first, json.dumps({"type": "subscribe", "assets": ["a"]}))
+    relay._make_callback("a")("a", {"bids": [(0.4, 1.0)], "asks": []})
+
+    await relay.handle_client_message(
+        second, json.dumps({"type": "subscribe", "assets": ["a", "b"]})
+    )
+    await relay.flush()
+
+    assert len(sources) == 1
+    assert set(sources[0].subscriptions) == {"a", "b"}
+    assert second.sent[1]["replay"] is True
+    assert len([m for m in first.sent if m["type"] == "book"]) == 1
+
+    # "b" stays subscribed through the grace period and is revived by a new client
+    relay._drop_client(second)
+    assert relay.stats.pending_unsubscribes == 1
+    await relay.handle_client_message(
+        first, json.dumps({"type": "subscribe", "assets": ["a", "b"]})
+    )
+    assert relay.stats.pending_unsubscribes == 0
+    assert set(sources[0].subscriptions) == {"a", "b"}
+    await relay.stop()
+
+
+@pytest.mark.asyncio
+async def test_polymarket_relay_unsubscribes_unwanted_assets_after_grace():
+    source = FakeSource()
+    relay = PolymarketOrderbookRelay(
+        source_factory=lambda: source,
+        refresh_on_client_subscribe=False,
+        stats_interval_sec=0,
+        unsubscribe_grace_sec=0.01,
+    )
+    client = FakeClient()
+    relay.clients = {client}
+    await relay.handle_client_message(
+        client, json.dumps({"type": "subscribe", "assets": ["a", "b"]})
+    )
+    relay._make_callback("b")("b", {"bids": [], "asks": []})
+
+    await relay.handle_client_message(client, json.dumps({"type": "subscribe", "assets": ["a"]}))
+    assert "b" in source.subscriptions
+    await relay._unsubscribe_task
+
+    assert source.unwatched == ["b"]
+    assert set(source.subscriptions) == {"a"}
+    assert "b" not in relay.last_book_by_asset
+    assert relay.stats.pending_unsubscribes == 0
+    await relay.stop()
+
+
+def apply_delta(levels, changes):
+    for price, size in changes:
+        if size:
+            levels[price] = size
+        else:
+            levels.pop(price, None)
+
+
+@pytest.mark.asyncio
+async def test_polymarket_relay_delta_protocol_sends_snapshot_then_level_diffs():
+    relay = PolymarketOrderbookRelay(
+        source_factory=FakeSource, refresh_on_client_subscribe=False, stats_interval_sec=0
+    )
+    delta, full = FakeClient(), FakeClient()
+    relay.clients = {delta, full}
+    callback = relay._make_callback("a")
+    callback("a", {"bids": [(0.40, 10.0), (0.39, 5.0)], "asks": [(0.42, 12.0)], "timestamp": 1})
+
+    await relay.handle_client_message(
+        delta, json.dumps({"type": "subscribe", "assets": ["a"], "protocol": "delta"})
+    )
+    await relay.handle_client_message(full, json.dumps({"type": "subscribe", "assets": ["a"]}))
+    await relay.flush()
+    callback("a", {"bids": [(0.40, 7.0), (0.39, 5.0)], "asks": [(0.41, 1.0)], "timestamp": 2})
+    await relay.flush()
+    callback("a", {"bids": [(0.40, 7.0), (0.39, 5.0)], "asks": [(0.41, 1.0)], "timestamp": 3})
+    await relay.flush()
+
+    assert delta.sent[0]["protocol"] == "delta"
+    snapshot, diff = delta.sent[1:]
+    assert snapshot["type"] == "book_snapshot"
+    assert snapshot["bids"] == [[0.40, 10.0], [0.39, 5.0]]
+    assert diff["type"] == "book_delta"
+    assert diff["seq"] == snapshot["seq"] + 1
+    assert diff["bids"] == [[0.40, 7.0]]
+    assert sorted(diff["asks"]) == [[0.41, 1.0], [0.42, 0.0]]
+
+    bids, asks = dict(snapshot["bids"]), dict(snapshot["asks"])
+    apply_delta(bids, diff["bids"])
+    apply_delta(asks, diff["asks"])
+    assert bids == {0.40: 7.0, 0.39: 5.0}
+    assert asks == {0.41: 1.0}
+    # Full-book clients are unaffected by negotiation on other connections
+    assert [m["type"] for m in full.sent] == ["subscribed", "book", "book", "book"]
+    await relay.stop()
+
+
+@pytest.mark.asyncio
+async def test_polymarket_relay_delta_client_gets_snapshot_when_delta_coalesced():
+    relay = PolymarketOrderbookRelay(source_factory=FakeSource, stats_interval_sec=0)
+    slow = SlowClient()
+    relay.clients = {slow}
+    relay.assets_by_client = {slow: {"a"}}
+    relay.protocol_by_client = {slow: "delta"}
+    callback = relay._make_callback("a")
+
+    callback("a", {"bids": [(0.40, 1.0)], "asks": []})
+    await asyncio.sleep(0)  # writer takes the snapshot and blocks in send
+    callback("a", {"bids": [(0.41, 1.0)], "asks": []})
+    callback("a", {"bids": [(0.42, 1.0)], "asks": []})
+    slow.release.set()
+    await relay.flush()
+
+    first, second = slow.sent
+    assert first["type"] == "book_snapshot"
+    assert second["type"] == "book_snapshot"
+    assert second["bids"] == [[0.42, 1.0]]
+    assert second["seq"] == first["seq"] + 2
+
+    await relay.handle_client_message(slow, json.dumps({"type": "resync"}))
+    await relay.flush()
+    assert slow.sent[-1]["type"] == "book_snapshot"
+    assert slow.sent[-1]["seq"] == second["seq"]
+    await relay.stop()
+
+
+@pytest.mark.asyncio
+async def test_polymarket_relay_delta_client_resyncs_after_dropped_delta():
+    relay = PolymarketOrderbookRelay(
+        source_factory=FakeSource, stats_interval_sec=0, max_client_write_buffer_bytes=10
+    )
+    client = BackedUpClient(write_buffer_size=0)
+    relay.clients = {client}
+    relay.assets_by_client = {client: {"a"}}
+    relay.protocol_by_client = {client: "delta"}
+    callback = relay._make_callback("a")
+
+    callback("a", {"bids": [(0.40, 1.0)], "asks": []})
+    await relay.flush()
+    client.transport.write_buffer_size = 11
+    callback("a", {"bids": [(0.41, 1.0)], "asks": []})
+    await relay.flush()
+    client.transport.write_buffer_size = 0
+    callback("a", {"bids": [(0.41, 2.0)], "asks": []})
+    await relay.flush()
+
+    assert relay.stats.books_dropped == 1
+    assert [m["type"] for m in client.sent] == ["book_snapshot", "book_snapshot"]
+    assert client.sent[-1]["bids"] == [[0.41, 2.0]]
+    await relay.stop()
+
+
+class RawClient:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, message):
+        self.sent.append(message)
+
+
+def test_relay_binary_codec_round_trips_book_messages():
+    book = {
+        "type": "book",
+        "asset_id": "asset-1",
+        "relay_received_ms": 1_700_000_000_000,
+        "relay_sent_ms": 1_700_000_000_005,
+        "replay": True,
+        "book": {
+            "bids": [(0.40, 10.0), (0.39, 5.5)],
+            "asks": [(0.42, 12.0)],
+            "timestamp": "1700000000123",
+            "market_id": "m1",
+        },
+    }
+
+    message = decode_message(encode_binary(book))
+
+    assert message.type == "book"
+    assert message.asset_id == "asset-1"
+    assert message.market_id == "m1"
+    assert message.bids == [(0.40, 10.0), (0.39, 5.5)]
+    assert message.asks == [(0.42, 12.0)]
+    assert message.timestamp == 1700000000123
+    assert message.relay_sent_ms == 1_700_000_000_005
+    assert message.replay is True
+    assert message.stale is False
+    assert decode_message(encode_binary({**book, "stale": True})).stale is True
+
+    delta = decode_message(
+        encode_binary(
+            {"type": "book_delta", "asset_id": "a", "seq": 7, "bids": [(0.4, 0.0)], "asks": []}
+        )
+    )
+    assert (delta.type, delta.seq, delta.bids, delta.asks) == ("book_delta", 7, [(0.4, 0.0)], [])
+
+
+@pytest.mark.asyncio
+async def test_polymarket_relay_binary_clients_decode_into_orderbooks(monkeypatch):
+    relay = PolymarketOrderbookRelay(
+        source_factory=FakeSource, refresh_on_client_subscribe=False, stats_interval_sec=0
+    )
+    binary_delta, binary_book, json_delta = RawClient(), RawClient(), RawClient()
+    relay.clients = {binary_delta, binary_book, json_delta}
+    for client, protocol, encoding in (
+        (binary_delta, "delta", "binary"),
+        (binary_book, "book", "binary"),
+        (json_delta, "delta", "json"),
+    ):
+        await relay.handle_client_message(
+            client,
+            json.dumps(
+                {"type": "subscribe", "assets": ["a"], "protocol": protocol, "encoding": encoding}
+            ),
+        )
+    assert json.loads(binary_delta.sent[0])["encoding"] == "binary"
+
+    encoded = []
+    original = encode_binary
+    monkeypatch.setitem(
+        relay_codec.ENCODERS,
+        "binary",
+        lambda message: encoded.append(message["type"]) or original(message),
+    )
+    callback = relay._make_callback("a")
+    callback("a", {"bids": [(0.40, 10.0)], "asks": [(0.42, 12.0)], "timestamp": 1})
+    await relay.flush()
+    callback("a", {"bids": [(0.41, 3.0), (0.40, 10.0)], "asks": [], "timestamp": 2})
+    await relay.flush()
+
+    # One binary encoding per message, shared by every binary client that needs it
+    assert sorted(encoded) == ["book", "book", "book_delta", "book_snapshot"]
+    assert all(isinstance(m, bytes) for m in binary_delta.sent[1:] + binary_book.sent[1:])
+    assert all(isinstance(m, str) for m in json_delta.sent)
+
+    for client in (binary_delta, binary_book, json_delta):
+        decoder = RelayBookDecoder()
+        books = [decoder.feed(message) for message in client.sent]
+        assert books[0] is None  # subscribed ack
+        latest = books[-1]
+        assert latest.asset_id == "a"
+        assert latest.bids == [(0.41, 3.0), (0.40, 10.0)]
+        assert latest.asks == []
+        assert latest.timestamp == 2
+    await relay.stop()
+
+
+def test_relay_book_decoder_requests_resync_once_per_gap():
+    decoder = RelayBookDecoder()
+    snapshot = {"type": "book_snapshot", "asset_id": "a", "seq": 3, "bids": [(0.4, 1.0)]}
+    decoder.feed(encode_binary(snapshot))
+
+    gap = {"type": "book_delta", "asset_id": "a", "seq": 5, "bids": [(0.4, 2.0)], "asks": []}
+    assert decoder.feed(encode_binary(gap)) is None
+    assert decoder.feed(encode_binary({**gap, "seq": 6})) is None
+    assert json.loads(decoder.resync_message()) == {"type": "resync", "assets": ["a"]}
+    assert decoder.resync_message() is None
+
+    book = decoder.feed(encode_binary({**snapshot, "seq": 6, "bids": [(0.4, 2.0)]}))
+    assert book.bids == [(0.4, 2.0)]
+    assert decoder.resync_assets == set()
+
+
 @pytest.mark.asyncio
 async def test_polymarket_relay_broadcasts_only_to_subscribed_clients():
     relay = PolymarketOrderbookRelay(source_factory=FakeSource, stats_interval_sec=0)
@@ -85,6 +376,7 @@ async def test_polymarket_relay_broadcasts_only_to_subscribed_clients():
     relay.assets_by_client = {subscribed: {"asset-1"}, other: {"asset-2"}}
 
     await relay.broadcast("asset-1", {"type": "book", "asset_id": "asset-1", "book": {}})
+    await relay.flush()
 
     assert len(subscribed.sent) == 1
     assert subscribed.sent[0]["asset_id"] == "asset-1"
@@ -104,12 +396,71 @@ async def test_polymarket_relay_drops_stale_books_when_client_backed_up():
     relay.assets_by_client = {backed_up: {"asset-1"}}
 
     await relay.broadcast("asset-1", {"type": "book", "asset_id": "asset-1", "book": {}})
+    await relay.flush()
 
     assert backed_up.sent == []
     assert relay.stats.books_sent == 0
     assert relay.stats.books_dropped == 1
 
 
+class SlowClient(FakeClient):
+    def __init__(self):
+        super().__init__()
+        self.release = asyncio.Event()
+
+    async def send(self, message):
+        await self.release.wait()
+        await super().send(message)
+
+
+@pytest.mark.asyncio
+async def test_polymarket_relay_coalesces_per_client_without_blocking_others():
+    relay = PolymarketOrderbookRelay(source_factory=FakeSource, stats_interval_sec=0)
+    slow = SlowClient()
+    fast = FakeClient()
+    relay.clients = {slow, fast}
+    relay.assets_by_client = {slow: {"asset-1", "asset-2"}, fast: {"asset-1"}}
+    callback = relay._make_callback("asset-1")
+
+    callback("asset-1", {"bids": [(0.40, 1.0)], "asks": []})
+    await asyncio.sleep(0)  # slow writer takes book 1 and blocks in send
+    for price in (0.41, 0.42, 0.43):
+        callback("asset-1", {"bids": [(price, 1.0)], "asks": []})
+        await asyncio.sleep(0)
+    relay.publish("asset-2", {"type": "book", "asset_id": "asset-2", "book": {}})
+
+    assert [m["book"]["bids"][0][0] for m in fast.sent] == [0.40, 0.41, 0.42, 0.43]
+    assert slow.sent == []
+
+    slow.release.set()
+    await relay.flush()
+
+    assert [m["asset_id"] for m in slow.sent] == ["asset-1", "asset-1", "asset-2"]
+    assert [m["book"]["bids"][0][0] for m in slow.sent[:2]] == [0.40, 0.43]
+    assert relay.stats.books_coalesced == 2
+    assert relay.stats.books_sent == 7
+    await relay.stop()
+
+
+@pytest.mark.asyncio
+async def test_polymarket_relay_serializes_each_book_once(monkeypatch):
+    relay = PolymarketOrderbookRelay(source_factory=FakeSource, stats_interval_sec=0)
+    clients = [FakeClient() for _ in range(5)]
+    relay.clients = set(clients)
+    relay.assets_by_client = {client: {"asset-1"} for client in clients}
+    calls = []
+    dumps = json.dumps
+    monkeypatch.setattr(
+        "dr_manhattan.utils.json_codec.dumps", lambda obj: calls.append(obj) or dumps(obj)
+    )
+
+    relay.publish("asset-1", {"type": "book", "asset_id": "asset-1", "book": {}})
+    await relay.flush()
+
+    assert len(calls) == 1
+    assert all(len(client.sent) == 1 for client in clients)
+
+
 @pytest.mark.asyncio
 async def test_polymarket_ws_sends_full_asset_subscription_batch():
     ws = PolymarketWebSocket()
@@ -151,4 +502,62 @@ def test_polymarket_ws_price_change_updates_cached_depth_for_multiple_assets():
 
     assert [update["asset_id"] for update in updates] == ["asset-1", "asset-2"]
     assert updates[0]["bids"][0] == (0.41, 3.0)
-    assert updates[1]["asks"] == [(0.61, 4.0)]
+    assert list(updates[1]["asks"]) == [(0.61, 4.0)]
+
+
+def test_polymarket_ws_price_change_emits_one_book_per_asset():
+    ws = PolymarketWebSocket()
+    ws._parse_book_message(
+        {
+            "event_type": "book",
+            "market": "m1",
+            "asset_id": "asset-1",
+            "timestamp": 1,
+            "bids": [{"price": "0.40", "size": "10"}],
+            "asks": [{"price": "0.42", "size": "12"}],
+        }
+    )
+
+    updates = ws._parse_price_change_message(
+        {
+            "event_type": "price_change",
+            "market": "m1",
+            "timestamp": 2,
+            "price_changes": [
+                {"asset_id": "asset-1", "side": "BUY", "price": "0.41", "size": "3"},
+                {"asset_id": "asset-1", "side": "BUY", "price": "0.40", "size": "0"},
+                {"asset_id": "asset-1", "side": "SELL", "price": "0.43", "size": "5"},
+            ],
+        }
+    )
+
+    assert len(updates) == 1
+    assert list(updates[0]["bids"]) == [(0.41, 3.0)]
+    assert list(updates[0]["asks"]) == [(0.42, 12.0), (0.43, 5.0)]
+    assert updates[0]["timestamp"] == 2
+
+
+def test_polymarket_ws_best_bid_ask_prunes_crossed_depth():
+    ws = PolymarketWebSocket()
+    ws._parse_book_message(
+        {
+            "event_type": "book",
+            "market": "m1",
+            "asset_id": "asset-1",
+            "bids": [{"price": "0.40", "size": "10"}, {"price": "0.39", "size": "5"}],
+            "asks": [{"price": "0.42", "size": "12"}, {"price": "0.43", "size": "1"}],
+        }
+    )
+
+    updates = ws._parse_best_bid_ask_message(
+        {
+            "event_type": "best_bid_ask",
+            "market": "m1",
+            "asset_id": "asset-1",
+            "best_bid": "0.395",
+            "best_ask": "0.425",
+        }
+    )
+
+    assert list(updates[0]["bids"]) == [(0.39, 5.0)]
+    assert list(updates[0]["asks"]) == [(0.43, 1.0)]
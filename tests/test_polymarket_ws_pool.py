@@ -0,0 +1,210 @@
+import asyncio
+import json
+
+import pytest
+
+from dr_manhattan.base import websocket as base_websocket
+from dr_manhattan.base.websocket import WebSocketState
+from dr_manhattan.exchanges.polymarket.polymarket_ws import PolymarketWebSocket
+from dr_manhattan.exchanges.polymarket.polymarket_ws_pool import PolymarketWebSocketPool
+
+
+class FakeConnection:
+    def __init__(self):
+        self.sent = []
+        self.closed = False
+        self._closed_event = asyncio.Event()
+
+    async def send(self, message):
+        self.sent.append(json.loads(message))
+
+    async def close(self):
+        self.closed = True
+        self._closed_event.set()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        await self._closed_event.wait()
+        raise StopAsyncIteration
+
+
+@pytest.fixture
+def connections(monkeypatch):
+    opened = []
+
+    async def fake_connect(*args, **kwargs):
+        connection = FakeConnection()
+        opened.append(connection)
+        return connection
+
+    monkeypatch.setattr(base_websocket.websockets, "connect", fake_connect)
+    return opened
+
+
+def noop(asset_id, orderbook):
+    return None
+
+
+@pytest.mark.asyncio
+async def test_polymarket_ws_sends_incremental_subscription_deltas(connections):
+    ws = PolymarketWebSocket()
+
+    await ws.watch_orderbooks_by_assets({"a": noop, "b": noop})
+    await ws.watch_orderbook("c", noop)
+    await ws.unwatch_orderbook("a")
+
+    sent = connections[0].sent
+    assert len(sent) == 3
+    assert sorted(sent[0]["assets_ids"]) == ["a", "b"]
+    assert sent[1] == {
+        "assets_ids": ["c"],
+        "operation": "subscribe",
+        "custom_feature_enabled": True,
+    }
+    assert sent[2]["assets_ids"] == ["a"]
+    assert sent[2]["operation"] == "unsubscribe"
+
+
+@pytest.mark.asyncio
+async def test_polymarket_ws_batch_unwatch_sends_one_delta(connections):
+    ws = PolymarketWebSocket()
+    await ws.watch_orderbooks_by_assets({"a": noop, "b": noop, "c": noop})
+
+    await ws.unwatch_orderbooks_by_assets(["a", "c", "missing"])
+
+    assert set(ws.subscriptions) == {"b"}
+    assert connections[0].sent[-1] == {
+        "assets_ids": ["a", "c"],
+        "operation": "unsubscribe",
+        "custom_feature_enabled": True,
+    }
+    assert len(connections[0].sent) == 2
+
+
+@pytest.mark.asyncio
+async def test_polymarket_ws_reconnect_resubscribes_in_one_message(connections):
+    ws = PolymarketWebSocket()
+    await ws.watch_orderbooks_by_assets({"a": noop, "b": noop})
+    await ws.watch_orderbook("c", noop)
+
+    ws.state = WebSocketState.DISCONNECTED
+    await ws.connect()
+
+    assert len(connections[1].sent) == 1
+    assert sorted(connections[1].sent[0]["assets_ids"]) == ["a", "b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_watch_orderbook_by_market_subscribes_assets_in_one_delta(connections):
+    pool = PolymarketWebSocketPool(max_assets_per_connection=3)
+    await pool.watch_orderbooks_by_assets({"a": noop})
+
+    await pool.watch_orderbook_by_market("m1", ["b", "c", "d", "e"], noop)
+
+    assert connections[0].sent[-1] == {
+        "assets_ids": ["b", "c"],
+        "operation": "subscribe",
+        "custom_feature_enabled": True,
+    }
+    assert len(connections[0].sent) == 2
+    assert len(connections[1].sent) == 1
+    assert sorted(connections[1].sent[0]["assets_ids"]) == ["d", "e"]
+    assert set(pool.subscriptions) == set("abcde")
+    await pool.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_pool_shards_assets_by_connection_cap(connections):
+    pool = PolymarketWebSocketPool(max_assets_per_connection=2)
+
+    await pool.watch_orderbooks_by_assets({asset: noop for asset in "abcde"})
+
+    assert pool.connection_count == 3
+    assert [len(shard.assigned) for shard in pool.shards] == [2, 2, 1]
+    assert [len(conn.sent) for conn in connections] == [1, 1, 1]
+    assert set(pool.subscriptions) == set("abcde")
+
+    await pool.watch_orderbook("f", noop)
+
+    assert pool.connection_count == 3
+    assert connections[2].sent[-1]["operation"] == "subscribe"
+    assert connections[2].sent[-1]["assets_ids"] == ["f"]
+    await pool.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_pool_closes_empty_connections_and_rebalances_on_reconnect(connections):
+    pool = PolymarketWebSocketPool(max_assets_per_connection=2)
+    await pool.watch_orderbooks_by_assets({asset: noop for asset in "abcde"})
+    first, second, third = pool.shards
+
+    await pool.unwatch_orderbook("e")
+    assert pool.connection_count == 2
+    assert connections[2].closed
+
+    await pool.unwatch_orderbook("a")
+    assert connections[0].sent[-1]["operation"] == "unsubscribe"
+
+    # On reconnect the first connection tops itself up from the last one
+    first.state = WebSocketState.DISCONNECTED
+    await first.connect()
+
+    assert len(first.assigned) == 2
+    assert len(second.assigned) == 1
+    moved = (first.assigned - {"b"}).pop()
+    assert pool.shard_by_asset[moved] is first
+    assert moved in first.subscriptions and moved not in second.subscriptions
+    assert sorted(connections[3].sent[0]["assets_ids"]) == sorted(first.assigned)
+    assert connections[1].sent[-1] == {
+        "assets_ids": [moved],
+        "operation": "unsubscribe",
+        "custom_feature_enabled": True,
+    }
+    await pool.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_pool_connections_share_one_orderbook_manager(connections):
+    pool = PolymarketWebSocketPool(max_assets_per_connection=1)
+    await pool.watch_orderbook_by_market("m1", ["yes", "no"])
+
+    for shard, asset in zip(pool.shards, ["yes", "no"]):
+        await shard._process_message_item(
+            {
+                "event_type": "book",
+                "asset_id": asset,
+                "market": "m1",
+                "bids": [{"price": "0.40", "size": "10"}],
+                "asks": [{"price": "0.42", "size": "12"}],
+            }
+        )
+
+    manager = pool.get_orderbook_manager()
+    assert pool.connection_count == 2
+    assert manager.get_best_bid_ask("yes") == (0.40, 0.42)
+    assert manager.get_best_bid_ask("no") == (0.40, 0.42)
+    await pool.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_pool_rebalance_subscribes_moved_assets_on_target(connections):
+    pool = PolymarketWebSocketPool(max_assets_per_connection=2)
+    await pool.watch_orderbooks_by_assets({asset: noop for asset in "abc"})
+    first, second = pool.shards
+
+    await pool.unwatch_orderbook("a")
+    await pool.rebalance()
+
+    assert pool.shards == [first]
+    assert connections[1].closed
+    assert first.assigned == {"b", "c"}
+    assert first.subscribed_assets == {"b", "c"}
+    assert first._connection_assets == {"b", "c"}
+    assert connections[0].sent[-1] == {
+        "assets_ids": ["c"],
+        "operation": "subscribe",
+        "custom_feature_enabled": True,
+    }
+    await pool.disconnect()
@@ -0,0 +1,122 @@
+import asyncio
+
+import pytest
+
+from dr_manhattan.runtime import CoalescingDispatcher, OverflowPolicy
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_coalesces_to_latest_update_per_key():
+    release = asyncio.Event()
+    delivered = []
+
+    async def slow(key, value):
+        await release.wait()
+        delivered.append((key, value))
+
+    dispatcher = CoalescingDispatcher()
+    await dispatcher.submit("a", slow, "a", 0)
+    await asyncio.sleep(0)  # consumer picks up a:0 and blocks
+    for value in range(1, 5):
+        await dispatcher.submit("a", slow, "a", value)
+    await dispatcher.submit("b", slow, "b", 1)
+
+    release.set()
+    await dispatcher.join()
+
+    assert delivered == [("a", 0), ("a", 4), ("b", 1)]
+    stats = dispatcher.stats
+    assert stats.submitted == 6
+    assert stats.delivered == 3
+    assert stats.coalesced == 3
+    assert stats.pending == 0
+    assert stats.max_lag_ms >= stats.last_lag_ms >= 0
+    await dispatcher.close()
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_serves_keys_round_robin():
+    delivered = []
+    dispatcher = CoalescingDispatcher(depth=3)
+
+    for value in range(3):
+        await dispatcher.submit("a", delivered.append, f"a{value}")
+    await dispatcher.submit("b", delivered.append, "b0")
+    await dispatcher.join()
+
+    assert delivered == ["a0", "b0", "a1", "a2"]
+    await dispatcher.close()
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_overflow_policies():
+    def never_runs(*args):
+        raise AssertionError
+
+    newest = CoalescingDispatcher(overflow_policy=OverflowPolicy.DROP_NEWEST)
+    assert await newest.submit("a", never_runs, 1)
+    assert not await newest.submit("a", never_runs, 2)
+    assert newest.stats.dropped == 1
+
+    strict = CoalescingDispatcher(overflow_policy=OverflowPolicy.RAISE)
+    await strict.submit("a", never_runs, 1)
+    with pytest.raises(asyncio.QueueFull):
+        await strict.submit("a", never_runs, 2)
+
+    await newest.close()
+    await strict.close()
+    assert newest.stats.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_block_policy_waits_for_room():
+    delivered = []
+    dispatcher = CoalescingDispatcher(overflow_policy=OverflowPolicy.BLOCK)
+
+    for value in range(3):
+        await dispatcher.submit("a", delivered.append, value)
+    await dispatcher.join()
+
+    assert delivered == [0, 1, 2]
+    assert dispatcher.stats.coalesced == 0
+    await dispatcher.close()
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_counts_failures_and_keeps_running():
+    delivered = []
+
+    def boom(value):
+        raise ValueError(value)
+
+    dispatcher = CoalescingDispatcher()
+    await dispatcher.submit("a", boom, 1)
+    await dispatcher.submit("b", delivered.append, 2)
+    await dispatcher.join()
+
+    assert delivered == [2]
+    assert dispatcher.stats.failed == 1
+    await dispatcher.close()
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_drop_oldest_with_depth_one_schedules_key_once():
+    release = asyncio.Event()
+    delivered = []
+
+    async def slow(value):
+        await release.wait()
+        delivered.append(value)
+
+    dispatcher = CoalescingDispatcher()
+    # Nothing consumed yet: the second submit replaces the only queued item
+    await dispatcher.submit("a", slow, 1)
+    await dispatcher.submit("a", slow, 2)
+    assert list(dispatcher._ready) == ["a"]
+
+    release.set()
+    await asyncio.wait_for(dispatcher.join(), timeout=1)
+
+    assert delivered == [2]
+    assert dispatcher.stats.coalesced == 1
+    await dispatcher.close()
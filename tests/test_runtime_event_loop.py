@@ -0,0 +1,112 @@
+import asyncio
+import json
+import threading
+
+import pytest
+
+from dr_manhattan.base import websocket as base_websocket
+from dr_manhattan.exchanges.polymarket.polymarket_ws import PolymarketWebSocket
+from dr_manhattan.runtime import EventLoopRuntime, get_runtime
+
+
+class IdleConnection:
+    def __init__(self):
+        self.sent = []
+        self._closed = asyncio.Event()
+
+    async def send(self, message):
+        self.sent.append(json.loads(message))
+
+    async def close(self):
+        self._closed.set()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        await self._closed.wait()
+        raise StopAsyncIteration
+
+
+def test_event_loop_runtime_runs_coroutines_from_sync_threads():
+    runtime = EventLoopRuntime(name="test-loop")
+
+    async def loop_thread_name():
+        return threading.current_thread().name
+
+    try:
+        assert runtime.run(loop_thread_name(), timeout=1) == "test-loop"
+        assert runtime.submit(loop_thread_name()).result(timeout=1) == "test-loop"
+        assert runtime.thread.name == "test-loop"
+    finally:
+        runtime.stop()
+
+    assert not runtime.running
+
+
+def test_event_loop_runtime_run_refuses_to_block_its_own_loop():
+    runtime = EventLoopRuntime()
+
+    async def nested():
+        return runtime.run(asyncio.sleep(0))
+
+    try:
+        with pytest.raises(RuntimeError):
+            runtime.run(nested(), timeout=1)
+    finally:
+        runtime.stop()
+
+
+def test_event_loop_runtime_stop_cancels_tasks_and_can_restart():
+    runtime = EventLoopRuntime()
+    started = threading.Event()
+    cancelled = threading.Event()
+
+    async def forever():
+        started.set()
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    runtime.submit(forever())
+    assert started.wait(timeout=1)
+    first_loop = runtime.loop
+    runtime.stop()
+
+    assert cancelled.wait(timeout=1)
+    assert runtime.loop is not first_loop
+    assert runtime.run(asyncio.sleep(0, result="ok"), timeout=1) == "ok"
+    runtime.stop()
+
+
+def test_get_runtime_is_process_wide():
+    assert get_runtime() is get_runtime()
+
+
+def test_websocket_clients_share_one_runtime_thread(monkeypatch):
+    connections = []
+
+    async def fake_connect(*args, **kwargs):
+        connection = IdleConnection()
+        connections.append(connection)
+        return connection
+
+    monkeypatch.setattr(base_websocket.websockets, "connect", fake_connect)
+    runtime = EventLoopRuntime()
+    first, second = PolymarketWebSocket(), PolymarketWebSocket()
+    first.subscriptions["a"] = lambda key, orderbook: None
+
+    try:
+        assert first.start(runtime) is second.start(runtime)
+        assert first.loop is second.loop is runtime.loop
+        runtime.run(asyncio.sleep(0.05), timeout=1)
+        assert len(connections) == 2
+        assert connections[0].sent[0]["assets_ids"] == ["a"]
+
+        first.stop()
+        runtime.run(asyncio.sleep(0.05), timeout=1)
+        assert runtime.running
+    finally:
+        runtime.stop()
@@ -0,0 +1,65 @@
+import pytest
+
+from dr_manhattan.runtime import FeedLatencyTracker, LatencyHistogram
+from dr_manhattan.runtime.latency import exchange_time_ns
+
+
+def test_histogram_summary_bounds_percentiles():
+    histogram = LatencyHistogram()
+    for micros in [10] * 90 + [5_000] * 10:
+        histogram.record(micros * 1000)
+
+    summary = histogram.summary()
+
+    assert summary.count == 100
+    assert summary.max_ms == pytest.approx(5.0)
+    assert summary.mean_ms == pytest.approx((10 * 90 + 5_000 * 10) / 100 / 1000)
+    # Bucket upper bounds: within 2x of the true value, never above max
+    assert 0.010 <= summary.p50_ms <= 0.020
+    assert 5.0 <= summary.p99_ms * 2 and summary.p99_ms <= summary.max_ms
+
+
+def test_histogram_clamps_negative_and_huge_samples():
+    histogram = LatencyHistogram()
+    histogram.record(-5)
+    histogram.record(10**15)
+
+    assert histogram.count == 2
+    assert histogram.buckets[0] == 1
+    assert histogram.buckets[-1] == 1
+
+
+@pytest.mark.parametrize(
+    "timestamp, expected",
+    [
+        ("1700000000000", 1_700_000_000_000_000_000),
+        (1700000000, 1_700_000_000_000_000_000),
+        (1700000000.5, 1_700_000_000_500_000_000),
+        (1_700_000_000_000_000, 1_700_000_000_000_000_000),
+        (None, 0),
+        ("bad", 0),
+        (7, 0),
+    ],
+)
+def test_exchange_time_ns_normalizes_units(timestamp, expected):
+    assert exchange_time_ns(timestamp) == expected
+
+
+def test_tracker_records_per_asset():
+    tracker = FeedLatencyTracker()
+    received_ns = 1_700_000_000_250 * 1_000_000
+
+    tracker.record_update("a", "1700000000000", received_ns, parse_ns=40_000)
+    tracker.record_update("a", None, received_ns, parse_ns=60_000)
+    tracker.record_callback("a", 2_000_000)
+
+    latency = tracker.get("a")
+    assert latency.updates == 2
+    assert latency.exchange_to_receive.count == 1
+    assert latency.exchange_to_receive.max_ms == pytest.approx(250.0)
+    assert latency.parse.mean_ms == pytest.approx(0.05)
+    assert latency.callback.max_ms == pytest.approx(2.0)
+    assert tracker.get("missing").updates == 0
+
+    tracker.reset()
+    assert tracker.snapshot() == {}
@@ -0,0 +1,97 @@
+import time
+
+import pytest
+
+from dr_manhattan.models.market import Market
+from dr_manhattan.runtime.market_cache import MarketMetadata, MarketMetadataCache
+
+
+def _market(market_id="0xabc", **metadata):
+    return Market(
+        id=market_id,
+        question="Test?",
+        outcomes=["Yes", "No"],
+        close_time=None,
+        volume=0.0,
+        liquidity=0.0,
+        prices={"Yes": 0.5, "No": 0.5},
+        metadata={"clobTokenIds": '["t-yes", "t-no"]', "id": "123", **metadata},
+        tick_size=0.001,
+    )
+
+
+def test_put_market_indexes_aliases_and_tokens():
+    cache = MarketMetadataCache()
+    market = _market(slug="will-it")
+
+    cache.put_market(market, aliases=["lookup-key"])
+
+    for identifier in ("0xabc", "123", "will-it", "lookup-key"):
+        assert cache.get(identifier).token_ids == ("t-yes", "t-no")
+    assert cache.market("123") is market
+    assert cache.get("0xabc").token_id("No") == "t-no"
+    assert cache.get("0xabc").tick_size == 0.001
+    metadata, index = cache.by_token("t-no")
+    assert metadata.market_id == "0xabc" and index == 1
+    assert cache.get("missing") is None
+    assert cache.stats.hits == 8 and cache.stats.misses == 1
+
+
+def test_put_token_ids_merges_into_existing_entry():
+    cache = MarketMetadataCache()
+    market = _market(market_id="123", conditionId="0xabc", clobTokenIds=[], slug="will-it")
+    cache.put_market(market)
+
+    merged = cache.put_token_ids("0xabc", ["t-yes", "t-no"])
+
+    assert merged.market_id == "123" and merged.aliases == ("0xabc", "will-it")
+    assert merged.outcomes == ("Yes", "No") and merged.tick_size == 0.001
+    assert cache.market("will-it") is market
+    assert cache.by_token("t-no") == (merged, 1)
+    assert len(cache) == 1
+
+    bare = cache.put_token_ids("0xdef", ["t-1"])
+    assert bare == MarketMetadata("0xdef", token_ids=("t-1",))
+    assert cache.market("0xdef") is None
+
+
+def test_lru_eviction_and_ttl_expiry():
+    cache = MarketMetadataCache(maxsize=2, ttl=0.05)
+    cache.put(MarketMetadata("a", token_ids=("ta",)))
+    cache.put(MarketMetadata("b", token_ids=("tb",)))
+    assert cache.get("a") is not None  # "b" is now least recently used
+    cache.put(MarketMetadata("c"))
+
+    assert cache.get("b") is None and cache.by_token("tb") is None
+    assert cache.stats.evictions == 1
+
+    time.sleep(0.06)
+    assert cache.get("a") is None and cache.by_token("ta") is None
+    assert cache.stats.expirations == 1
+    assert len(cache) == 1
+
+
+def test_persists_metadata_across_instances(tmp_path):
+    path = tmp_path / "markets.sqlite"
+    cache = MarketMetadataCache(path=path)
+    cache.put_market(_market())
+    cache.save()
+
+    restored = MarketMetadataCache(path=path)
+
+    assert restored.get("123").token_ids == ("t-yes", "t-no")
+    assert restored.by_token("t-yes")[0].outcomes == ("Yes", "No")
+    # Full Market objects are not persisted
+    assert restored.market("0xabc") is None
+
+
+def test_corrupt_cache_file_starts_empty(tmp_path):
+    path = tmp_path / "markets.sqlite"
+    path.write_bytes(b"not a database")
+
+    assert len(MarketMetadataCache(path=path)) == 0
+
+
+def test_rejects_empty_cache():
+    with pytest.raises(ValueError):
+        MarketMetadataCache(maxsize=0)
@@ -0,0 +1,87 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from dr_manhattan.runtime import (
+    MARKET_DATA,
+    ORDERS,
+    RateLimiter,
+    TokenBucket,
+    shared_rate_limiter,
+)
+
+
+def test_bucket_allows_burst_then_spaces_reservations():
+    bucket = TokenBucket(rate=10, burst=3)
+
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    delays = [bucket.reserve() for _ in range(3)]
+
+    # Each reservation queues behind the previous one: ~0.1s, 0.2s, 0.3s
+    assert delays == pytest.approx([0.1, 0.2, 0.3], abs=0.02)
+    stats = bucket.stats
+    assert stats.acquired == 6 and stats.delayed == 3
+    assert stats.tokens < 0
+
+
+def test_try_acquire_never_waits_or_goes_into_debt():
+    bucket = TokenBucket(rate=1, burst=2)
+
+    assert bucket.try_acquire() and bucket.try_acquire()
+    assert not bucket.try_acquire()
+    assert bucket.stats.rejected == 1
+    assert bucket.stats.tokens >= 0
+
+
+def test_acquire_is_thread_safe():
+    bucket = TokenBucket(rate=200, burst=10)
+    threads = [
+        threading.Thread(target=lambda: [bucket.acquire() for _ in range(10)]) for _ in range(4)
+    ]
+    started = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # 40 tokens with 10 up front need at least 30 / 200 = 0.15s
+    assert time.monotonic() - started >= 0.14
+    assert bucket.stats.acquired == 40
+
+
+def test_endpoint_classes_have_independent_budgets():
+    limiter = RateLimiter({MARKET_DATA: (1, 1), ORDERS: (1, 1)})
+
+    assert limiter.try_acquire(MARKET_DATA)
+    assert not limiter.try_acquire(MARKET_DATA)
+    # A drained market-data budget does not hold up orders
+    assert limiter.reserve(ORDERS) == 0.0
+    with pytest.raises(ValueError):
+        limiter.reserve("unknown")
+
+
+@pytest.mark.asyncio
+async def test_acquire_async_waits_without_blocking_the_loop():
+    bucket = TokenBucket(rate=20, burst=1)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.005)
+
+    task = asyncio.create_task(ticker())
+    delays = await asyncio.gather(*(bucket.acquire_async() for _ in range(3)))
+    task.cancel()
+
+    assert sorted(delays) == pytest.approx([0.0, 0.05, 0.1], abs=0.02)
+    assert ticks > 5
+
+
+def test_shared_rate_limiter_is_reused_per_key_while_alive():
+    first = shared_rate_limiter(("test", "key"), {MARKET_DATA: 5})
+    assert shared_rate_limiter(("test", "key"), {MARKET_DATA: 50}) is first
+    assert shared_rate_limiter(("test", "other"), {MARKET_DATA: 5}) is not first
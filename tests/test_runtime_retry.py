@@ -0,0 +1,58 @@
+import time
+from email.utils import formatdate
+
+import pytest
+
+from dr_manhattan.base.errors import NetworkError, RateLimitError
+from dr_manhattan.runtime.retry import (
+    CircuitBreaker,
+    CircuitState,
+    RetryPolicy,
+    parse_retry_after,
+)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [("7", 7.0), ("1.5", 1.5), (3, 3.0), ("-2", 0.0), (None, None), ("soon", None)],
+)
+def test_parse_retry_after_seconds(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date():
+    assert parse_retry_after(formatdate(time.time() + 20, usegmt=True)) == pytest.approx(20, abs=2)
+
+
+def test_retry_policy_prefers_server_delay_and_gives_up_past_max():
+    policy = RetryPolicy(max_retries=3, base_delay=1.0, backoff=2.0, max_delay=10.0, jitter=0.0)
+
+    assert [policy.delay(attempt, NetworkError()) for attempt in range(4)] == [1, 2, 4, None]
+    assert policy.delay(0, RateLimitError("slow down", retry_after=7.0)) == 7.0
+    # Parking a thread for longer than max_delay is worse than failing
+    assert policy.delay(0, RateLimitError("slow down", retry_after=60.0)) is None
+    assert RetryPolicy(base_delay=10, backoff=10, max_delay=5, jitter=0).delay(2) == 5
+
+
+def test_circuit_breaker_opens_then_admits_a_single_probe():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state is CircuitState.OPEN
+    assert not breaker.allow()
+    assert 0 < breaker.retry_in() <= 0.05
+
+    time.sleep(0.06)
+    assert breaker.allow()  # probe
+    assert not breaker.allow()  # concurrent callers still fail fast
+    breaker.record_failure()
+    assert breaker.state is CircuitState.OPEN
+
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state is CircuitState.CLOSED and breaker.allow()
+    stats = breaker.stats
+    assert stats.trips == 2 and stats.rejected == 2 and stats.consecutive_failures == 0
@@ -0,0 +1,97 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from dr_manhattan.runtime.single_flight import SingleFlight, shared_single_flight
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    calls = []
+    release = threading.Event()
+
+    def fetch(key):
+        calls.append(key)
+        release.wait(1.0)
+        return {"key": key}
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(flight.do("book", fetch, "book")))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    while flight.stats.calls < 8:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ["book"]
+    assert len(results) == 8 and all(result is results[0] for result in results)
+    assert flight.stats.executions == 1 and flight.stats.shared == 7
+    assert flight.stats.in_flight == 0
+
+
+def test_errors_reach_every_waiter_and_are_not_cached():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    errors = []
+
+    def failing():
+        started.set()
+        release.wait(1.0)
+        raise ValueError("boom")
+
+    def call():
+        try:
+            flight.do("k", failing)
+        except ValueError as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait(1.0)
+    follower = threading.Thread(target=call)
+    follower.start()
+    while flight.stats.calls < 2:
+        time.sleep(0.001)
+    release.set()
+    leader.join()
+    follower.join()
+
+    assert len(errors) == 2
+    # The failure is not remembered: the next call runs again
+    assert flight.do("k", lambda: "ok") == "ok"
+
+
+@pytest.mark.asyncio
+async def test_do_async_survives_a_cancelled_caller():
+    flight = SingleFlight()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return "book"
+
+    first = asyncio.create_task(flight.do_async("book", fetch))
+    second = asyncio.create_task(flight.do_async("book", fetch))
+    await asyncio.sleep(0.01)
+    first.cancel()
+
+    assert await second == "book"
+    assert calls == 1
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+def test_shared_single_flight_is_reused_per_key():
+    flight = shared_single_flight(("test", "account"))
+    assert shared_single_flight(("test", "account")) is flight
+    assert shared_single_flight(("test", "other")) is not flight
@@ -0,0 +1,392 @@
+import asyncio
+import json
+import threading
+
+import pytest
+
+from dr_manhattan.base import websocket as base_websocket
+from dr_manhattan.base.websocket import top_of_book_callback
+from dr_manhattan.exchanges.polymarket.polymarket_ws import PolymarketWebSocket
+from dr_manhattan.models.orderbook import TopOfBook
+from dr_manhattan.utils import json_codec
+
+
+def book(bids, asks, asset_id="asset-1"):
+    return {"asset_id": asset_id, "market_id": "m1", "bids": bids, "asks": asks, "timestamp": 1}
+
+
+def test_top_of_book_callback_skips_deep_level_changes():
+    events = []
+    callback = top_of_book_callback(lambda market_id, event: events.append(event))
+
+    callback("asset-1", book([(0.40, 10.0), (0.39, 5.0)], [(0.42, 3.0)]))
+    callback("asset-1", book([(0.40, 10.0), (0.38, 9.0)], [(0.42, 3.0)]))
+    callback("asset-1", book([(0.41, 1.0)], [(0.42, 3.0)]))
+
+    assert len(events) == 2
+    assert isinstance(events[0], TopOfBook)
+    assert events[0].best_bid == 0.40
+    assert events[1].best_bid == 0.41
+    assert events[1].mid_price == pytest.approx(0.415)
+
+
+def test_top_of_book_callback_tracks_assets_and_depth_independently():
+    events = []
+    callback = top_of_book_callback(
+        lambda market_id, event: events.append(event), depth=2, include_sizes=True
+    )
+
+    callback("asset-1", book([(0.40, 10.0), (0.39, 5.0)], [(0.42, 3.0)]))
+    callback("asset-2", book([(0.40, 10.0), (0.39, 5.0)], [(0.42, 3.0)], asset_id="asset-2"))
+    callback("asset-1", book([(0.40, 10.0), (0.39, 6.0)], [(0.42, 3.0)]))
+
+    assert [event.asset_id for event in events] == ["asset-1", "asset-2", "asset-1"]
+    assert events[2].bids == ((0.40, 10.0), (0.39, 6.0))
+
+
+def test_top_of_book_callback_ignores_top_size_changes_by_default():
+    events = []
+    callback = top_of_book_callback(lambda market_id, event: events.append(event))
+
+    callback("asset-1", book([(0.40, 10.0)], [(0.42, 3.0)]))
+    callback("asset-1", book([(0.40, 11.0)], [(0.42, 2.0)]))
+
+    assert len(events) == 1
+
+
+@pytest.mark.asyncio
+async def test_top_of_book_callback_supports_coroutines():
+    events = []
+
+    async def on_event(market_id, event):
+        events.append(event)
+
+    callback = top_of_book_callback(on_event)
+    await callback("asset-1", book([(0.40, 10.0)], [(0.42, 3.0)]))
+    await callback("asset-1", book([(0.40, 10.0)], [(0.42, 3.0)]))
+
+    assert len(events) == 1
+
+
+class FakeExchange:
+    def __init__(self):
+        self.mid_updates = []
+
+    def update_mid_price_from_orderbook(self, token_id, orderbook):
+        self.mid_updates.append(token_id)
+
+
+@pytest.mark.asyncio
+async def test_polymarket_watch_by_market_top_of_book_mode():
+    exchange = FakeExchange()
+    ws = PolymarketWebSocket(exchange=exchange)
+    events = []
+
+    async def store_subscriptions(asset_callbacks):
+        ws.subscriptions.update(asset_callbacks)
+
+    ws.watch_orderbooks_by_assets = store_subscriptions
+    await ws.watch_orderbook_by_market(
+        "m1", ["asset-1"], callback=lambda _, event: events.append(event), top_of_book_depth=1
+    )
+    cb = ws.subscriptions["asset-1"]
+
+    cb("asset-1", book([(0.40, 10.0), (0.39, 1.0)], [(0.42, 3.0)]))
+    cb("asset-1", book([(0.40, 10.0), (0.38, 1.0)], [(0.42, 3.0)]))
+    cb("asset-1", book([(0.40, 12.0), (0.38, 1.0)], [(0.42, 3.0)]))
+
+    assert len(events) == 1
+    assert exchange.mid_updates == ["asset-1"]
+    assert ws.orderbook_manager.get("asset-1")["bids"][1] == (0.38, 1.0)
+
+
+class SnapshotExchange:
+    def __init__(self, snapshot):
+        self.snapshot = snapshot
+        self.requested = []
+
+    def get_orderbook(self, token_id):
+        self.requested.append(token_id)
+        return self.snapshot
+
+
+def price_change(asset_id, side, price, size, best_bid, best_ask):
+    return {
+        "event_type": "price_change",
+        "market": "m1",
+        "timestamp": 2,
+        "price_changes": [
+            {
+                "asset_id": asset_id,
+                "side": side,
+                "price": price,
+                "size": size,
+                "best_bid": best_bid,
+                "best_ask": best_ask,
+            }
+        ],
+    }
+
+
+async def drain_tasks(ws):
+    while ws.tasks:
+        await ws.tasks[0]
+
+
+@pytest.mark.asyncio
+async def test_polymarket_validation_resyncs_on_top_of_book_mismatch():
+    exchange = SnapshotExchange(
+        {"bids": [{"price": "0.45", "size": "7"}], "asks": [{"price": "0.47", "size": "2"}]}
+    )
+    ws = PolymarketWebSocket(config={"validate_books": True}, exchange=exchange)
+    received = []
+    ws.subscriptions["asset-1"] = lambda key, orderbook: received.append(orderbook)
+    ws._parse_book_message(
+        {
+            "asset_id": "asset-1",
+            "market": "m1",
+            "bids": [{"price": "0.40", "size": "10"}],
+            "asks": [{"price": "0.42", "size": "12"}],
+        }
+    )
+
+    # Consistent delta: no resync
+    ws._parse_orderbook_message(price_change("asset-1", "BUY", "0.41", "1", "0.41", "0.42"))
+    assert ws.tasks == []
+
+    # Server says best bid is 0.45 but we only know 0.41: a delta was dropped
+    ws._parse_orderbook_message(price_change("asset-1", "BUY", "0.39", "1", "0.45", "0.47"))
+    await drain_tasks(ws)
+
+    assert exchange.requested == ["asset-1"]
+    assert list(received[-1]["bids"]) == [(0.45, 7.0)]
+    assert ws.resync_stats.mismatches == 1
+    assert ws.resync_stats.resyncs == 1
+    assert ws.resyncs_by_asset == {"asset-1": 1}
+
+
+@pytest.mark.asyncio
+async def test_polymarket_validation_resyncs_gap_once_per_cooldown():
+    exchange = SnapshotExchange({"bids": [], "asks": []})
+    ws = PolymarketWebSocket(config={"validate_books": True}, exchange=exchange)
+
+    ws._parse_orderbook_message(price_change("asset-1", "SELL", "0.6", "1", "0.5", "0.6"))
+    await drain_tasks(ws)
+    ws._parse_orderbook_message(price_change("asset-1", "SELL", "0.6", "2", "0.5", "0.6"))
+    await drain_tasks(ws)
+
+    assert exchange.requested == ["asset-1"]
+    assert ws.resync_stats.gaps == 1
+    assert ws.resync_stats.failures == 1
+
+
+def test_polymarket_validation_is_off_by_default():
+    ws = PolymarketWebSocket()
+    ws._parse_orderbook_message(price_change("asset-1", "SELL", "0.6", "1", "0.9", "0.1"))
+
+    assert ws.resync_stats.mismatches == 0
+    assert ws.resync_stats.gaps == 0
+
+
+def test_json_codec_round_trips_compactly_and_raises_stdlib_error():
+    payload = {"asset_id": "a", "bids": [[0.52, 100.0]], "hash": None}
+
+    encoded = json_codec.dumps(payload)
+
+    assert " " not in encoded
+    assert json_codec.loads(encoded) == payload
+    assert json_codec.loads(encoded.encode()) == payload
+    with pytest.raises(json.JSONDecodeError):
+        json_codec.loads("PONG")
+
+
+def test_typed_decoder_matches_schema_and_falls_back_on_mismatch():
+    decode = PolymarketWebSocket.decode_message
+    frame = {
+        "event_type": "book",
+        "asset_id": "a",
+        "timestamp": "1757908892351",
+        "bids": [{"price": "0.40", "size": "10"}],
+        "asks": [],
+    }
+
+    assert decode(json.dumps([frame])) == [frame]
+    # Off-schema frames (numeric price) are still decoded, just untyped
+    odd = {"event_type": "book", "bids": [{"price": 0.4, "size": 1}]}
+    assert decode(json.dumps(odd).encode()) == odd
+    with pytest.raises(json.JSONDecodeError):
+        decode("PONG")
+    if json_codec._msgspec is None:
+        assert decode is json_codec.loads
+
+
+@pytest.mark.asyncio
+async def test_polymarket_handle_message_decodes_book_batches():
+    ws = PolymarketWebSocket()
+    received = []
+    ws.subscriptions["asset-1"] = lambda key, orderbook: received.append(orderbook)
+
+    await ws._handle_message(
+        json.dumps(
+            [
+                {
+                    "event_type": "book",
+                    "asset_id": "asset-1",
+                    "market": "m1",
+                    "bids": [{"price": "0.40", "size": "10"}],
+                    "asks": [{"price": "0.42", "size": "12"}],
+                }
+            ]
+        )
+    )
+
+    assert list(received[0]["bids"]) == [(0.40, 10.0)]
+    assert list(received[0]["asks"]) == [(0.42, 12.0)]
+
+
+@pytest.mark.asyncio
+async def test_polymarket_dispatch_queue_keeps_receive_loop_free():
+    release = asyncio.Event()
+    received = []
+
+    async def slow_callback(asset_id, orderbook):
+        await release.wait()
+        received.append(orderbook["bids"][0][0])
+
+    ws = PolymarketWebSocket(config={"dispatch_queue": True})
+    ws.subscriptions["asset-1"] = slow_callback
+    snapshot = {
+        "event_type": "book",
+        "asset_id": "asset-1",
+        "market": "m1",
+        "bids": [{"price": "0.40", "size": "10"}],
+        "asks": [{"price": "0.42", "size": "12"}],
+    }
+
+    await ws._process_message_item(snapshot)
+    await asyncio.sleep(0)
+    for price in ("0.41", "0.415", "0.418"):
+        await ws._process_message_item(price_change("asset-1", "BUY", price, "1", price, "0.42"))
+
+    assert received == []
+    release.set()
+    await ws.dispatcher.join()
+
+    assert received == [0.40, 0.418]
+    assert ws.dispatch_stats.coalesced == 2
+    await ws.disconnect()
+
+
+class NullConnection:
+    async def send(self, message):
+        pass
+
+    async def close(self):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_dispatch_queue_delivers_again_after_reconnect(monkeypatch):
+    async def fake_connect(*args, **kwargs):
+        return NullConnection()
+
+    monkeypatch.setattr(base_websocket.websockets, "connect", fake_connect)
+    received = []
+    ws = PolymarketWebSocket(config={"dispatch_queue": True})
+    ws.subscriptions["asset-1"] = lambda asset_id, orderbook: received.append(asset_id)
+    snapshot = {
+        "event_type": "book",
+        "asset_id": "asset-1",
+        "bids": [{"price": "0.40", "size": "10"}],
+        "asks": [],
+    }
+
+    await ws.connect()
+    await ws.disconnect()
+    assert ws.dispatcher.closed
+
+    await ws.connect()
+    await ws._process_message_item(snapshot)
+    await ws.dispatcher.join()
+
+    assert received == ["asset-1"]
+    await ws.disconnect()
+
+
+class SlowSnapshotExchange(SnapshotExchange):
+    def __init__(self, snapshot):
+        super().__init__(snapshot)
+        self.release = threading.Event()
+
+    def get_orderbook(self, token_id):
+        self.release.wait(timeout=5)
+        return super().get_orderbook(token_id)
+
+
+def timed_change(timestamp, price, size):
+    message = price_change("asset-1", "BUY", price, size, "", "")
+    message["timestamp"] = timestamp
+    return message
+
+
+@pytest.mark.asyncio
+async def test_polymarket_resync_replays_deltas_newer_than_snapshot():
+    exchange = SlowSnapshotExchange(
+        {"timestamp": "20", "bids": [{"price": "0.45", "size": "7"}], "asks": []}
+    )
+    ws = PolymarketWebSocket(config={"validate_books": True}, exchange=exchange)
+
+    ws._parse_orderbook_message(timed_change("10", "0.40", "1"))  # gap: resync scheduled
+    await asyncio.sleep(0)
+    ws._parse_orderbook_message(timed_change("15", "0.41", "2"))  # covered by the snapshot
+    ws._parse_orderbook_message(timed_change("25", "0.44", "3"))  # newer than the snapshot
+    exchange.release.set()
+    await drain_tasks(ws)
+
+    book = ws._book_state["asset-1"]
+    assert book.bids.snapshot() == ((0.45, 7.0), (0.44, 3.0))
+    assert book.timestamp == "25"
+    assert ws.resync_stats.resyncs == 1
+
+
+@pytest.mark.asyncio
+async def test_polymarket_resync_discards_snapshot_older_than_book():
+    exchange = SnapshotExchange(
+        {"timestamp": "5", "bids": [{"price": "0.30", "size": "1"}], "asks": []}
+    )
+    ws = PolymarketWebSocket(config={"validate_books": True}, exchange=exchange)
+    ws._parse_book_message(
+        {
+            "asset_id": "asset-1",
+            "market": "m1",
+            "timestamp": "10",
+            "bids": [{"price": "0.40", "size": "10"}],
+            "asks": [],
+        }
+    )
+
+    ws._schedule_resync("asset-1")
+    await drain_tasks(ws)
+
+    assert ws._book_state["asset-1"].bids.best == (0.40, 10.0)
+    assert ws.resync_stats.resyncs == 0
+    assert ws.resync_stats.failures == 1
+
+
+@pytest.mark.asyncio
+async def test_polymarket_records_feed_latency_per_asset():
+    ws = PolymarketWebSocket()
+    ws.subscriptions["asset-1"] = lambda key, orderbook: None
+    message = price_change("asset-1", "BUY", "0.41", "1", "0.41", "")
+    message["timestamp"] = "1700000000000"
+
+    await ws._handle_message(json.dumps(message))
+
+    latency = ws.latency_stats["asset-1"]
+    assert latency.updates == 1
+    assert latency.exchange_to_receive.count == 1
+    assert latency.parse.count == 1
+    assert latency.callback.count == 1
+
+    quiet = PolymarketWebSocket(config={"latency_stats": False})
+    assert quiet.latency_stats == {}